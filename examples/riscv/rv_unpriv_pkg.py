@@ -310,12 +310,12 @@ class JType:
     imm20: Imm20
 
 
-@RvUnprivPkg.union()
+@RvUnprivPkg.union(tag="opcode")
 class Encoding:
     c: PaddedCType
-    r: RType
-    i: IType
-    s: SType
-    b: BType
-    u: UType
-    j: JType
+    r: RType = Opcode.ALU_R
+    i: IType = (Opcode.LOAD, Opcode.ALU_I, Opcode.JALR, Opcode.FENCE, Opcode.ECALL)
+    s: SType = Opcode.STORE
+    b: BType = Opcode.BRANCH
+    u: UType = (Opcode.LUI, Opcode.AUIPC)
+    j: JType = Opcode.JAL
@@ -8,9 +8,9 @@ from .types.constant import Constant
 from .types.enum import EnumMode
 from .types.package import Package
 from .types.scalar import Scalar
-from .types.wrap import get_wrapper
+from .types.wrap import Deferral, deferred, get_wrapper
 
 package = get_wrapper(Package)
 
 # Guards
-assert all((Alias, Constant, EnumMode, Package, Packing, Scalar, package))
+assert all((Alias, Constant, Deferral, EnumMode, Package, Packing, Scalar, deferred, package))
@@ -2,9 +2,29 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import operator as ops
 from collections.abc import Callable
 from typing import Any, Self
 
+# NOTE: Operators are module-level functions (rather than lambdas) so that
+#       parsed expressions can be pickled, e.g. when caching a parsed grammar
+
+
+def _negate(lhs: Any, _: Any) -> Any:
+    return -1 * lhs
+
+
+def _identity(lhs: Any, _: Any) -> Any:
+    return lhs
+
+
+def _absolute(lhs: Any, _: Any) -> Any:
+    return abs(lhs)
+
+
+def _invert(lhs: Any, _: Any) -> Any:
+    return ~lhs
+
 
 class Expression:
     """Encapsulates an expression that can be evaluated at a later time"""
@@ -190,148 +210,148 @@ class Expression:
                 raise ValueError(f"Operator '{operator}' is not supported by operate")
 
     def __add__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x + y, rhs=other)
+        return self._wrap(ops.add, rhs=other)
 
     def __sub__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x - y, rhs=other)
+        return self._wrap(ops.sub, rhs=other)
 
     def __mul__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x * y, rhs=other)
+        return self._wrap(ops.mul, rhs=other)
 
     def __truediv__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x / y, rhs=other)
+        return self._wrap(ops.truediv, rhs=other)
 
     def __floordiv__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x // y, rhs=other)
+        return self._wrap(ops.floordiv, rhs=other)
 
     def __mod__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x % y, rhs=other)
+        return self._wrap(ops.mod, rhs=other)
 
     def __divmod__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: (x // y, x % y), rhs=other)
+        return self._wrap(divmod, rhs=other)
 
     def __pow__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x**y, rhs=other)
+        return self._wrap(ops.pow, rhs=other)
 
     def __lshift__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x << y, rhs=other)
+        return self._wrap(ops.lshift, rhs=other)
 
     def __rshift__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x >> y, rhs=other)
+        return self._wrap(ops.rshift, rhs=other)
 
     def __and__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x & y, rhs=other)
+        return self._wrap(ops.and_, rhs=other)
 
     def __xor__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x ^ y, rhs=other)
+        return self._wrap(ops.xor, rhs=other)
 
     def __or__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x | y, rhs=other)
+        return self._wrap(ops.or_, rhs=other)
 
     def __radd__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x + y, lhs=other, rhs=self)
+        return self._wrap(ops.add, lhs=other, rhs=self)
 
     def __rsub__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x - y, lhs=other, rhs=self)
+        return self._wrap(ops.sub, lhs=other, rhs=self)
 
     def __rmul__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x * y, lhs=other, rhs=self)
+        return self._wrap(ops.mul, lhs=other, rhs=self)
 
     def __rtruediv__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x / y, lhs=other, rhs=self)
+        return self._wrap(ops.truediv, lhs=other, rhs=self)
 
     def __rfloordiv__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x // y, lhs=other, rhs=self)
+        return self._wrap(ops.floordiv, lhs=other, rhs=self)
 
     def __rmod__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x % y, lhs=other, rhs=self)
+        return self._wrap(ops.mod, lhs=other, rhs=self)
 
     def __rdivmod__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: (x // y, x % y), lhs=other, rhs=self)
+        return self._wrap(divmod, lhs=other, rhs=self)
 
     def __rpow__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x**y, lhs=other, rhs=self)
+        return self._wrap(ops.pow, lhs=other, rhs=self)
 
     def __rlshift__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x << y, lhs=other, rhs=self)
+        return self._wrap(ops.lshift, lhs=other, rhs=self)
 
     def __rrshift__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x >> y, lhs=other, rhs=self)
+        return self._wrap(ops.rshift, lhs=other, rhs=self)
 
     def __rand__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x & y, lhs=other, rhs=self)
+        return self._wrap(ops.and_, lhs=other, rhs=self)
 
     def __rxor__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x ^ y, lhs=other, rhs=self)
+        return self._wrap(ops.xor, lhs=other, rhs=self)
 
     def __ror__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x | y, lhs=other, rhs=self)
+        return self._wrap(ops.or_, lhs=other, rhs=self)
 
     def __iadd__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x + y, rhs=other)
+        return self._wrap(ops.add, rhs=other)
 
     def __isub__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x - y, rhs=other)
+        return self._wrap(ops.sub, rhs=other)
 
     def __imul__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x * y, rhs=other)
+        return self._wrap(ops.mul, rhs=other)
 
     def __itruediv__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x / y, rhs=other)
+        return self._wrap(ops.truediv, rhs=other)
 
     def __ifloordiv__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x // y, rhs=other)
+        return self._wrap(ops.floordiv, rhs=other)
 
     def __imod__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x % y, rhs=other)
+        return self._wrap(ops.mod, rhs=other)
 
     def __ipow__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x**y, rhs=other)
+        return self._wrap(ops.pow, rhs=other)
 
     def __ilshift__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x << y, rhs=other)
+        return self._wrap(ops.lshift, rhs=other)
 
     def __irshift__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x >> y, rhs=other)
+        return self._wrap(ops.rshift, rhs=other)
 
     def __iand__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x & y, rhs=other)
+        return self._wrap(ops.and_, rhs=other)
 
     def __ixor__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x ^ y, rhs=other)
+        return self._wrap(ops.xor, rhs=other)
 
     def __ior__(self, other: int | Self) -> int:
-        return self._wrap(lambda x, y: x | y, rhs=other)
+        return self._wrap(ops.or_, rhs=other)
 
     def __neg__(self) -> int:
-        return self._wrap(lambda x, _: -1 * x)
+        return self._wrap(_negate)
 
     def __pos__(self) -> int:
-        return self._wrap(lambda x, _: x)
+        return self._wrap(_identity)
 
     def __abs__(self) -> int:
-        return self._wrap(lambda x, _: abs(x))
+        return self._wrap(_absolute)
 
     def __invert__(self) -> int:
-        return self._wrap(lambda x, _: ~x)
+        return self._wrap(_invert)
 
     def __lt__(self, other: int | Self) -> bool:
-        return self._wrap(lambda x, y: x < y, rhs=other)
+        return self._wrap(ops.lt, rhs=other)
 
     def __le__(self, other: int | Self) -> bool:
-        return self._wrap(lambda x, y: x <= y, rhs=other)
+        return self._wrap(ops.le, rhs=other)
 
     def __eq__(self, other: int | Self) -> bool:
-        return self._wrap(lambda x, y: x == y, rhs=other)
+        return self._wrap(ops.eq, rhs=other)
 
     def __ne__(self, other: int | Self) -> bool:
-        return self._wrap(lambda x, y: x != y, rhs=other)
+        return self._wrap(ops.ne, rhs=other)
 
     def __gt__(self, other: int | Self) -> bool:
-        return self._wrap(lambda x, y: x > y, rhs=other)
+        return self._wrap(ops.gt, rhs=other)
 
     def __ge__(self, other: int | Self) -> bool:
-        return self._wrap(lambda x, y: x >= y, rhs=other)
+        return self._wrap(ops.ge, rhs=other)
 
 
 class ExpressionFunction:
@@ -0,0 +1,32 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from types import ModuleType
+from typing import Any
+
+
+def import_numpy() -> ModuleType:
+    """
+    Import NumPy on demand, as it is an optional dependency that is only needed
+    by the bulk conversion routines (and is slow to import).
+
+    :return: The NumPy module
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for this operation, install it with 'pip install packtype[numpy]'"
+        ) from e
+    return numpy
+
+
+def is_numpy_array(value: Any) -> bool:
+    """
+    Check if a value is a NumPy array without importing NumPy.
+
+    :param value: The value to check
+    :return: True if the value is a NumPy array, False otherwise
+    """
+    return type(value).__module__ == "numpy" and hasattr(value, "dtype")
@@ -2,12 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from .cache import ParseCache
 from .grammar import ParseError, RedefinitionError, UnknownEntityError, parse, parse_string
+from .parallel import CircularImportError, parse_many
 
 __all__ = [
+    "CircularImportError",
+    "ParseCache",
     "ParseError",
     "RedefinitionError",
     "UnknownEntityError",
     "parse",
+    "parse_many",
     "parse_string",
 ]
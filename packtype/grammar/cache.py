@@ -0,0 +1,154 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import functools
+import hashlib
+import os
+import pickle
+import stat
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from ..common.logging import get_log
+
+
+@functools.cache
+def get_signature() -> bytes:
+    """
+    Produce a signature of the installed Packtype version and the modules that
+    construct the declaration tree, so that a cached tree is never reused after
+    any of them change.
+
+    :return: Signature as bytes
+    """
+    try:
+        version = metadata.version("packtype")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    digest = hashlib.sha256(version.encode("utf-8"))
+    root = Path(__file__).absolute().parent
+    for path in (
+        root / "packtype.lark",
+        root / "transformer.py",
+        root / "declarations.py",
+        root.parent / "common" / "expression.py",
+    ):
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def _is_trusted(status: os.stat_result) -> bool:
+    """
+    Check that a cache entry is owned by the current user and is not writable by
+    anyone else. Platforms without user IDs (i.e. Windows) trust every entry.
+
+    :param status: Status of the cache entry
+    :return: True if the entry can be trusted, False otherwise
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return status.st_uid == os.getuid() and not (status.st_mode & (stat.S_IWGRP | stat.S_IWOTH))
+
+
+class ParseCache:
+    """
+    Cache of declaration trees produced by parsing Packtype grammar, stored on
+    disk and keyed by the content of each definition (along with the Packtype
+    version) so that unchanged definitions skip parsing entirely. The cache is
+    disabled unless a directory is configured, or the PACKTYPE_CACHE_DIR
+    environment variable is set.
+
+    As entries are pickled, loading an entry can execute arbitrary code, so the
+    cache directory must only be writable by the current user. The directory is
+    created with permissions to match, and entries that are owned by another
+    user or that are writable by anyone else are ignored.
+    """
+
+    DIRECTORY: Path | None = (
+        Path(env_dir) if (env_dir := os.environ.get("PACKTYPE_CACHE_DIR", None)) else None
+    )
+
+    @classmethod
+    def configure(cls, directory: Path | None = None) -> None:
+        """
+        Configure where parsed definitions are cached.
+
+        :param directory: Directory to hold the cache, or None to disable it
+        """
+        cls.DIRECTORY = None if directory is None else Path(directory)
+
+    @classmethod
+    def key(cls, definition: str) -> str:
+        """
+        Calculate the key a definition is cached under.
+
+        :param definition: The Packtype definition as a string
+        :return: Hexadecimal key
+        """
+        digest = hashlib.sha256(get_signature())
+        digest.update(definition.encode("utf-8"))
+        return digest.hexdigest()
+
+    @classmethod
+    def load(cls, definition: str) -> Any | None:
+        """
+        Retrieve the declaration tree for a definition from the cache.
+
+        :param definition: The Packtype definition as a string
+        :return: The declaration tree, or None if it is not cached
+        """
+        if cls.DIRECTORY is None:
+            return None
+        path = cls.DIRECTORY / f"{cls.key(definition)}.pkl"
+        try:
+            with path.open("rb") as fh:
+                # NOTE: The opened file is checked, so it cannot be swapped out
+                if not _is_trusted(os.fstat(fh.fileno())):
+                    get_log().warning(
+                        f"Ignoring parse cache entry {path} as it is owned or writable "
+                        f"by another user"
+                    )
+                    return None
+                return pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            # A corrupt entry is treated as a miss, and is replaced when stored
+            get_log().debug(f"Ignoring unreadable parse cache entry {path}: {exc}")
+            return None
+
+    @classmethod
+    def store(cls, definition: str, tree: Any) -> None:
+        """
+        Store the declaration tree for a definition in the cache, failing to
+        write to the cache is not fatal as the tree can always be recreated.
+
+        :param definition: The Packtype definition as a string
+        :param tree:       The declaration tree produced by parsing
+        """
+        if cls.DIRECTORY is None:
+            return
+        path = cls.DIRECTORY / f"{cls.key(definition)}.pkl"
+        tmp_path = None
+        try:
+            cls.DIRECTORY.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # Write to a temporary file and then move it into place so that
+            # concurrent invocations never observe a partially written entry
+            with tempfile.NamedTemporaryFile(dir=cls.DIRECTORY, delete=False) as fh:
+                tmp_path = Path(fh.name)
+                pickle.dump(tree, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except (OSError, pickle.PicklingError) as exc:
+            get_log().debug(f"Failed to write parse cache entry {path}: {exc}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Remove every entry from the cache"""
+        if cls.DIRECTORY is not None and cls.DIRECTORY.exists():
+            for path in cls.DIRECTORY.glob("*.pkl"):
+                path.unlink(missing_ok=True)
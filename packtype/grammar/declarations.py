@@ -16,7 +16,7 @@ from ..types.constant import Constant
 from ..types.enum import Enum, EnumMode
 from ..types.scalar import Scalar
 from ..types.struct import Struct
-from ..types.union import Union
+from ..types.union import Union, UnionError, locate_tag
 from ..types.wrap import build_from_fields
 
 
@@ -227,7 +227,6 @@ class DeclScalar:
                 entity = Scalar[dim, (self.signedness is Signed)]
             else:
                 entity = entity[dim]
-        entity.__doc__ = str(self.description) if self.description else None
         return entity
 
 
@@ -300,6 +299,7 @@ class DeclField:
     ref: str
     dimensions: DeclDimensions | None = None
     description: Description | None = None
+    tags: list[Expression] | None = None
 
 
 @dataclass()
@@ -377,6 +377,9 @@ class DeclUnion:
             int | type[Base],
         ],
     ) -> type[Union]:
+        modifiers = self.get_modifiers()
+        if (tag := modifiers.get("tag", None)) is not None:
+            tag = modifiers["tag"] = str(tag).strip('"')
         # Process entries
         fields = {}
         for fdecl in self.fields:
@@ -387,18 +390,41 @@ class DeclUnion:
                 if fdecl.dimensions:
                     for dim in fdecl.dimensions.resolve(cb_resolve):
                         ftype = ftype[dim]
-                fields[fdecl.name] = (ftype, None)
+                fields[fdecl.name] = (ftype, self._resolve_tags(fdecl, ftype, tag, cb_resolve))
             else:
                 raise ValueError(f"Unexpected struct field name: {fdecl}")
         return build_from_fields(
             Union,
             self.name,
             fields=fields,
-            kwds=self.get_modifiers(),
+            kwds=modifiers,
             doc_str=str(self.description) if self.description else None,
             source=(source_file.as_posix() if source_file else "N/A", self.position.line),
         )
 
+    def _resolve_tags(
+        self,
+        fdecl: DeclField,
+        ftype: type[Base],
+        tag: str | None,
+        cb_resolve: Callable[[str], int | type[Base]],
+    ) -> tuple[int, ...] | None:
+        if not fdecl.tags:
+            return None
+        if tag is None:
+            raise UnionError(
+                f"Union member {fdecl.name} of {self.name} lists tag values but the "
+                f"union does not declare a tag"
+            )
+        # Names are resolved against the values of an enumerated tag first
+        _, _, tag_type = locate_tag(ftype, tag)
+        values = tag_type._pt_as_dict() if issubclass(tag_type, Enum) else {}
+
+        def _resolve(ref: str) -> int:
+            return values[ref] if ref in values else cb_resolve(ref)
+
+        return tuple(int(x.evaluate(_resolve)) for x in fdecl.tags)
+
 
 @dataclass()
 class DeclPackage:
@@ -15,6 +15,7 @@ from ..types.base import Base
 from ..types.constant import Constant
 from ..types.package import Package
 from ..types.wrap import build_from_fields
+from .cache import ParseCache
 from .declarations import (
     DeclAlias,
     DeclConstant,
@@ -33,11 +34,17 @@ from .transformer import PacktypeTransformer
 
 @functools.cache
 def create_parser():
+    # NOTE: The LALR tables are cached by Lark (keyed by a hash of the grammar,
+    #       the options, and the Lark version) so that they are only built the
+    #       first time any process uses the grammar. The transformer cannot be
+    #       embedded into the parser as Lark does not provide positions (meta)
+    #       to embedded transformers, which declarations rely upon.
     parser = Lark.open(
         Path(__file__).parent / "packtype.lark",
         start="root",
         parser="lalr",
         propagate_positions=True,
+        cache=True,
     )
     return parser
 
@@ -60,12 +67,46 @@ class RedefinitionError(Exception):
     pass
 
 
+def parse_declarations(
+    definition: str,
+    source: Path | None = None,
+    use_cache: bool = True,
+) -> list[DeclPackage]:
+    """
+    Parse a Packtype definition from a string into declarations, without
+    elaborating them into packages. Declarations do not depend on any other
+    definition, so many definitions may be parsed independently (and in any
+    order) before they are elaborated.
+
+    :param definition: The Packtype definition as a string.
+    :param source:     An optional source path for error reporting.
+    :param use_cache:  If True, the parse cache will be consulted (when it has
+                       been configured, see ParseCache).
+    :return:           List of package declarations.
+    """
+    # Parse the definition (unless the declarations are already cached)
+    if (definitions := ParseCache.load(definition) if use_cache else None) is None:
+        try:
+            definitions = PacktypeTransformer().transform(create_parser().parse(definition))
+        except UnexpectedToken as exc:
+            raise ParseError(
+                f"Failed to parse {source.name if source else 'input'} on line {exc.line}: "
+                f"\n\n{exc.get_context(definition)}\n{exc}"
+            ) from exc
+        except VisitError as exc:
+            raise exc.orig_exc from exc
+        if use_cache:
+            ParseCache.store(definition, definitions)
+    return [definitions] if isinstance(definitions, DeclPackage) else definitions
+
+
 def parse_string(
     definition: str,
     namespaces: dict[str, Package] | None = None,
     constant_overrides: dict[str, int] | None = None,
     source: Path | None = None,
     keep_expression: bool = False,
+    use_cache: bool = True,
 ) -> Iterable[Package]:
     """
     Parse a Packtype definition from a string producing a Package object.
@@ -79,22 +120,43 @@ def parse_string(
                                associating each declaration with its source file.
     :param keep_expression:    If True, expressions will be attached to constants
                                allowing them to be re-evaluated with new inputs.
+    :param use_cache:          If True, the parse cache will be consulted (when
+                               it has been configured, see ParseCache).
     :yields:                   A Package object representing the parsed definition.
     """
-    # If no namespaces are provided, use an empty dict
-    namespaces = namespaces or {}
+    yield from elaborate(
+        parse_declarations(definition, source=source, use_cache=use_cache),
+        namespaces=namespaces or {},
+        constant_overrides=constant_overrides,
+        source=source,
+        keep_expression=keep_expression,
+    )
+
+
+def elaborate(
+    definitions: list[DeclPackage],
+    namespaces: dict[str, Package],
+    constant_overrides: dict[str, int] | None = None,
+    source: Path | None = None,
+    keep_expression: bool = False,
+) -> Iterable[Package]:
+    """
+    Elaborate parsed declarations into packages, see `parse_declarations`.
+
+    :param definitions:        The package declarations to elaborate.
+    :param namespaces:         A dictionary of known packages to resolve imports,
+                               which each elaborated package is added to.
+    :param constant_overrides: Optional overrides for constants defined within
+                               the package, where the key must precisely match
+                               the constant's name
+    :param source:             An optional source path for error reporting and
+                               associating each declaration with its source file.
+    :param keep_expression:    If True, expressions will be attached to constants
+                               allowing them to be re-evaluated with new inputs.
+    :yields:                   A Package object for each declaration.
+    """
     # If no constant overrides are provided, use an empty dict
     constant_overrides = constant_overrides or {}
-    # Parse the definition
-    try:
-        definitions = PacktypeTransformer().transform(create_parser().parse(definition))
-    except UnexpectedToken as exc:
-        raise ParseError(
-            f"Failed to parse {source.name if source else 'input'} on line {exc.line}: "
-            f"\n\n{exc.get_context(definition)}\n{exc}"
-        ) from exc
-    except VisitError as exc:
-        raise exc.orig_exc from exc
 
     # Gather declarations
     known_entities: dict[str, tuple[type[Base] | Constant, Position]] = {}
@@ -123,7 +185,7 @@ def parse_string(
             return known_entities[ref][0]
         raise UnknownEntityError(f"Failed to resolve '{ref}' to a known constant or type")
 
-    for defn in [definitions] if isinstance(definitions, DeclPackage) else definitions:
+    for defn in definitions:
         # Create the package
         package: Package = build_from_fields(
             base=Package,
@@ -160,9 +222,10 @@ def parse_string(
                     # Check for name collisions
                     _check_collision(decl.name)
                     # Attach to the package
-                    package._pt_attach(
-                        alias := decl.to_class(_resolve),
+                    alias = package._pt_attach(
+                        decl.to_class(_resolve),
                         name=decl.name,
+                        source=(source.as_posix() if source else "N/A", decl.position.line),
                     )
                     # Remember this type
                     known_entities[decl.name] = (alias, decl.position)
@@ -200,10 +263,12 @@ def parse_string(
                     # Check for name collisions
                     _check_collision(decl.name)
                     # Attach to the package
-                    package._pt_attach(
-                        obj := decl.to_class(_resolve),
+                    obj = package._pt_attach(
+                        decl.to_class(_resolve),
                         name=decl.name,
+                        source=(source.as_posix() if source else "N/A", decl.position.line),
                     )
+                    obj.__doc__ = str(decl.description) if decl.description else None
                     # Remember this type
                     known_entities[decl.name] = (obj, decl.position)
                 # Build enums, structs, and unions
@@ -242,6 +307,7 @@ def parse(
     namespaces: dict[str, Package] | None = None,
     constant_overrides: dict[str, int] | None = None,
     keep_expression: bool = False,
+    use_cache: bool = True,
 ) -> Iterable[Package]:
     """
     Parse a Packtype definition from a file path producing a Package object.
@@ -253,6 +319,8 @@ def parse(
                                the constant's name.
     :param keep_expression:    If True, expressions will be attached to constants
                                allowing them to be re-evaluated with new inputs.
+    :param use_cache:          If True, the parse cache will be consulted (when
+                               it has been configured, see ParseCache).
     :yields:                   Package objects representing the parsed definition.
     """
     with path.open("r", encoding="utf-8") as fh:
@@ -262,4 +330,5 @@ def parse(
             constant_overrides=constant_overrides,
             source=path,
             keep_expression=keep_expression,
+            use_cache=use_cache,
         )
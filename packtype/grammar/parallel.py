@@ -0,0 +1,145 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import dataclasses
+import itertools
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ..common.expression import Expression, ExpressionFunction
+from ..common.logging import get_log
+from ..types.package import Package
+from .cache import ParseCache
+from .declarations import DeclPackage, ForeignRef
+from .grammar import create_parser, elaborate, parse_declarations
+
+
+class CircularImportError(Exception):
+    """Exception raised when packages import from each other in a cycle."""
+
+    pass
+
+
+def foreign_packages(obj: Any) -> Iterator[str]:
+    """
+    Find the names of every package referred to by a declaration, whether
+    through an import or a foreign reference (e.g. `other_pkg::TYPE`).
+
+    :param obj: The declaration (or any part of it) to search
+    :yields:    Names of the referenced packages, possibly repeated
+    """
+    if isinstance(obj, ForeignRef):
+        yield obj.package
+    elif isinstance(obj, list | tuple):
+        for item in obj:
+            yield from foreign_packages(item)
+    elif isinstance(obj, Expression):
+        yield from foreign_packages(obj.lhs)
+        yield from foreign_packages(obj.rhs)
+    elif isinstance(obj, ExpressionFunction):
+        yield from foreign_packages(obj.args)
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        for field in dataclasses.fields(obj):
+            yield from foreign_packages(getattr(obj, field.name))
+
+
+def dependency_order(declarations: dict[Path, list[DeclPackage]]) -> list[Path]:
+    """
+    Order files such that every file follows the files declaring the packages
+    that it refers to, otherwise maintaining the order the files were given in.
+    References to packages not declared by any of the files are ignored.
+
+    :param declarations: Package declarations parsed from each file
+    :return:             Paths of the files in dependency order
+    """
+    declared_by = {decl.name: path for path, decls in declarations.items() for decl in decls}
+    order = {}
+    visiting = []
+
+    def _visit(path: Path) -> None:
+        if path in visiting:
+            cycle = " -> ".join(x.name for x in [*visiting[visiting.index(path) :], path])
+            raise CircularImportError(f"Packages import from each other in a cycle: {cycle}")
+        if path in order:
+            return
+        visiting.append(path)
+        for package in foreign_packages(declarations[path]):
+            if (dependency := declared_by.get(package, path)) != path:
+                _visit(dependency)
+        visiting.pop()
+        order[path] = None
+
+    for path in declarations:
+        _visit(path)
+    return list(order)
+
+
+def parse_many(
+    paths: Iterable[Path],
+    namespaces: dict[str, Package] | None = None,
+    keep_expression: bool = False,
+    use_cache: bool = True,
+    processes: int | None = None,
+) -> Iterable[Package]:
+    """
+    Parse many Packtype definition files, which may be given in any order. The
+    files are parsed concurrently in a pool of processes and then elaborated
+    into packages in dependency order, as determined by the packages that each
+    file imports from or otherwise refers to.
+
+    :param paths:           Paths of the files to parse.
+    :param namespaces:      A dictionary of known packages to resolve imports,
+                            which each elaborated package is added to.
+    :param keep_expression: If True, expressions will be attached to constants
+                            allowing them to be re-evaluated with new inputs.
+    :param use_cache:       If True, the parse cache will be consulted (when it
+                            has been configured, see ParseCache).
+    :param processes:       Maximum number of processes to parse files with,
+                            defaults to the number of CPUs. Files are parsed in
+                            this process if only one process is allowed, or if
+                            at most one file is not already cached.
+    :yields:                Package objects in dependency order.
+    """
+    namespaces = {} if namespaces is None else namespaces
+    definitions = {Path(x): Path(x).read_text(encoding="utf-8") for x in paths}
+    # Retrieve whatever is already cached without starting any processes
+    declarations = {}
+    for path, definition in definitions.items():
+        if use_cache and (cached := ParseCache.load(definition)) is not None:
+            declarations[path] = [cached] if isinstance(cached, DeclPackage) else cached
+    # Parse the remaining files, concurrently if there are several of them
+    pending = [x for x in definitions if x not in declarations]
+    processes = min(processes or os.cpu_count() or 1, len(pending))
+    if processes > 1:
+        get_log().debug(f"Parsing {len(pending)} files across {processes} processes")
+        # Build the parser first so that forked processes inherit it
+        create_parser()
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=ParseCache.configure,
+            initargs=(ParseCache.DIRECTORY,),
+        ) as pool:
+            parsed = pool.map(
+                parse_declarations,
+                [definitions[x] for x in pending],
+                pending,
+                itertools.repeat(use_cache),
+                chunksize=max(1, len(pending) // (processes * 4)),
+            )
+            declarations.update(zip(pending, parsed, strict=True))
+    else:
+        for path in pending:
+            declarations[path] = parse_declarations(definitions[path], path, use_cache)
+    # Elaborate in dependency order, retaining the original order of the files
+    declarations = {x: declarations[x] for x in definitions}
+    for path in dependency_order(declarations):
+        yield from elaborate(
+            declarations[path],
+            namespaces=namespaces,
+            source=path,
+            keep_expression=keep_expression,
+        )
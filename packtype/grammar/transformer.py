@@ -165,6 +165,20 @@ class PacktypeTransformer(Transformer):
                 description=body.pop(0) if body and isinstance(body[0], Description) else None,
             )
 
+    @v_args(meta=True)
+    def union_field(self, meta, body):
+        name, ref, *remainder = body
+        dimensions = remainder.pop(0) if isinstance(remainder[0], DeclDimensions) else None
+        description = remainder.pop() if isinstance(remainder[-1], Description) else None
+        return DeclField(
+            Position(meta.line, meta.column),
+            name=name,
+            ref=ref,
+            dimensions=dimensions,
+            description=description,
+            tags=remainder,
+        )
+
     @v_args(meta=True)
     def enum_body_simple(self, meta, body):
         return DeclConstant(
@@ -126,7 +126,7 @@ class Register(PackedAssembly):
         self._pt_offset = offset
         self._pt_paired = {x: y(name=x.name.lower()) for x, y in self._PT_PAIRED.items()}
         for paired in self._pt_paired.values():
-            paired._PT_PARENT = self
+            paired._pt_parent = self
 
     def _pt_name(self) -> str:
         return self.__name
@@ -223,7 +223,7 @@ class Group(Base):
             if isinstance(ftype, ArraySpec):
                 finst = ftype.as_unpacked(_pt_per_inst=partial(_lookup, offset, fname))
                 for sub in finst:
-                    sub._PT_PARENT = self
+                    sub._pt_parent = self
                     if sub._PT_BASE is Register:
                         for pbehav, preg in sub._pt_paired.items():
                             _, _, prd_offset = self._PT_OFFSETS[(fname, pbehav), 0]
@@ -231,7 +231,7 @@ class Group(Base):
             elif ftype._PT_BASE in (Group, Register):
                 _, _, sub_offset = self._PT_OFFSETS[fname, 0]
                 finst = ftype(name=fname, index=None, offset=offset + sub_offset)
-                finst._PT_PARENT = self
+                finst._pt_parent = self
                 if ftype._PT_BASE is Register:
                     for pbehav, preg in finst._pt_paired.items():
                         _, _, prd_offset = self._PT_OFFSETS[(fname, pbehav), 0]
@@ -281,6 +281,29 @@ class Group(Base):
     def _pt_fullname(self) -> str:
         return ".".join(map(str, self._pt_path))
 
+    def _pt_track(self, enable: bool = True) -> None:
+        """
+        Start or stop recording writes to every register within the group.
+
+        :param enable: Whether to record writes, defaults to True
+        """
+        for reg in self:
+            reg._pt_track(enable)
+
+    def _pt_dirty(self) -> list[Register]:
+        """
+        List the registers within the group that have been written since
+        tracking was enabled or the last checkpoint.
+
+        :return: The registers that have been written
+        """
+        return [x for x in self if x._pt_is_dirty()]
+
+    def _pt_checkpoint(self) -> None:
+        """Clear the record of writes for every register within the group"""
+        for reg in self:
+            reg._pt_checkpoint()
+
     @classmethod
     def _pt_construct(cls, parent: Base, width: int | None, align: int | None, spacing: int | None):
         # Process assignments
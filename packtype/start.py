@@ -13,7 +13,7 @@ import click
 
 from . import utils
 from .common.logging import get_log
-from .grammar import parse
+from .grammar import ParseCache, parse_many
 from .registers import Behaviour, File, Register
 from .templates.common import camel_case, snake_case
 from .types.alias import Alias
@@ -60,7 +60,9 @@ def resolve_to_object(
     return resolved
 
 
-def load_specification(spec_files: list[str], keep_expression: bool) -> list[Base]:
+def load_specification(
+    spec_files: list[str], keep_expression: bool, jobs: int | None = None
+) -> list[Base]:
     log = get_log()
 
     # If multiple specifications are provided, check they all use .pt format
@@ -70,16 +72,22 @@ def load_specification(spec_files: list[str], keep_expression: bool) -> list[Bas
                 "Multiple specifications provided, but not all are Packtype grammar"
             )
 
-    # For each specification, parse and track
-    namespaces = {}
+    # Packtype grammar files are parsed together, as they may be given in any
+    # order and are elaborated in the order of their imports
+    if grammar_files := [
+        Path(x) for x in spec_files if x.lower().endswith((".pt", ".packtype", ".ptype"))
+    ]:
+        log.debug(f"Loading specifications: {', '.join(map(str, grammar_files))}")
+        for _ in parse_many(grammar_files, keep_expression=keep_expression, processes=jobs):
+            pass
+
+    # Any other specification is imported
     for item in spec_files:
-        get_log().debug(f"Loading specification: {item}")
-        # Packtype grammar files
         if item.lower().endswith((".pt", ".packtype", ".ptype")):
-            for package in parse(Path(item), namespaces, keep_expression=keep_expression):
-                namespaces[package.__name__] = package
+            continue
+        get_log().debug(f"Loading specification: {item}")
         # If it ends with `.py` assume it's Python
-        elif item.endswith(".py"):
+        if item.endswith(".py"):
             item = Path(item)
             log.debug(f"Importing specification as a file: {item.absolute()}")
             imp_spec = importlib.util.spec_from_file_location(item.stem, item.absolute())
@@ -99,20 +107,45 @@ def load_specification(spec_files: list[str], keep_expression: bool) -> list[Bas
 # Handle CLI
 @click.group()
 @click.option("--debug", flag_value=True, default=False, help="Enable debug messages")
-def main(debug: bool):
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory to cache parsed grammar in (defaults to PACKTYPE_CACHE_DIR, "
+    "caching is disabled if neither is set)",
+)
+@click.option("--no-cache", is_flag=True, help="Disable caching of parsed grammar")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of processes to parse grammar with (defaults to the number of CPUs)",
+)
+@click.pass_context
+def main(ctx: click.Context, debug: bool, cache_dir: Path | None, no_cache: bool, jobs: int | None):
     """Renders packtype definitions into different forms"""
     log = get_log()
     # Set log verbosity
     if debug:
         log.setLevel(logging.DEBUG)
+    # Configure the parse cache, which is otherwise only enabled by the
+    # PACKTYPE_CACHE_DIR environment variable
+    if no_cache:
+        ParseCache.configure(None)
+    elif cache_dir is not None:
+        ParseCache.configure(cache_dir)
+    # Remember options shared by all commands
+    ctx.obj = SimpleNamespace(jobs=jobs)
 
 
 @main.command()
 @click.argument("spec_files", type=str, nargs=-1)
 @click.option("--keep-expression", is_flag=True, help="Attach parsed expressions to constants")
-def inspect(spec_files: list[str], keep_expression: bool):
+@click.pass_obj
+def inspect(obj: SimpleNamespace, spec_files: list[str], keep_expression: bool):
     log = get_log()
-    baseline = load_specification(spec_files, keep_expression)
+    baseline = load_specification(spec_files, keep_expression, jobs=obj.jobs)
     log.warning("Use the 'baseline' namespace to inspect Packtype definitions")
     breakpoint()  # noqa: T100
     del baseline
@@ -129,10 +162,11 @@ def inspect(spec_files: list[str], keep_expression: bool):
     help="Output file to write the SVG to. If not provided, prints to stdout.",
 )
 @click.argument("spec_files", type=str, nargs=-1)
-def svg(selection: str, output: Path | None, spec_files: list[str]):
+@click.pass_obj
+def svg(obj: SimpleNamespace, selection: str, output: Path | None, spec_files: list[str]):
     # Resolve selection to a struct
     resolved = resolve_to_object(
-        load_specification(spec_files, keep_expression=False),
+        load_specification(spec_files, keep_expression=False, jobs=obj.jobs),
         *selection.split("."),
         acceptable=(Struct,),
     )
@@ -207,7 +241,9 @@ def svg(selection: str, output: Path | None, spec_files: list[str]):
 )
 @click.argument("outdir", type=click.Path(file_okay=False, path_type=Path))
 @click.argument("spec_files", type=str, nargs=-1)
+@click.pass_obj
 def code(
+    obj: SimpleNamespace,
     option: list[str],
     select: list[str],
     package_suffix: str,
@@ -226,7 +262,7 @@ def code(
     log = get_log()
 
     # Load the baseline
-    resolved = load_specification(spec_files, keep_expression)
+    resolved = load_specification(spec_files, keep_expression, jobs=obj.jobs)
 
     # Deferred imports for optional libraries
     from mako import exceptions
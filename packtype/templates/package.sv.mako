@@ -101,64 +101,65 @@ typedef enum logic [${utils.get_width(obj)-1}:0] {
 // Structs and Unions
 // =============================================================================
 
-%for name, objcls in baseline._pt_structs_and_unions:
-<%  obj = objcls() %>\
+%for name, obj in baseline._pt_structs_and_unions:
 // ${name}
-    %if isinstance(obj, Struct):
+    %if issubclass(obj, Struct):
 typedef struct packed {
 <%
         msb_pack = (obj._PT_PACKING == Packing.FROM_MSB)
         next_pos = utils.get_width(obj) - 1
         pad_idx  = 0
 %>\
-        %for flsb, fmsb, (fname, field) in obj._pt_fields_msb_desc:
-            %if fmsb != next_pos:
-<%              pad_width = (next_pos - fmsb) %>\
+        %for layout in utils.struct.get_layout(obj).msb_desc:
+            %if layout.msb != next_pos:
+<%              pad_width = (next_pos - layout.msb) %>\
     logic${f" [{pad_width-1}:0]" if pad_width > 1 else ""} _padding_${pad_idx};
 <%              pad_idx += 1 %>\
             %endif
 <%
+            fname = layout.name
+            field = layout.base
             array_sfx = ""
-            if utils.array.is_packed_array(field):
-                array_sfx = " " + "".join(f"[{x-1}:0]" for x in field._pt_spec.dimensions)
-                field = field._pt_spec.base()
+            if layout.is_array:
+                array_sfx = " " + "".join(f"[{x-1}:0]" for x in layout.dimensions)
 %>\
             %if utils.is_scalar(field):
                 %if field._PT_ATTACHED_TO:
 <%                  refers_to = field._pt_name() %>\
     ${refers_to | filters.type}${array_sfx} ${fname | tc.snake_case};
                 %else:
-<%                  sign_sfx = " signed" if field._pt_signed else "" %>\
+<%                  sign_sfx = " signed" if utils.is_signed(field) else "" %>\
     logic${sign_sfx}${array_sfx}${f" [{utils.get_width(field)-1}:0]" if utils.get_width(field) > 1 else ""} ${fname | tc.snake_case};
                 %endif
-            %elif isinstance(field, Alias | Enum | Struct | Union):
+            %elif issubclass(field, Enum | Struct | Union):
     ${field._pt_name() | filters.type}${array_sfx} ${fname | tc.snake_case};
             %endif
-<%          next_pos = (flsb - 1) %>\
+<%          next_pos = (layout.lsb - 1) %>\
         %endfor
         %if msb_pack and next_pos >= 0:
 <%          pad_width = next_pos + 1 %>\
     logic${f" [{pad_width-1}:0]" if pad_width > 1 else ""} _padding_${pad_idx};
         %endif
 } ${obj._pt_name() | filters.type};
-    %elif isinstance(obj, Union):
+    %elif issubclass(obj, Union):
 typedef union packed {
-        %for field, fname in obj._pt_fields.items():
+        %for layout in utils.union.get_layout(obj).fields:
 <%
+            fname = layout.name
+            field = layout.base
             array_sfx = ""
-            if utils.array.is_packed_array(field):
-                array_sfx = " " + "".join(f"[{x-1}:0]" for x in field._pt_spec.dimensions)
-                field = field._pt_spec.base()
+            if layout.is_array:
+                array_sfx = " " + "".join(f"[{x-1}:0]" for x in layout.dimensions)
 %>\
-            %if isinstance(field, ScalarType):
+            %if issubclass(field, ScalarType):
                 %if field._PT_ATTACHED_TO:
 <%                  refers_to = field._pt_name() %>\
     ${refers_to | filters.type} ${fname | tc.snake_case};
                 %else:
-<%                  sign_sfx = " signed" if field._pt_signed else "" %>\
+<%                  sign_sfx = " signed" if utils.is_signed(field) else "" %>\
     logic${sign_sfx}${array_sfx}${f" [{utils.get_width(field)-1}:0]" if utils.get_width(field) > 1 else ""} ${fname | tc.snake_case};
                 %endif
-            %elif isinstance(field, Enum | Struct | Alias | Union):
+            %elif issubclass(field, Enum | Struct | Union):
     ${field._pt_name() | filters.type}${array_sfx} ${fname | tc.snake_case};
             %endif
         %endfor
@@ -46,9 +46,9 @@ public:
 
 %for base in sorted(base_types, key=lambda x: x.__name__):
     struct ${base.__name__ | tc.camel_case} {
-    %for _, _, (name, _) in base()._pt_fields_msb_desc:
-        std::uint64_t ${name | tc.snake_case};
-    %endfor ## _, _, (name, _) in base()._pt_fields_msb_desc
+    %for field in base._pt_layout().msb_desc:
+        std::uint64_t ${field.name | tc.snake_case};
+    %endfor ## field in base._pt_layout().msb_desc
     };
 
 %endfor ## base in base_types
@@ -60,18 +60,18 @@ public:
     static ${base.__name__ | tc.camel_case} unpack_${base.__name__ | tc.snake_case} (std::uint64_t value)
     {
         ${base.__name__ | tc.camel_case} unpacked;
-    %for lsb, _, (name, field) in base()._pt_fields_msb_desc:
-        unpacked.${name | tc.snake_case} = ((value >> ${lsb}) & 0x${f"{(1 << field._pt_width) - 1:X}"});
-    %endfor ## lsb, _, (name, field) in base()._pt_fields_msb_desc
+    %for field in base._pt_layout().msb_desc:
+        unpacked.${field.name | tc.snake_case} = ((value >> ${field.lsb}) & 0x${f"{(1 << field.width) - 1:X}"});
+    %endfor ## field in base._pt_layout().msb_desc
         return unpacked;
     }
 
     static std::uint64_t pack_${base.__name__ | tc.snake_case} (${base.__name__ | tc.camel_case} data)
     {
         std::uint64_t value = 0;
-    %for lsb, _, (name, field) in base()._pt_fields_msb_desc:
-        value |= (data.${name | tc.snake_case} & 0x${f"{(1 << field._pt_width) - 1:X}"}) << ${lsb};
-    %endfor ## lsb, _, (name, field) in base()._pt_fields_msb_desc
+    %for field in base._pt_layout().msb_desc:
+        value |= (data.${field.name | tc.snake_case} & 0x${f"{(1 << field.width) - 1:X}"}) << ${field.lsb};
+    %endfor ## field in base._pt_layout().msb_desc
         return value;
     }
 
@@ -84,17 +84,17 @@ class ${cls_name}${base.__name__ | tc.camel_case}(${cls_name}Container):
 
     def pack(self) -> int:
         value = 0
-    %for lsb, _, (name, field) in base()._pt_fields_msb_desc:
-        value |= (self.${name | tc.snake_case} & 0x${f"{(1 << field._pt_width) - 1:X}"}) << ${lsb}
-    %endfor ## lsb, _, (name, field) in base()._pt_fields_msb_desc
+    %for field in base._pt_layout().msb_desc:
+        value |= (self.${field.name | tc.snake_case} & 0x${f"{(1 << field.width) - 1:X}"}) << ${field.lsb}
+    %endfor ## field in base._pt_layout().msb_desc
         return value
 
     @classmethod
     def unpack(cls, value: int) -> "${cls_name}${base.__name__ | tc.camel_case}":
         return cls(
-    %for lsb, _, (name, field) in base()._pt_fields_msb_desc:
-            ${name | tc.snake_case}=((value >> ${lsb}) & 0x${f"{(1 << field._pt_width) - 1:X}"}),
-    %endfor ## lsb, _, (name, field) in base()._pt_fields_msb_desc
+    %for field in base._pt_layout().msb_desc:
+            ${field.name | tc.snake_case}=((value >> ${field.lsb}) & 0x${f"{(1 << field.width) - 1:X}"}),
+    %endfor ## field in base._pt_layout().msb_desc
         )
 
 %endfor ## base in base_types
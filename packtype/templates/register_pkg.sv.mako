@@ -58,17 +58,17 @@ typedef enum logic [${byte_width-1}:0] {
 
 %for base in sorted(base_types, key=lambda x: x.__name__):
 typedef struct packed {
-    %for f_lsb, f_msb, (name, field) in base()._pt_fields_msb_desc:
-        %if isinstance(field, NumericPrimitive):
-            %if field._pt_width > 1:
-    logic [${field._pt_width-1}:0] ${name | tc.snake_case};
+    %for field in base._pt_layout().msb_desc:
+        %if issubclass(field.base, NumericPrimitive):
+            %if field.width > 1:
+    logic [${field.width-1}:0] ${field.name | tc.snake_case};
             %else:
-    logic ${name | tc.snake_case};
+    logic ${field.name | tc.snake_case};
             %endif
-        %elif field._PT_BASE in (Enum, Struct, Union):
-    ${field._pt_name() | tc.snake_case}_t ${name | tc.snake_case};
+        %elif field.base._PT_BASE in (Enum, Struct, Union):
+    ${field.base._pt_name() | tc.snake_case}_t ${field.name | tc.snake_case};
         %endif
-    %endfor ## f_lsb, f_msb, (name, field) in base()._pt_fields_msb_desc
+    %endfor ## field in base._pt_layout().msb_desc
 } ${base.__name__ | tc.snake_case}_t;
 
 %endfor ## base in base_types
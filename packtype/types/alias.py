@@ -2,12 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from collections import defaultdict
 from typing import Any
 
 
 class MetaAlias(type):
-    UNIQUE_ID: dict[str, int] = defaultdict(lambda: 0)
+    INTERNED: dict[tuple[type, Any], type] = {}
 
     def __call__(cls, *args, **kwds):
         return cls._PT_ALIAS(*args, **kwds)
@@ -20,16 +19,16 @@ class MetaAlias(type):
 
     @staticmethod
     def get_variant(alias: "Alias", to_alias: Any):
-        # NOTE: Don't share aliases between creations as this prevents the
-        #       parent being distinctly tracked (a problem when they are used as
-        #       typedefs on a package)
-        uid = MetaAlias.UNIQUE_ID[alias.__name__]
-        MetaAlias.UNIQUE_ID[alias.__name__] += 1
-        return type(
-            alias.__name__ + f"_{to_alias.__name__}_{uid}",
-            (alias,),
-            {"_PT_ALIAS": to_alias},
-        )
+        # NOTE: Variants are interned so that every alias of the same type shares
+        #       one class, typedefs on a package derive their own subclass when
+        #       attached so their parent is tracked distinctly
+        if (variant := MetaAlias.INTERNED.get((alias, to_alias), None)) is None:
+            variant = MetaAlias.INTERNED[alias, to_alias] = type(
+                alias.__name__ + f"_{to_alias.__name__}",
+                (alias,),
+                {"_PT_ALIAS": to_alias, "_PT_INTERNED": True},
+            )
+        return variant
 
 
 class Alias(metaclass=MetaAlias):
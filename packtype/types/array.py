@@ -2,13 +2,20 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import functools
+import copy
+import itertools
 import math
 from collections.abc import Callable, Iterable
-from typing import Any, Self
+from typing import Any, Literal, Self
 
+from ..common.optional import import_numpy, is_numpy_array
 from .bitvector import BitVector, BitVectorWindow
 from .packing import Packing
+from .serial import from_bytes, to_bytes
+
+
+class ArrayError(Exception):
+    pass
 
 
 class ArraySpec:
@@ -60,6 +67,9 @@ class ArraySpec:
 
         return {x[0]: (x[1], x[2]) for x in _recurse(self.dimensions, [], self._pt_width - 1, 0)}
 
+    def _pt_dependencies(self) -> Iterable[Any]:
+        return self.base._pt_dependencies()
+
     def _pt_references(self) -> Iterable[Any]:
         return self.base._pt_references()
 
@@ -74,6 +84,17 @@ class ArraySpec:
         inst._pt_set(packed)
         return inst
 
+    def _pt_from_bytes(
+        self,
+        data: Any,
+        byteorder: Literal["little", "big"] = "little",
+        bitorder: Literal["msb", "lsb"] = "msb",
+        padding: Literal["msb", "lsb"] = "msb",
+    ) -> "PackedArray":
+        inst = PackedArray(self)
+        from_bytes(inst._pt_bv, data, byteorder, bitorder, padding)
+        return inst
+
     def __call__(self, **kwds) -> "PackedArray":
         return self.as_packed(**kwds)
 
@@ -82,6 +103,21 @@ class ArraySpec:
 
 
 class PackedArray:
+    __slots__ = (
+        "_pt_args",
+        "_pt_bv",
+        "_pt_dim_path",
+        "_pt_dimensions",
+        "_pt_entries",
+        "_pt_kwds",
+        "_pt_offset",
+        "_pt_packing",
+        "_pt_parent",
+        "_pt_per_inst",
+        "_pt_spec",
+        "_pt_stepping",
+    )
+
     def __init__(
         self,
         spec: ArraySpec,
@@ -96,80 +132,113 @@ class PackedArray:
     ):
         self._pt_spec = spec
         self._pt_bv = BitVector(width=spec._pt_width) if _pt_bv is None else _pt_bv
-        self._pt_entries = []
         self._pt_dimensions = dimensions or spec.dimensions
         self._pt_dim_path = dim_path or []
-
+        self._pt_offset = 0
+        self._pt_packing = packing
+        self._pt_args = args
+        self._pt_kwds = kwds
+        self._pt_per_inst = _pt_per_inst
+        # Each entry of the outermost dimension is either an element or a row
+        dimension, *remaining = self._pt_dimensions
+        self._pt_stepping = math.prod(remaining) * spec.base._PT_WIDTH
+        # NOTE: Entries are only created when first accessed, except where
+        #       construction arguments are provided as these may have side
+        #       effects (e.g. assigning field values) that must occur now
+        self._pt_entries = [None] * dimension
+        if args or kwds or callable(_pt_per_inst):
+            for idx in range(dimension):
+                self._pt_entry(idx)
+
+    def _pt_entry(self, idx: int) -> Any:
+        """
+        Return the entry at a given index of the outermost dimension, creating
+        it if this is the first access.
+
+        :param idx: Index of the entry
+        :return: The element or nested array
+        """
+        if (entry := self._pt_entries[idx]) is not None:
+            return entry
+        stepping = self._pt_stepping
+        if self._pt_packing is Packing.FROM_LSB:
+            lsb = idx * stepping
+        else:
+            lsb = (len(self._pt_entries) - idx - 1) * stepping
+        window = self._pt_bv.create_window(lsb + stepping - 1, lsb)
+        args, kwds = self._pt_args, self._pt_kwds
+        # NOTE: Views report indices relative to the array they were taken from
+        dim_path = (*self._pt_dim_path, idx + self._pt_offset)
+        if callable(self._pt_per_inst):
+            args, kwds = self._pt_per_inst(dim_path, *args, **kwds)
         # For a single dimension, instance elements
         if len(self._pt_dimensions) == 1:
-            msb = self._pt_dimensions[0] * spec.base._PT_WIDTH - 1
-            lsb = 0
-            for idx in range(self._pt_dimensions[0]):
-                if packing is Packing.FROM_LSB:
-                    msb = lsb + spec.base._PT_WIDTH - 1
-                else:
-                    lsb = msb - spec.base._PT_WIDTH + 1
-                if callable(_pt_per_inst):
-                    inst_args, inst_kwds = _pt_per_inst((*self._pt_dim_path, idx), *args, **kwds)
-                else:
-                    inst_args, inst_kwds = args, kwds
-                self._pt_entries.append(
-                    spec.base(
-                        *inst_args,
-                        _pt_bv=self._pt_bv.create_window(msb, lsb),
-                        **inst_kwds,
-                    )
-                )
-                if packing is Packing.FROM_LSB:
-                    lsb += spec.base._PT_WIDTH
-                else:
-                    msb -= spec.base._PT_WIDTH
+            entry = self._pt_spec.base(*args, _pt_bv=window, **kwds)
         # Otherwise, nest another PackedArray
         else:
-            dimension, *remaining = self._pt_dimensions
-            stepping = math.prod(remaining) * spec.base._PT_WIDTH
-            msb = dimension * stepping - 1
-            lsb = 0
-            for idx in range(dimension):
-                if packing is Packing.FROM_LSB:
-                    msb = lsb + stepping - 1
-                else:
-                    lsb = msb - stepping + 1
-                if callable(_pt_per_inst):
-                    inst_args, inst_kwds = _pt_per_inst((*self._pt_dim_path, idx), *args, **kwds)
-                else:
-                    inst_args, inst_kwds = args, kwds
-                self._pt_entries.append(
-                    PackedArray(
-                        spec,
-                        *args,
-                        _pt_bv=self._pt_bv.create_window(msb, lsb),
-                        _pt_per_inst=_pt_per_inst,
-                        packing=packing,
-                        dimensions=remaining,
-                        dim_path=(*self._pt_dim_path, idx),
-                        **kwds,
-                    )
-                )
-                if packing is Packing.FROM_LSB:
-                    lsb += stepping
-                else:
-                    msb -= stepping
-
-    def __getitem__(self, key: int) -> Any:
-        return self._pt_entries[key]
-
-    def __setitem__(self, key: int, value: Any) -> Any:
-        self._pt_entries[key]._pt_set(value)
+            entry = PackedArray(
+                self._pt_spec,
+                *self._pt_args,
+                _pt_bv=window,
+                _pt_per_inst=self._pt_per_inst,
+                packing=self._pt_packing,
+                dimensions=self._pt_dimensions[1:],
+                dim_path=dim_path,
+                **self._pt_kwds,
+            )
+        self._pt_entries[idx] = entry
+        return entry
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._pt_entries))
+            # Contiguous slices are returned as a view onto the same bits
+            if step == 1:
+                return self._pt_view(start, max(start, stop))
+            return [self._pt_entry(x) for x in range(start, stop, step)]
+        return self._pt_entry(range(len(self._pt_entries))[key])
+
+    def __setitem__(self, key: int | slice, value: Any) -> Any:
+        if isinstance(key, slice):
+            view = self[key]
+            if not isinstance(view, PackedArray):
+                raise ArrayError("Only contiguous slices of an array may be assigned")
+            view._pt_load(value)
+        else:
+            self[key]._pt_set(value)
+
+    def _pt_view(self, start: int, stop: int) -> "PackedArray":
+        """
+        Create a view onto a contiguous range of entries of the outermost
+        dimension, which is backed by the same bits as this array so that any
+        updates made through the view are reflected here (and vice versa).
+
+        :param start: Index of the first entry
+        :param stop:  Index of the entry after the last
+        :return: The view
+        """
+        count = stop - start
+        if self._pt_packing is Packing.FROM_LSB:
+            lsb = start * self._pt_stepping
+        else:
+            lsb = (len(self._pt_entries) - stop) * self._pt_stepping
+        view = copy.copy(self)
+        view._pt_bv = self._pt_bv.create_window(lsb + count * self._pt_stepping - 1, lsb)
+        view._pt_dimensions = (count, *self._pt_dimensions[1:])
+        view._pt_offset = self._pt_offset + start
+        # NOTE: Entries that already exist are shared with the view, as they sit
+        #       over exactly the same bits
+        view._pt_entries = self._pt_entries[start:stop]
+        return view
 
     def __iter__(self) -> Iterable[Any]:
-        yield from self._pt_entries
+        for idx in range(len(self._pt_entries)):
+            yield self._pt_entry(idx)
 
     def __len__(self) -> int:
         return len(self._pt_entries)
 
     @property
-    @functools.cache  # noqa: B019
     def _pt_width(self) -> int:
         return self._pt_bv.width
 
@@ -182,8 +251,169 @@ class PackedArray:
     def _pt_set(self, value: int) -> None:
         self._pt_bv.set(value)
 
+    def _pt_to_bytes(
+        self,
+        byteorder: Literal["little", "big"] = "little",
+        bitorder: Literal["msb", "lsb"] = "msb",
+        padding: Literal["msb", "lsb"] = "msb",
+    ) -> bytes:
+        """
+        Serialise the packed value of the whole array into the minimum number
+        of whole bytes, see `_pt_element_bytes` to serialise each entry into
+        its own bytes instead.
+
+        :param byteorder: Order of the bytes, either "little" or "big"
+        :param bitorder:  Order of the bits within each byte, either "msb" or "lsb"
+        :param padding:   Where padding bits are placed, either "msb" or "lsb"
+        :return: The serialised value
+        """
+        return to_bytes(self._pt_bv, byteorder, bitorder, padding)
+
+    @property
+    def _pt_flat_dimension(self) -> int:
+        return math.prod(self._pt_dimensions)
+
+    def _pt_load(self, values: Any, byteorder: str = "little") -> None:
+        """
+        Load every entry of the array in a single update, composing the packed
+        value in one pass rather than updating the entries one at a time.
+
+        :param values:    Either a (nested) list or tuple of integers, a NumPy
+                          integer array, or bytes where each entry occupies a
+                          whole number of bytes (e.g. 2 bytes for 12 bit entries)
+        :param byteorder: Order of the bytes within each entry when loading
+                          from bytes, either "little" or "big"
+        """
+        self._pt_bv.set(self._pt_compose(values, byteorder))
+
+    def _pt_to_list(self) -> list:
+        """
+        Return the values of every entry as a list of integers, nested to match
+        the dimensions of the array.
+
+        :return: List of entry values
+        """
+        values = self._pt_decompose()
+        for dimension in reversed(self._pt_dimensions[1:]):
+            values = [values[x : x + dimension] for x in range(0, len(values), dimension)]
+        return values
+
+    def _pt_element_bytes(self, byteorder: str = "little") -> bytes:
+        """
+        Return the values of every entry as bytes, where each entry occupies a
+        whole number of bytes (the reverse of loading bytes with `_pt_load`).
+
+        :param byteorder: Order of the bytes within each entry, either "little"
+                          or "big"
+        :return: Bytes holding every entry value
+        """
+        width = self._pt_spec.base._PT_WIDTH
+        size = (width + 7) // 8
+        if size * 8 == width and byteorder == "little" and self._pt_packing is Packing.FROM_LSB:
+            return int(self._pt_bv).to_bytes(size * self._pt_flat_dimension, "little")
+        return b"".join(x.to_bytes(size, byteorder) for x in self._pt_decompose())
+
+    def _pt_to_numpy(self, dtype: Any = None) -> Any:
+        """
+        Return the values of every entry as a NumPy array shaped to match the
+        dimensions of the array (requires NumPy to be installed).
+
+        :param dtype: Optional NumPy data type, defaults to the smallest
+                      unsigned integer type that can hold an entry (or object
+                      for entries wider than 64 bits)
+        :return: NumPy array of entry values
+        """
+        np = import_numpy()
+        width = self._pt_spec.base._PT_WIDTH
+        if dtype is None:
+            dtype = next((f"u{x // 8}" for x in (8, 16, 32, 64) if width <= x), object)
+        if width in (8, 16, 32, 64):
+            values = np.frombuffer(
+                int(self._pt_bv).to_bytes((width // 8) * self._pt_flat_dimension, "little"),
+                dtype=f"<u{width // 8}",
+            )
+            if self._pt_packing is Packing.FROM_MSB:
+                values = values[::-1]
+            values = values.astype(dtype)
+        else:
+            values = np.array(self._pt_decompose(), dtype=dtype)
+        return values.reshape(self._pt_dimensions)
+
+    def _pt_compose(self, values: Any, byteorder: str) -> int:
+        width = self._pt_spec.base._PT_WIDTH
+        count = self._pt_flat_dimension
+        mask = (1 << width) - 1
+        lsb_first = self._pt_packing is Packing.FROM_LSB
+        # Bytes hold one entry per whole number of bytes
+        if isinstance(values, bytes | bytearray | memoryview):
+            size = (width + 7) // 8
+            data = bytes(values)
+            if len(data) != size * count:
+                raise ArrayError(
+                    f"Expected {size * count} bytes to load {count} entries of "
+                    f"{width} bits but {len(data)} bytes were provided"
+                )
+            if size * 8 == width and byteorder == "little" and lsb_first:
+                return int.from_bytes(data, "little")
+            values = [
+                int.from_bytes(data[x : x + size], byteorder) for x in range(0, len(data), size)
+            ]
+        # NumPy arrays are range checked as a whole and, where the entry width
+        # matches a native type, converted directly from the buffer
+        elif is_numpy_array(values):
+            values = values.ravel()
+            if values.size != count:
+                raise ArrayError(f"Expected {count} entries but {values.size} were provided")
+            if count and (values.min() < 0 or values.max() > mask):
+                bad = int(((values < 0) | (values > mask)).argmax())
+                raise ArrayError(
+                    f"Value {values[bad]} at index {bad} cannot be represented by {width} bits"
+                )
+            if width in (8, 16, 32, 64) and values.dtype.kind in "iu":
+                if not lsb_first:
+                    values = values[::-1]
+                return int.from_bytes(values.astype(f"<u{width // 8}").tobytes(), "little")
+            values = [int(x) for x in values.tolist()]
+        # Anything else is a (nested) sequence of values
+        else:
+            if isinstance(values, PackedArray):
+                values = values._pt_decompose()
+            values = list(values)
+            # Flatten nested rows, although a flat sequence is also accepted
+            for _ in self._pt_dimensions[1:]:
+                if not values or not isinstance(values[0], list | tuple | PackedArray):
+                    break
+                values = list(itertools.chain.from_iterable(values))
+            values = [int(x) for x in values]
+            if len(values) != count:
+                raise ArrayError(f"Expected {count} entries but {len(values)} were provided")
+        # Check every value fits within an entry
+        if count and (min(values) < 0 or max(values) > mask):
+            bad = next(i for i, x in enumerate(values) if not 0 <= x <= mask)
+            raise ArrayError(
+                f"Value {values[bad]} at index {bad} cannot be represented by {width} bits"
+            )
+        # Compose the packed value in a single pass via its binary string form
+        if lsb_first:
+            values = reversed(values)
+        spec = f"0{width}b"
+        return int("".join(format(x, spec) for x in values) or "0", 2)
+
+    def _pt_decompose(self) -> list[int]:
+        width = self._pt_spec.base._PT_WIDTH
+        count = self._pt_flat_dimension
+        if count == 0:
+            return []
+        bits = format(int(self._pt_bv), f"0{width * count}b")
+        values = [int(bits[x : x + width], 2) for x in range(0, width * count, width)]
+        if self._pt_packing is Packing.FROM_LSB:
+            values.reverse()
+        return values
+
 
 class UnpackedArray:
+    __slots__ = ("_pt_entries", "_pt_parent", "_pt_spec")
+
     def __init__(
         self,
         spec: ArraySpec,
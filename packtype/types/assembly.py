@@ -2,19 +2,19 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import functools
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from ..svg.render import ElementStyle, SvgConfig, SvgField, SvgRender
 from .array import ArraySpec, PackedArray
 from .base import Base
 from .bitvector import BitVector, BitVectorWindow
+from .codec import AssemblyCodec
 from .constant import Constant
+from .layout import Layout, LayoutRanges, width_of
 from .numeric import Numeric
 from .packing import Packing
-from .scalar import Scalar
 
 
 class WidthError(Exception):
@@ -25,41 +25,79 @@ class AssignmentError(Exception):
     pass
 
 
+class TrackingError(Exception):
+    pass
+
+
+class AssemblyField:
+    """
+    Data descriptor attached to an assembly class for each of its fields, the
+    field instance is constructed on first access and then held by the assembly
+    instance so that later accesses are a simple lookup.
+
+    :param name: Name of the field
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, inst: "Assembly | None", owner: type["Assembly"] | None = None) -> Any:
+        if inst is None:
+            return self
+        try:
+            return inst._pt_insts[self.name]
+        except KeyError:
+            finst = inst._pt_insts[self.name] = inst._pt_create_field(self.name)
+            return finst
+
+    def __set__(self, inst: "Assembly", value: Any) -> None:
+        self.__get__(inst)._pt_set(value)
+
+
 class Assembly(Base, Numeric):
+    __slots__ = ("_pt_insts",)
+
     _PT_ALLOW_DEFAULTS: list[type[Base]] = [Constant]
 
     def __init__(
         self, _pt_bv: BitVector | BitVectorWindow | None = None, default: int | None = None
     ):
+        self._pt_insts = {}
         super().__init__(_pt_bv=_pt_bv, default=default)
 
-    def _pt_force_set(self, name: str, value: Any):
-        super().__setattr__(name, value)
+    @classmethod
+    def _pt_attach_fields(cls, names: Iterable[str]) -> None:
+        for fname in names:
+            setattr(cls, fname, AssemblyField(fname))
 
-    def __setattr__(self, name: str, value: Any):
-        if name in self._PT_DEF.keys():
-            getattr(self, name)._pt_set(value)
-        else:
-            return super().__setattr__(name, value)
+    def _pt_create_field(self, fname: str) -> Base:
+        raise NotImplementedError("Subclass must implement _pt_create_field")
 
     def _pt_lookup(self, field: type[Base] | Base) -> str:
         return self._pt_fields[field]
 
     @property
-    @functools.lru_cache  # noqa: B019
     def _pt_fields(self) -> dict[Base, str]:
         return {getattr(self, x): x for x in self._PT_DEF.keys()}
 
 
 class PackedAssembly(Assembly):
+    __slots__ = ()
+
     _PT_ATTRIBUTES: dict[str, tuple[Any, list[Any]]] = {
         "packing": (Packing.FROM_LSB, [Packing.FROM_LSB, Packing.FROM_MSB]),
         "width": (-1, lambda x: x is None or int(x) > 0),
     }
     _PT_PACKING: Packing
     _PT_WIDTH: int
-    _PT_RANGES: dict
+    _PT_MASK: int
+    _PT_RANGES: LayoutRanges
     _PT_PADDING: int
+    _PT_PADDING_TYPE: type[Base] | None
+    _PT_FIELD_WIDTH: int
+    _PT_LAYOUT: Layout
 
     def __init__(
         self,
@@ -72,62 +110,56 @@ class PackedAssembly(Assembly):
         )
         # Attempt to assign keyword values to fields
         for fname, fval in kwds.items():
-            try:
-                finst = getattr(self, fname)
-                if isinstance(finst, PackedArray):
-                    if not isinstance(fval, list) or len(fval) != len(finst):
-                        raise AssignmentError(
-                            f"Cannot assign value to field {fname} as it is an array "
-                            f"of {len(finst)} entries and the assigned value does "
-                            f"not have the same dimensions"
-                        )
-                    for sub_val, sub_field in zip(fval, finst, strict=False):
-                        sub_field._pt_set(sub_val)
-                else:
-                    finst._pt_set(fval)
-            except AttributeError as e:
+            if fname not in self._PT_DEF:
                 raise AssignmentError(
                     f"{type(self).__name__} does not contain a field called '{fname}'"
-                ) from e
+                )
+            finst = getattr(self, fname)
+            if isinstance(finst, PackedArray):
+                if not isinstance(fval, list) or len(fval) != len(finst):
+                    raise AssignmentError(
+                        f"Cannot assign value to field {fname} as it is an array "
+                        f"of {len(finst)} entries and the assigned value does "
+                        f"not have the same dimensions"
+                    )
+                for sub_val, sub_field in zip(fval, finst, strict=False):
+                    sub_field._pt_set(sub_val)
+            else:
+                finst._pt_set(fval)
 
     @property
-    @functools.lru_cache  # noqa: B019
     def _pt_fields(self) -> dict:
         base = super()._pt_fields
         if self._PT_PADDING > 0:
             base.update({self._padding: "_padding"})
         return base
 
-    def __getattribute__(self, fname: str):
-        # Attempt to resolve the attribute from existing properties
-        try:
-            return super().__getattribute__(fname)
-        # If that fails...
-        except AttributeError as e:
-            # Is this a known field that hasn't yet been instanced?
-            if fpair := type(self)._PT_DEF.get(fname, None):
-                ftype, fval = fpair
-                lsb, msb = self._PT_RANGES[fname]
-                window = self._pt_bv.create_window(msb, lsb)
-                if isinstance(ftype, ArraySpec):
-                    finst = ftype.as_packed(packing=self._PT_PACKING, _pt_bv=window)
-                else:
-                    finst = ftype(_pt_bv=window)
-                finst._PT_PARENT = self
-                self._pt_force_set(fname, finst)
-                # If a value was provided, assign it
-                if fval is not None:
-                    finst._pt_set(fval)
-                # Return it
-                return finst
-            # Is this the padding field?
-            elif fname == "_padding" and self._PT_PADDING > 0:
-                padding = Scalar[self._PT_PADDING](_pt_bv=self._pt_bv)
-                self._pt_force_set("_padding", padding)
-                return padding
-            # If not resolved, forward the attribute error
-            else:
-                raise e
+    def _pt_create_field(self, fname: str) -> Base:
+        lsb, msb = self._PT_RANGES[fname]
+        window = self._pt_bv.create_window(msb, lsb)
+        # Padding is exposed as a scalar
+        if fname == "_padding":
+            return self._PT_PADDING_TYPE(_pt_bv=window)
+        ftype, fval = self._PT_DEF[fname]
+        if isinstance(ftype, ArraySpec):
+            finst = ftype.as_packed(packing=self._PT_PACKING, _pt_bv=window)
+        else:
+            finst = ftype(_pt_bv=window)
+        finst._pt_parent = self
+        # If a value was provided, assign it
+        if fval is not None:
+            finst._pt_set(fval)
+        return finst
+
+    def _pt_get(self, fname: str) -> int:
+        """
+        Read the value of a field as an integer without constructing the field.
+
+        :param fname: Name of the field
+        :return: The field's value
+        """
+        lsb, msb = self._PT_RANGES[fname]
+        return self._pt_bv.extract(msb, lsb)
 
     def __str__(self) -> str:
         lines = [f"{type(self).__name__}: 0x{int(self):X}"]
@@ -167,13 +199,14 @@ class PackedAssembly(Assembly):
         # Create a rendering instance
         svg = SvgRender(cfg, left_annotation=type(self).__name__)
 
-        for _lsb, msb, (fname, finst) in self._pt_fields_flat():
+        for field in self._PT_LAYOUT.flat():
+            padding = field.name == "_padding"
             svg.attach(
                 SvgField(
-                    bit_width=finst._pt_width,
-                    name="" if fname == "_padding" else fname,
-                    msb=msb,
-                    style=ElementStyle.HATCHED if fname == "_padding" else ElementStyle.NORMAL,
+                    bit_width=field.width,
+                    name="" if padding else field.name,
+                    msb=field.msb,
+                    style=ElementStyle.HATCHED if padding else ElementStyle.NORMAL,
                 )
             )
 
@@ -184,7 +217,7 @@ class PackedAssembly(Assembly):
     def _pt_construct(cls, parent: Base, packing: Packing, width: int | None):
         cls._PT_PACKING = packing
         cls._PT_WIDTH = None if width is None else int(width)
-        cls._PT_RANGES = {}
+        cls._PT_FIELD_WIDTH = sum(width_of(ftype) for _, ftype, _ in cls._pt_definitions())
         # Check for oversized fields
         if cls._PT_WIDTH is None or cls._PT_WIDTH < 0:
             cls._PT_WIDTH = cls._pt_field_width()
@@ -194,81 +227,51 @@ class PackedAssembly(Assembly):
                 f"bits which does not fit within the specified width of "
                 f"{cls._PT_WIDTH} bits"
             )
-        # Place fields LSB -> MSB
-        if cls._PT_PACKING is Packing.FROM_LSB:
-            lsb = 0
-            for fname, ftype, _ in cls._pt_definitions():
-                # For arrays record each component placement separately
-                if isinstance(ftype, ArraySpec):
-                    for dimension, (part_msb, part_lsb) in ftype._pt_ranges(
-                        cls._PT_PACKING
-                    ).items():
-                        cls._PT_RANGES[fname, dimension] = (lsb + part_msb, lsb + part_lsb)
-                # For every field type (including arrays) record full placement
-                fwidth = ftype()._pt_width
-                cls._PT_RANGES[fname] = (lsb, lsb + fwidth - 1)
-                lsb += fwidth
-            # Insert padding
-            cls._PT_PADDING = max(0, cls._PT_WIDTH - lsb)
-            if cls._PT_PADDING > 0:
-                cls._PT_RANGES["_padding"] = (lsb, cls._PT_WIDTH - 1)
-        # Place fields MSB -> LSB
-        else:
-            msb = cls._PT_WIDTH - 1
-            for fname, ftype, _ in cls._pt_definitions():
-                # For arrays record each component placement separately
-                if isinstance(ftype, ArraySpec):
-                    root_lsb = msb - ftype._PT_WIDTH + 1
-                    for dimension, (part_msb, part_lsb) in ftype._pt_ranges(
-                        cls._PT_PACKING
-                    ).items():
-                        cls._PT_RANGES[fname, dimension] = (
-                            part_msb + root_lsb,
-                            part_lsb + root_lsb,
-                        )
-                # For every field type (including arrays) record full placement
-                fwidth = ftype()._pt_width
-                cls._PT_RANGES[fname] = (msb - fwidth + 1, msb)
-                msb -= fwidth
-            # Insert padding
-            cls._PT_PADDING = max(0, msb + 1)
-            if cls._PT_PADDING > 0:
-                cls._PT_RANGES["_padding"] = (0, msb)
+        # Place fields and padding purely from type metadata
+        cls._PT_LAYOUT = Layout.place(
+            ((fname, ftype) for fname, ftype, _ in cls._pt_definitions()),
+            cls._PT_PACKING,
+            cls._PT_WIDTH,
+        )
+        cls._PT_RANGES = LayoutRanges(cls._PT_LAYOUT)
+        padding = cls._PT_LAYOUT.padding
+        cls._PT_PADDING = 0 if padding is None else padding.width
+        cls._PT_PADDING_TYPE = None if padding is None else padding.ptype
+        cls._PT_MASK = (1 << cls._PT_WIDTH) - 1
+        # Attach descriptors for every field
+        cls._pt_attach_fields(cls._PT_DEF.keys())
+        if cls._PT_PADDING > 0:
+            cls._pt_attach_fields(["_padding"])
+
+    @classmethod
+    def _pt_layout(cls) -> Layout:
+        """
+        Return the class-level layout of this type, describing the placement of
+        every field (including padding) without creating any instances.
+
+        :return: The layout of this type
+        """
+        return cls._PT_LAYOUT
 
     @classmethod
-    @functools.cache
     def _pt_field_width(cls) -> int:
-        total_width = 0
-        for _, ftype, _ in cls._pt_definitions():
-            total_width += ftype()._pt_width
-        return total_width
+        return cls._PT_FIELD_WIDTH
 
     @property
     def _pt_width(self) -> int:
         return self._PT_WIDTH
 
     @property
-    @functools.cache  # noqa: B019
     def _pt_mask(self) -> int:
-        return (1 << self._PT_WIDTH) - 1
+        return self._PT_MASK
 
     @property
-    @functools.cache  # noqa: B019
     def _pt_fields_lsb_asc(self) -> list[tuple[int, int, tuple[str, Base]]]:
-        pairs = []
-        for finst, fname in self._pt_fields.items():
-            lsb, msb = self._PT_RANGES[fname]
-            pairs.append((lsb, msb, (fname, finst)))
-        return sorted(pairs, key=lambda x: x[0])
+        return [(x.lsb, x.msb, (x.name, getattr(self, x.name))) for x in self._PT_LAYOUT.lsb_asc]
 
     @property
-    @functools.cache  # noqa: B019
     def _pt_fields_msb_desc(self) -> list[tuple[int, int, tuple[str, Base]]]:
-        pairs = []
-        for finst, fname in self._pt_fields.items():
-            lsb, msb = self._PT_RANGES[fname]
-            pairs.append((lsb, msb, (fname, finst)))
-        return sorted(pairs, key=lambda x: x[1], reverse=True)
+        return [(x.lsb, x.msb, (x.name, getattr(self, x.name))) for x in self._PT_LAYOUT.msb_desc]
 
     def _pt_fields_flat(self, offset: int = 0) -> Iterable[tuple[int, int, tuple[str, Base]]]:
         """
@@ -278,29 +281,146 @@ class PackedAssembly(Assembly):
         :param offset: Offset to apply to the LSB and MSB values
         :return: List of tuples with (LSB, MSB, (field_name, field_instance))
         """
-        for lsb, msb, (fname, finst) in self._pt_fields_msb_desc:
-            if isinstance(finst, PackedAssembly):
-                yield from finst._pt_fields_flat(offset=offset + lsb)
+        for field in self._PT_LAYOUT.msb_desc:
+            if not field.is_array and issubclass(field.base, PackedAssembly):
+                yield from getattr(self, field.name)._pt_fields_flat(offset=offset + field.lsb)
             else:
-                yield (lsb + offset, msb + offset, (fname, finst))
+                yield (
+                    field.lsb + offset,
+                    field.msb + offset,
+                    (field.name, getattr(self, field.name)),
+                )
 
-    @functools.cache  # noqa: B019
-    def _pt_lsb(self, field: str) -> int:
-        return self._PT_RANGES[field][0]
+    def _pt_lsb(self, field: str, *index: int) -> int:
+        """
+        Return the LSB of a field, or of an element within an array field.
+
+        :param field: Name of the field
+        :param index: Optional index into each dimension of an array field
+        :return: The LSB
+        """
+        return self._PT_LAYOUT.element(field, *index)[0]
+
+    def _pt_msb(self, field: str, *index: int) -> int:
+        """
+        Return the MSB of a field, or of an element within an array field.
+
+        :param field: Name of the field
+        :param index: Optional index into each dimension of an array field
+        :return: The MSB
+        """
+        return self._PT_LAYOUT.element(field, *index)[1]
+
+    def _pt_track(self, enable: bool = True) -> None:
+        """
+        Start or stop recording which fields are written, any previous record
+        is discarded. Where the assembly is nested within another, tracking is
+        enabled for the outermost assembly as they share the same storage.
 
-    @functools.cache  # noqa: B019
-    def _pt_msb(self, field: str) -> int:
-        return self._PT_RANGES[field][1]
+        :param enable: Whether to record writes, defaults to True
+        """
+        self._pt_bv.track(enable)
+
+    def _pt_dirty_mask(self) -> int:
+        if (dirty := self._pt_bv.dirty) is None:
+            raise TrackingError(f"Writes to {type(self).__name__} are not being tracked")
+        return dirty
+
+    def _pt_is_dirty(self, field: str | None = None) -> bool:
+        """
+        Test whether the assembly, or a specific field, has been written since
+        tracking was enabled or the last checkpoint.
+
+        :param field: Optional name of the field to test
+        :return: True if any bit has been written, False otherwise
+        """
+        dirty = self._pt_dirty_mask()
+        if field is None:
+            return dirty != 0
+        lsb, msb = self._PT_RANGES[field]
+        return ((dirty >> lsb) & ((1 << (msb - lsb + 1)) - 1)) != 0
+
+    def _pt_dirty(self) -> list[str]:
+        """
+        List the fields that have been written since tracking was enabled or the
+        last checkpoint, in declaration order.
+
+        :return: Names of the fields that have been written
+        """
+        if not (dirty := self._pt_dirty_mask()):
+            return []
+        return [
+            x.name
+            for x in self._PT_LAYOUT.fields
+            if x.name != "_padding" and (dirty >> x.lsb) & ((1 << x.width) - 1)
+        ]
+
+    def _pt_checkpoint(self) -> None:
+        """Clear the record of which fields have been written"""
+        self._pt_dirty_mask()
+        self._pt_bv.clear_dirty()
 
     def _pt_pack(self) -> int:
         return int(self._pt_bv)
 
+    @classmethod
+    def _pt_codec(cls) -> AssemblyCodec:
+        """
+        Return the codec for this type, which decodes packed integers into named
+        tuples of field values and encodes field values into packed integers
+        without creating any Packtype instances. The codec is built on first use
+        and then reused.
+
+        :return: The codec for this type
+        """
+        if (codec := cls.__dict__.get("_PT_CODEC", None)) is None:
+            codec = cls._PT_CODEC = AssemblyCodec(cls)
+        return codec
+
     @classmethod
     def _pt_unpack(cls, packed: int) -> "PackedAssembly":
         inst = cls()
         inst._pt_set(packed)
         return inst
 
+    @classmethod
+    def _pt_iter(
+        cls, values: Iterable[Any], byteorder: str = "little"
+    ) -> Iterator["PackedAssembly"]:
+        """
+        Iterate through a stream of packed values using a single instance (a
+        cursor) that is repositioned onto each value in turn, rather than
+        constructing a new instance for every value. Field instances and the
+        windows behind them are created once and then reused for every value,
+        so examining a few fields of each record is cheap.
+
+        The same instance is yielded for every value and is overwritten when
+        the iteration advances, so any record that needs to be kept must be
+        copied out using `_pt_copy()`.
+
+        :param values:    Iterable of packed integers, or of bytes-like objects
+                          holding each packed value
+        :param byteorder: Order of the bytes when values are bytes-like
+        :return: Iterator yielding the cursor positioned on each value
+        """
+        cursor = cls()
+        bitvector = cursor._pt_bv
+        for value in values:
+            if isinstance(value, bytes | bytearray | memoryview):
+                bitvector.set_bytes(value, byteorder)
+            else:
+                bitvector.set(value)
+            yield cursor
+
+    def _pt_copy(self) -> "PackedAssembly":
+        """
+        Return an independent instance holding the same value, for example to
+        keep a record yielded by `_pt_iter()`.
+
+        :return: The copy
+        """
+        return type(self)._pt_unpack(int(self))
+
     def __int__(self) -> int:
         return self._pt_pack()
 
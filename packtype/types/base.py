@@ -4,7 +4,7 @@
 
 import functools
 from collections import defaultdict
-from typing import Any
+from typing import Any, Literal
 
 try:
     from typing import Self
@@ -16,14 +16,128 @@ from ordered_set import OrderedSet as OSet
 from .alias import MetaAlias
 from .array import ArraySpec
 from .bitvector import BitVector
+from .serial import from_bytes, to_bytes
+
+
+class DeferredAttribute:
+    """
+    Placeholder for a class attribute of a type whose construction has been
+    deferred, which shadows any default inherited from the base type and
+    completes construction when first read.
+
+    :param name: Name of the attribute
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        complete_construction(owner)
+        return getattr(owner if obj is None else obj, self.name)
+
+
+def _deferred_init(self, *args, **kwds) -> None:
+    complete_construction(type(self))
+    type(self).__init__(self, *args, **kwds)
+
+
+@functools.cache
+def _deferrable_attributes(base: type) -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            {x for c in base.__mro__ for x in vars(c) if x.startswith("_PT_")} - _STATIC_ATTRIBUTES
+        )
+    )
+
+
+def defer_construction(
+    base: type, namespace: dict[str, Any], parent: Any, attrs: dict[str, Any]
+) -> None:
+    """
+    Prepare the namespace of a type so that its construction is deferred until
+    it is first instantiated or introspected. Attributes that construction
+    would replace are shadowed by placeholders, any attribute that construction
+    would add is caught by the metaclass, and instantiation is intercepted.
+
+    :param base:      The base type being derived from
+    :param namespace: Namespace of the type being created, modified in place
+    :param parent:    Parent to pass through to construction
+    :param attrs:     Attributes to pass through to construction
+    """
+    stashed = {"_PT_DEF": namespace.pop("_PT_DEF")}
+    for name in _deferrable_attributes(base):
+        if name not in namespace:
+            namespace[name] = DeferredAttribute(name)
+    namespace["_PT_DEF"] = DeferredAttribute("_PT_DEF")
+    namespace["_PT_DEFERRED"] = (parent, attrs, stashed)
+    namespace["__init__"] = _deferred_init
+
+
+def complete_construction(cls: type) -> bool:
+    """
+    Complete the construction of a type (or the type it derives from) if it
+    was deferred, does nothing for types that are already constructed.
+
+    :param cls: The type to construct
+    :return: True if construction was completed, False otherwise
+    """
+    for owner in cls.__mro__:
+        if (pending := owner.__dict__.get("_PT_DEFERRED", None)) is not None:
+            break
+    else:
+        return False
+    parent, attrs, stashed = pending
+    for name, value in list(owner.__dict__.items()):
+        if isinstance(value, DeferredAttribute):
+            delattr(owner, name)
+    del owner._PT_DEFERRED
+    del owner.__init__
+    for name, value in stashed.items():
+        setattr(owner, name, value)
+    owner._pt_construct(parent, **attrs)
+    return True
 
 
 class MetaBase(type):
     def __getitem__(cls, key: int):
         return ArraySpec(cls, key)
 
+    def __getattr__(cls, name: str) -> Any:
+        # Attributes added during construction (e.g. fields or enum values) are
+        # missing from types whose construction has been deferred
+        if name.startswith("__") or not complete_construction(cls):
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        return getattr(cls, name)
+
+
+# Class attributes describing how a type is declared, which are not replaced
+# during construction so never need to be deferred
+_STATIC_ATTRIBUTES = frozenset(
+    (
+        "_PT_ALLOW_DEFAULTS",
+        "_PT_ATTACH",
+        "_PT_ATTACHED_TO",
+        "_PT_ATTRIBUTES",
+        "_PT_BASE",
+        "_PT_DEFERRABLE",
+        "_PT_META_USE_TYPE",
+        "_PT_PROFILING",
+        "_PT_PROFILING_ENABLED",
+        "_PT_SOURCE",
+    )
+)
+
 
 class Base(metaclass=MetaBase):
+    # NOTE: Instances only carry a handle to their storage and (optionally) to
+    #       their parent, all other state lives on the class. A dictionary is
+    #       still available for the rare instances that carry extra metadata
+    #       (e.g. a docstring or the package they are attached to), but it is
+    #       only allocated when first written to.
+    __slots__ = ("__dict__", "__parent", "_pt_bv")
+
     # The base class type
     _PT_BASE: type["Base"] | None = None
     # Substitute type for metaclass
@@ -42,17 +156,20 @@ class Base(metaclass=MetaBase):
     _PT_DEF: dict[str, tuple[type["Base"], Any]] = {}
     # Tuple of source file and line number where the type is defined
     _PT_SOURCE: tuple[str, int] = ("?", 0)
+    # Whether construction of the type may be deferred until it is first used
+    _PT_DEFERRABLE: bool = True
     # Handle to parent
     _PT_PARENT: Self = None
-    # Profiling
+    # Profiling (only counted once enabled)
     _PT_PROFILING: dict[str, int] = defaultdict(lambda: 0)
+    _PT_PROFILING_ENABLED: bool = False
 
     def __init__(self, _pt_bv: BitVector | None = None, default: int | None = None) -> None:
+        if _pt_bv is None:
+            _pt_bv = BitVector(width=self._PT_WIDTH, value=0 if default is None else default)
         self._pt_bv = _pt_bv
-        if self._pt_bv is None:
-            self._pt_bv = BitVector(width=self._PT_WIDTH)
-            self._pt_bv.set(0 if default is None else default)
-        self._PT_PROFILING[type(self).__name__] += 1
+        if Base._PT_PROFILING_ENABLED:
+            Base._PT_PROFILING[type(self).__name__] += 1
 
     @classmethod
     def _pt_construct(cls, parent: Self | None = None, **_kwds):
@@ -64,7 +181,6 @@ class Base(metaclass=MetaBase):
         return cls.__name__
 
     @classmethod
-    @functools.cache
     def _pt_definitions(cls) -> list[str, Any]:
         return [(n, t, d) for n, (t, d) in cls._PT_DEF.items()]
 
@@ -76,7 +192,7 @@ class Base(metaclass=MetaBase):
             return OSet()
 
     @classmethod
-    def _pt_references(cls) -> list[type["Base"]]:
+    def _pt_dependencies(cls) -> OSet:
         def _unwrap(obj):
             # Unwrap arrays
             if isinstance(obj, ArraySpec):
@@ -86,20 +202,36 @@ class Base(metaclass=MetaBase):
                 obj = obj._PT_ALIAS
             return obj
 
-        # Else iterate through core fields
+        # Types directly referenced by core fields and then by attached fields
+        return OSet(map(_unwrap, [*cls._pt_field_types(), *(cls._PT_ATTACH or [])]))
+
+    @classmethod
+    def _pt_references(cls) -> OSet:
+        # NOTE: Walks the graph of dependencies depth-first, visiting each type
+        #       only once, so that every type is listed after all of the types
+        #       that it references (i.e. in topological order)
         collect = OSet()
-        for ftype in map(_unwrap, cls._pt_field_types()):
-            collect.update(ftype._pt_references())
-            collect.add(ftype)
-        # ...and through attached fields
-        for field in map(_unwrap, cls._PT_ATTACH or []):
-            collect.update(field._pt_references())
-            collect.add(field)
+
+        def _visit(obj):
+            for dep in obj._pt_dependencies():
+                if dep not in collect:
+                    _visit(dep)
+                    collect.add(dep)
+
+        _visit(cls)
         return collect
 
     @property
     def _pt_parent(self) -> Self:
-        return self._PT_PARENT
+        # Fallback to the parent of the type if the instance is not attached
+        try:
+            return self.__parent
+        except AttributeError:
+            return self._PT_PARENT
+
+    @_pt_parent.setter
+    def _pt_parent(self, parent: Self) -> None:
+        self.__parent = parent
 
     @classmethod
     def _pt_enable_profiling(cls, limit: int = 1) -> None:
@@ -110,6 +242,8 @@ class Base(metaclass=MetaBase):
         """
         import atexit
 
+        Base._PT_PROFILING_ENABLED = True
+
         def _list_objs():
             print("Packtype object creation counts:")  # noqa: T201
             for obj, cnt in sorted(Base._PT_PROFILING.items(), key=lambda x: x[1], reverse=True):
@@ -117,3 +251,46 @@ class Base(metaclass=MetaBase):
                     print(f"{cnt:10d}: {obj}")  # noqa: T201
 
         atexit.register(_list_objs)
+
+    def _pt_to_bytes(
+        self,
+        byteorder: Literal["little", "big"] = "little",
+        bitorder: Literal["msb", "lsb"] = "msb",
+        padding: Literal["msb", "lsb"] = "msb",
+    ) -> bytes:
+        """
+        Serialise the packed value into the minimum number of whole bytes,
+        taking the bytes directly from storage where possible rather than
+        building an intermediate integer.
+
+        :param byteorder: Order of the bytes, either "little" or "big"
+        :param bitorder:  Order of the bits within each byte, either "msb" (bit
+                          7 is the most significant) or "lsb" (bit 0 is)
+        :param padding:   Where padding bits are placed to fill the final byte,
+                          either "msb" (zero-extended) or "lsb" (left-aligned)
+        :return: The serialised value
+        """
+        return to_bytes(self._pt_bv, byteorder, bitorder, padding)
+
+    @classmethod
+    def _pt_from_bytes(
+        cls,
+        data: Any,
+        byteorder: Literal["little", "big"] = "little",
+        bitorder: Literal["msb", "lsb"] = "msb",
+        padding: Literal["msb", "lsb"] = "msb",
+    ) -> Self:
+        """
+        Create an instance from a serialised value, the inverse of
+        `_pt_to_bytes`.
+
+        :param data:      Any object supporting the buffer protocol holding
+                          exactly the number of bytes needed for the width
+        :param byteorder: Order of the bytes, either "little" or "big"
+        :param bitorder:  Order of the bits within each byte, either "msb" or "lsb"
+        :param padding:   Where padding bits are placed, either "msb" or "lsb"
+        :return: The new instance
+        """
+        inst = cls()
+        from_bytes(inst._pt_bv, data, byteorder, bitorder, padding)
+        return inst
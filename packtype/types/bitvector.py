@@ -2,9 +2,14 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import functools
+import sys
+from array import array
 from math import ceil, log2
 
+# Bit vectors of this width or wider are backed by 64-bit limbs rather than a
+# single integer (see LimbBitVector), set to None to disable limb storage
+LIMB_THRESHOLD: int | None = 4096
+
 
 class BitVector:
     """
@@ -16,9 +21,28 @@ class BitVector:
     :param value: Initial value for the bit vector, defaults to 0
     """
 
+    __slots__ = ("__dirty", "__value", "__width", "__windows")
+
+    def __new__(cls, width: int | None = None, value: int = 0) -> "BitVector":
+        del value
+        # Substitute the limb backed storage for very wide bit vectors
+        if (
+            cls is BitVector
+            and width is not None
+            and LIMB_THRESHOLD is not None
+            and width >= LIMB_THRESHOLD
+        ):
+            cls = LimbBitVector
+        return super().__new__(cls)
+
     def __init__(self, width: int | None = None, value: int = 0) -> None:
         self.__width = width
-        self.set(value)
+        # NOTE: The window cache is only allocated once a window is requested,
+        #       as most bit vectors back a leaf value and never need one
+        self.__windows = None
+        # NOTE: Subclasses holding their value elsewhere may skip initialisation
+        if value is not None:
+            self.set(value)
 
     @property
     def width(self) -> int:
@@ -33,22 +57,28 @@ class BitVector:
     def __int__(self) -> int:
         return self.__value
 
-    @functools.lru_cache  # noqa: B019
     def create_window(self, msb: int, lsb: int) -> "BitVectorWindow":
         """
         Create a window into a section of the bit vector that can be used to
         either project a value from a wider range or update a specific part of
-        the full bit vector.
+        the full bit vector. Windows are held by the bit vector so that repeated
+        requests for the same range return the same window.
 
         :param msb: MSB of the window
         :param lsb: LSB of the window
         :returns:   A BitVectorWindow matching the request
         """
-        assert self.__width is None or msb < self.__width, (
-            f"MSB of {msb} exceeds width {self.__width}"
-        )
-        assert lsb >= 0, f"LSB of {lsb} is not supported"
-        return BitVectorWindow(self, msb, lsb)
+        if self.__windows is None:
+            self.__windows = {}
+        try:
+            return self.__windows[msb, lsb]
+        except KeyError:
+            assert self.__width is None or msb < self.__width, (
+                f"MSB of {msb} exceeds width {self.__width}"
+            )
+            assert lsb >= 0, f"LSB of {lsb} is not supported"
+            window = self.__windows[msb, lsb] = BitVectorWindow(self, msb, lsb)
+            return window
 
     def extract(self, msb: int, lsb: int) -> int:
         """
@@ -74,7 +104,7 @@ class BitVector:
         if (
             self.__width is not None
             and self.__width >= 0
-            and (value < 0 or value > (1 << self.__width))
+            and (value < 0 or value >= (1 << self.__width))
         ):
             raise ValueError(
                 f"{value} is out of {self.__width} bit range (0 to {(1 << self.__width) - 1})"
@@ -99,6 +129,351 @@ class BitVector:
             inv_mask = ((1 << width) - 1) ^ mask
             self.__value = (self.__value & inv_mask) | ((value << lsb) & mask)
 
+    def to_bytes(self, size: int, byteorder: str = "little") -> bytes:
+        """
+        Return the value of the bit vector as bytes.
+
+        :param size:      Number of bytes to produce
+        :param byteorder: Order of the bytes, either "little" or "big"
+        :returns:         The encoded value
+        """
+        return self.value.to_bytes(size, byteorder)
+
+    def set_bytes(self, data: bytes, byteorder: str = "little") -> None:
+        """
+        Set the value of the bit vector from bytes, any bits beyond the width of
+        the bit vector are discarded.
+
+        :param data:      Any object supporting the buffer protocol
+        :param byteorder: Order of the bytes, either "little" or "big"
+        """
+        value = int.from_bytes(data, byteorder)
+        width = self.__width
+        if width is not None and width >= 0 and value >> width:
+            value &= (1 << width) - 1
+        self.set(value)
+
+    @property
+    def tracking(self) -> bool:
+        """Return whether writes to the bit vector are being recorded"""
+        return False
+
+    @property
+    def dirty(self) -> int | None:
+        """
+        Return a mask of the bits written since tracking was enabled or the
+        record was last cleared, or None if writes are not being tracked.
+        """
+        return self.__dirty if self.tracking else None
+
+    def track(self, enable: bool = True) -> None:
+        """
+        Start or stop recording which bits of the vector are written. When not
+        tracking, writes take exactly the same path as they would otherwise so
+        that there is no cost to the feature when it is unused.
+
+        :param enable: Whether to record writes, defaults to True
+        """
+        self.__dirty = 0
+        self.__class__ = (_TRACKED if enable else _UNTRACKED)[type(self)]
+
+    def clear_dirty(self, msb: int | None = None, lsb: int | None = None) -> None:
+        """
+        Clear the record of written bits, either entirely or for a window.
+
+        :param msb: MSB of the window to clear, defaults to width - 1
+        :param lsb: LSB of the window to clear, defaults to 0
+        """
+        if not self.tracking:
+            return
+        if msb is None and lsb is None:
+            self.__dirty = 0
+        else:
+            self.__dirty &= ~self._range_mask(msb, lsb)
+
+    def _mark_dirty(self, msb: int | None, lsb: int | None) -> None:
+        self.__dirty |= self._range_mask(msb, lsb)
+
+    def _range_mask(self, msb: int | None, lsb: int | None) -> int:
+        lsb = lsb if lsb is not None else 0
+        if msb is None:
+            # NOTE: Unsized vectors (e.g. constants) are bounded by their value
+            width = self.width
+            if width is None or width < 0:
+                width = max(1, int(self).bit_length())
+            msb = width - 1
+        return ((1 << (msb - lsb + 1)) - 1) << lsb
+
+
+class LimbBitVector(BitVector):
+    """
+    Bit vector storing its value as fixed 64-bit limbs rather than as a single
+    integer. Writing to a window of a plain bit vector rebuilds the entire
+    integer, which becomes expensive for very wide vectors, whereas here only
+    the limbs that overlap the window are touched. The integer value is only
+    assembled when it is requested, and is then held until the next write.
+
+    :param width: Width of the bit vector
+    :param value: Initial value for the bit vector, defaults to 0
+    """
+
+    __slots__ = ("__cached", "__limbs")
+
+    def __init__(self, width: int, value: int = 0) -> None:
+        self.__limbs = array("Q", bytes(8 * ((width + 63) // 64)))
+        self.__cached = 0
+        super().__init__(width=width, value=value)
+
+    @property
+    def value(self) -> int:
+        """Return the bit vector value"""
+        if self.__cached is None:
+            self.__cached = _from_limbs(self.__limbs)
+        return self.__cached
+
+    def __int__(self) -> int:
+        return self.value
+
+    def extract(self, msb: int, lsb: int) -> int:
+        """
+        Extract a specific window of the bit vector.
+
+        :param msb: MSB of the window
+        :param lsb: LSB of the window
+        :returns:   Value extracted from the window
+        """
+        first, offset, last = lsb >> 6, lsb & 63, msb >> 6
+        mask = (1 << (msb - lsb + 1)) - 1
+        if first == last:
+            return (self.__limbs[first] >> offset) & mask
+        return (_from_limbs(self.__limbs[first : last + 1]) >> offset) & mask
+
+    def set(self, value: int, msb: int | None = None, lsb: int | None = None) -> None:
+        """
+        Set the value of a specific window of the bit vector.
+
+        :param value: Value to set
+        :param msb:   MSB of the window, defaults to width - 1
+        :param lsb:   LSB of the window, defaults to 0
+        """
+        value = int(value)
+        width = self.width
+        # NOTE: The bit length is tested first to avoid building a wide integer
+        if value < 0 or (value.bit_length() > width and value >= (1 << width)):
+            raise ValueError(f"{value} is out of {width} bit range (0 to {(1 << width) - 1})")
+        limbs = self.__limbs
+        # If no MSB/LSB provided, overwrite every limb
+        if msb is None and lsb is None:
+            value &= (1 << width) - 1
+            self.__limbs = _to_limbs(value, len(limbs))
+            self.__cached = value
+            return
+        # Default LSB/MSB
+        lsb = lsb if lsb is not None else 0
+        msb = msb if msb is not None else (width - 1)
+        assert msb < width, f"MSB of {msb} exceeds width {width}"
+        assert lsb >= 0, f"LSB of {lsb} is not supported"
+        # Update only the limbs that overlap the window
+        self.__cached = None
+        first, offset, last = lsb >> 6, lsb & 63, msb >> 6
+        mask = (1 << (msb - lsb + 1)) - 1
+        value &= mask
+        if first == last:
+            mask <<= offset
+            limbs[first] = (limbs[first] & ~mask) | (value << offset)
+        else:
+            span = _from_limbs(limbs[first : last + 1])
+            span = (span & ~(mask << offset)) | (value << offset)
+            limbs[first : last + 1] = _to_limbs(span, last - first + 1)
+
+    def to_bytes(self, size: int, byteorder: str = "little") -> bytes:
+        """
+        Return the value of the bit vector as bytes, copied directly from the
+        limbs rather than via an integer.
+
+        :param size:      Number of bytes to produce
+        :param byteorder: Order of the bytes, either "little" or "big"
+        :returns:         The encoded value
+        """
+        if sys.byteorder != "little" or size < (self.width + 7) // 8:
+            return super().to_bytes(size, byteorder)
+        data = self.__limbs.tobytes()
+        data = data[:size] if size <= len(data) else data + bytes(size - len(data))
+        return data if byteorder == "little" else data[::-1]
+
+    def set_bytes(self, data: bytes, byteorder: str = "little") -> None:
+        """
+        Set the value of the bit vector from bytes, copied directly into the
+        limbs rather than via an integer. Any bits beyond the width of the bit
+        vector are discarded.
+
+        :param data:      Any object supporting the buffer protocol
+        :param byteorder: Order of the bytes, either "little" or "big"
+        """
+        if sys.byteorder != "little":
+            return super().set_bytes(data, byteorder)
+        data = bytes(data)
+        if byteorder != "little":
+            data = data[::-1]
+        size = 8 * len(self.__limbs)
+        limbs = array("Q", data[:size] if len(data) >= size else data + bytes(size - len(data)))
+        if top := self.width % 64:
+            limbs[-1] &= (1 << top) - 1
+        self.__limbs = limbs
+        self.__cached = None
+
+
+def _from_limbs(limbs: array) -> int:
+    if sys.byteorder != "little":
+        limbs = array("Q", limbs)
+        limbs.byteswap()
+    return int.from_bytes(limbs.tobytes(), "little")
+
+
+def _to_limbs(value: int, count: int) -> array:
+    limbs = array("Q", value.to_bytes(8 * count, "little"))
+    if sys.byteorder != "little":
+        limbs.byteswap()
+    return limbs
+
+
+class BufferBitVector(BitVector):
+    """
+    Bit vector whose value lives in a region of an external buffer (such as a
+    bytearray, mmap, or NumPy array) rather than in a Python integer, so that
+    every read and write goes directly to the buffer's memory. Only the bytes
+    that overlap a field are touched by each access, and bits beyond the width
+    within the final byte are preserved.
+
+    :param memory:    Byte-format memoryview of the region holding the value,
+                      which must be at least ceil(width / 8) bytes long
+    :param width:     Width of the bit vector
+    :param byteorder: Order of the bytes in the buffer, either "little" or "big"
+    """
+
+    __slots__ = ("__memory", "__order", "__size")
+
+    def __new__(cls, *_args, **_kwds) -> "BufferBitVector":
+        return object.__new__(cls)
+
+    def __init__(self, memory: memoryview, width: int, byteorder: str = "little") -> None:
+        self.__size = (width + 7) // 8
+        self.__memory = memory[: self.__size]
+        self.__order = byteorder
+        super().__init__(width=width, value=None)
+
+    @property
+    def memory(self) -> memoryview:
+        """Return the region of the buffer holding the value"""
+        return self.__memory
+
+    @property
+    def value(self) -> int:
+        """Return the bit vector value"""
+        value = int.from_bytes(self.__memory, self.__order)
+        return value & ((1 << self.width) - 1) if self.width & 7 else value
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __span(self, msb: int, lsb: int) -> slice:
+        if self.__order == "little":
+            return slice(lsb >> 3, (msb >> 3) + 1)
+        return slice(self.__size - 1 - (msb >> 3), self.__size - (lsb >> 3))
+
+    def extract(self, msb: int, lsb: int) -> int:
+        """
+        Extract a specific window of the bit vector.
+
+        :param msb: MSB of the window
+        :param lsb: LSB of the window
+        :returns:   Value extracted from the window
+        """
+        span = int.from_bytes(self.__memory[self.__span(msb, lsb)], self.__order)
+        return (span >> (lsb & 7)) & ((1 << (msb - lsb + 1)) - 1)
+
+    def set(self, value: int, msb: int | None = None, lsb: int | None = None) -> None:
+        """
+        Set the value of a specific window of the bit vector.
+
+        :param value: Value to set
+        :param msb:   MSB of the window, defaults to width - 1
+        :param lsb:   LSB of the window, defaults to 0
+        """
+        value = int(value)
+        width = self.width
+        if value < 0 or (value.bit_length() > width and value >= (1 << width)):
+            raise ValueError(f"{value} is out of {width} bit range (0 to {(1 << width) - 1})")
+        lsb = lsb if lsb is not None else 0
+        msb = msb if msb is not None else (width - 1)
+        assert msb < width, f"MSB of {msb} exceeds width {width}"
+        assert lsb >= 0, f"LSB of {lsb} is not supported"
+        span = self.__span(msb, lsb)
+        size = span.stop - span.start
+        mask = (1 << (msb - lsb + 1)) - 1
+        # Byte aligned windows are written without reading the buffer
+        if not (lsb & 7) and not ((msb + 1) & 7):
+            self.__memory[span] = (value & mask).to_bytes(size, self.__order)
+            return
+        shift = lsb & 7
+        mask <<= shift
+        current = int.from_bytes(self.__memory[span], self.__order)
+        current = (current & ~mask) | ((value << shift) & mask)
+        self.__memory[span] = current.to_bytes(size, self.__order)
+
+    def set_bytes(self, data: bytes, byteorder: str = "little") -> None:
+        """
+        Set the value of the bit vector from bytes, any bits beyond the width of
+        the bit vector are discarded.
+
+        :param data:      Any object supporting the buffer protocol
+        :param byteorder: Order of the bytes, either "little" or "big"
+        """
+        self.set(int.from_bytes(data, byteorder) & ((1 << self.width) - 1))
+
+
+class _Tracked:
+    """Records the range of every write to a bit vector (see BitVector.track)"""
+
+    __slots__ = ()
+
+    @property
+    def tracking(self) -> bool:
+        return True
+
+    def set(self, value: int, msb: int | None = None, lsb: int | None = None) -> None:
+        super().set(value, msb, lsb)
+        self._mark_dirty(msb, lsb)
+
+    def set_bytes(self, data: bytes, byteorder: str = "little") -> None:
+        super().set_bytes(data, byteorder)
+        self._mark_dirty(None, None)
+
+
+class TrackedBitVector(_Tracked, BitVector):
+    __slots__ = ()
+
+
+class TrackedLimbBitVector(_Tracked, LimbBitVector):
+    __slots__ = ()
+
+
+class TrackedBufferBitVector(_Tracked, BufferBitVector):
+    __slots__ = ()
+
+
+# Mappings used to switch a bit vector in and out of tracking
+_TRACKED = {
+    BitVector: TrackedBitVector,
+    LimbBitVector: TrackedLimbBitVector,
+    BufferBitVector: TrackedBufferBitVector,
+    TrackedBitVector: TrackedBitVector,
+    TrackedLimbBitVector: TrackedLimbBitVector,
+    TrackedBufferBitVector: TrackedBufferBitVector,
+}
+_UNTRACKED = {y: x for x, y in _TRACKED.items() if x is not y}
+_UNTRACKED.update({x: x for x in _UNTRACKED.values()})
+
 
 class BitVectorWindow:
     """
@@ -110,6 +485,8 @@ class BitVectorWindow:
     :param lsb:       LSB of the window
     """
 
+    __slots__ = ("__bitvector", "__lsb", "__msb")
+
     def __init__(self, bitvector: BitVector, msb: int, lsb: int) -> None:
         self.__bitvector = bitvector
         self.__msb = msb
@@ -160,3 +537,60 @@ class BitVectorWindow:
         assert lsb >= 0, f"LSB of {lsb} is not supported"
         assert msb < self.width, f"MSB of {msb} is not supported"
         return self.__bitvector.set(value, msb + self.__lsb, lsb + self.__lsb)
+
+    def to_bytes(self, size: int, byteorder: str = "little") -> bytes:
+        """
+        Return the value of the window as bytes.
+
+        :param size:      Number of bytes to produce
+        :param byteorder: Order of the bytes, either "little" or "big"
+        :returns:         The encoded value
+        """
+        return int(self).to_bytes(size, byteorder)
+
+    def set_bytes(self, data: bytes, byteorder: str = "little") -> None:
+        """
+        Set the value of the window from bytes, any bits beyond the width of the
+        window are discarded.
+
+        :param data:      Any object supporting the buffer protocol
+        :param byteorder: Order of the bytes, either "little" or "big"
+        """
+        self.set(int.from_bytes(data, byteorder) & ((1 << self.width) - 1))
+
+    @property
+    def tracking(self) -> bool:
+        """Return whether writes to the underlying bit vector are being recorded"""
+        return self.__bitvector.tracking
+
+    @property
+    def dirty(self) -> int | None:
+        """
+        Return a mask of the bits within the window that have been written since
+        tracking was enabled or the record was last cleared, or None if writes
+        are not being tracked.
+        """
+        dirty = self.__bitvector.dirty
+        if dirty is None:
+            return None
+        return (dirty >> self.__lsb) & ((1 << self.width) - 1)
+
+    def track(self, enable: bool = True) -> None:
+        """
+        Start or stop recording writes, note that this applies to the entire
+        underlying bit vector and not just the window.
+
+        :param enable: Whether to record writes, defaults to True
+        """
+        self.__bitvector.track(enable)
+
+    def clear_dirty(self, msb: int | None = None, lsb: int | None = None) -> None:
+        """
+        Clear the record of written bits within the window, or a sub-window.
+
+        :param msb: MSB of the sub-window to clear, defaults to width - 1
+        :param lsb: LSB of the sub-window to clear, defaults to 0
+        """
+        msb = (self.width - 1) if msb is None else msb
+        lsb = 0 if lsb is None else lsb
+        self.__bitvector.clear_dirty(msb + self.__lsb, lsb + self.__lsb)
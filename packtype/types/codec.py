@@ -0,0 +1,327 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import keyword
+from collections import namedtuple
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from .alias import Alias
+from .array import ArraySpec
+from .packing import Packing
+
+
+class CodecError(Exception):
+    pass
+
+
+class Codec:
+    """
+    Stateless encoder/decoder for a packed type that works purely on integers,
+    never constructing a Packtype instance. Codecs are built once per type from
+    its layout and can then be reused indefinitely.
+
+    :param width: Width of the packed type in bits
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self.mask = (1 << width) - 1
+
+    def decode(self, packed: int) -> Any:
+        """
+        Decode a packed integer into its field values.
+
+        :param packed: The packed value
+        :returns:      The decoded value
+        """
+        raise NotImplementedError("Subclass must implement decode")
+
+    def encode(self, *args, **kwds) -> int:
+        """
+        Encode field values into a packed integer.
+
+        :returns: The packed value
+        """
+        raise NotImplementedError("Subclass must implement encode")
+
+    def encode_any(self, value: Any) -> int:
+        """
+        Encode a value which may already be packed (an integer or a Packtype
+        instance), a mapping of field names to values, or a sequence of values.
+
+        :param value: The value to encode
+        :returns:     The packed value
+        """
+        if value.__class__ is int:
+            if not 0 <= value <= self.mask:
+                raise CodecError(f"Value {value} cannot be represented by {self.width} bits")
+            return value
+        elif isinstance(value, Mapping):
+            return self.encode(**value)
+        elif isinstance(value, tuple | list):
+            return self.encode(*value)
+        else:
+            return self.encode_any(int(value))
+
+
+class LeafCodec(Codec):
+    """Codec for scalars, enums, and constants which decode to a plain integer"""
+
+    def decode(self, packed: int) -> int:
+        return packed & self.mask
+
+    def encode(self, value: int) -> int:
+        return self.encode_any(value)
+
+    def encode_any(self, value: Any) -> int:
+        value = int(value)
+        if not 0 <= value <= self.mask:
+            raise CodecError(f"Value {value} cannot be represented by {self.width} bits")
+        return value
+
+
+class ArrayCodec(Codec):
+    """
+    Codec for packed arrays which decode to (nested) tuples of element values.
+
+    :param spec:    The array specification
+    :param packing: Packing order of the elements
+    """
+
+    def __init__(self, spec: ArraySpec, packing: Packing = Packing.FROM_LSB) -> None:
+        super().__init__(spec._PT_WIDTH)
+        dimension, *remaining = spec.dimensions
+        # Each entry of the outermost dimension is either an element or a row
+        if remaining:
+            self.entry = ArrayCodec(ArraySpec(spec.base, tuple(remaining)), packing)
+        else:
+            self.entry = get_codec(spec.base, packing)
+        self.count = dimension
+        stepping = self.entry.width
+        if packing is Packing.FROM_LSB:
+            self.shifts = tuple(idx * stepping for idx in range(dimension))
+        else:
+            self.shifts = tuple(self.width - (idx + 1) * stepping for idx in range(dimension))
+
+    def decode(self, packed: int) -> tuple:
+        mask = self.entry.mask
+        if isinstance(self.entry, LeafCodec):
+            return tuple([(packed >> x) & mask for x in self.shifts])
+        else:
+            decode = self.entry.decode
+            return tuple([decode((packed >> x) & mask) for x in self.shifts])
+
+    def encode(self, values: Any) -> int:
+        if len(values) != self.count:
+            raise CodecError(
+                f"Expected {self.count} entries for an array but {len(values)} were provided"
+            )
+        encode = self.entry.encode_any
+        packed = 0
+        for value, shift in zip(values, self.shifts, strict=True):
+            packed |= encode(value) << shift
+        return packed
+
+    def encode_any(self, value: Any) -> int:
+        if isinstance(value, tuple | list):
+            return self.encode(value)
+        return super().encode_any(value)
+
+
+class AssemblyCodec(Codec):
+    """
+    Codec for packed assemblies (structs and registers) which decode to a named
+    tuple containing one entry per field, with nested assemblies and arrays
+    decoded recursively. The decode and encode functions are generated from the
+    layout of the type so that each field is a single shift and mask.
+
+    :param ptype: The packed assembly type
+    """
+
+    def __init__(self, ptype: Any) -> None:
+        super().__init__(ptype._PT_WIDTH)
+        self.fields = tuple(ptype._PT_DEF.keys())
+        self.tuple_type = namedtuple(ptype.__name__, self.fields, rename=True)
+        # Field names are used directly as arguments to the generated encoder
+        # unless they could clash with Python keywords or generated names
+        self._arg_names = {
+            x: x if x.isidentifier() and not keyword.iskeyword(x) and x[0] != "_" else f"_a{i}"
+            for i, x in enumerate(self.fields)
+        }
+        self._remap = any(x != y for x, y in self._arg_names.items())
+        namespace = {"_T": self.tuple_type, "_leaf": _encode_leaf}
+        dec_terms = []
+        enc_params = []
+        enc_lines = []
+        enc_terms = []
+        for idx, (fname, (ftype, fval)) in enumerate(ptype._PT_DEF.items()):
+            lsb, msb = ptype._PT_RANGES[fname]
+            fmask = (1 << (msb - lsb + 1)) - 1
+            codec = get_codec(ftype, ptype._PT_PACKING)
+            arg = self._arg_names[fname]
+            enc_params.append(f"{arg}={0 if fval is None else int(fval)}")
+            # Leaf fields are extracted and inserted inline
+            if isinstance(codec, LeafCodec):
+                dec_terms.append(f"({_shr('_v', lsb)}) & {fmask:#x}")
+                enc_lines.append(
+                    f"    if {arg}.__class__ is not int or not 0 <= {arg} <= {fmask:#x}: "
+                    f"{arg} = _leaf({arg}, {fmask:#x}, {fname!r})"
+                )
+            # Nested types defer to their own codecs
+            else:
+                namespace[f"_D{idx}"] = codec.decode
+                namespace[f"_E{idx}"] = codec.encode_any
+                dec_terms.append(f"_D{idx}(({_shr('_v', lsb)}) & {fmask:#x})")
+                enc_lines.append(f"    {arg} = _E{idx}({arg})")
+            enc_terms.append(_shl(arg, lsb))
+        self.decode = _compile(
+            "decode",
+            ["_v"],
+            [f"    return _T({', '.join(dec_terms)})"],
+            namespace,
+        )
+        self._encode = _compile(
+            "encode",
+            enc_params,
+            [*enc_lines, f"    return {' | '.join(enc_terms) or '0'}"],
+            namespace,
+        )
+
+    def decode(self, packed: int) -> tuple:
+        # NOTE: Replaced by the generated function during construction
+        raise NotImplementedError("Codec has not been compiled")
+
+    def encode(self, *args, **kwds) -> int:
+        if self._remap:
+            kwds = {self._arg_names.get(x, x): y for x, y in kwds.items()}
+        try:
+            return self._encode(*args, **kwds)
+        except TypeError as e:
+            raise CodecError(f"Failed to encode {self.tuple_type.__name__}: {e}") from e
+
+
+class UnionCodec(Codec):
+    """
+    Codec for unions which decode to a named tuple containing the projection of
+    the packed value through every member.
+
+    :param ptype: The union type
+    """
+
+    def __init__(self, ptype: Any) -> None:
+        super().__init__(ptype._PT_WIDTH)
+        self.fields = tuple(ptype._PT_DEF.keys())
+        self.tuple_type = namedtuple(ptype.__name__, self.fields, rename=True)
+        self.members = tuple(get_codec(x, Packing.FROM_LSB) for x, _ in ptype._PT_DEF.values())
+        namespace = {"_T": self.tuple_type}
+        dec_terms = []
+        for idx, codec in enumerate(self.members):
+            if isinstance(codec, LeafCodec):
+                dec_terms.append("_v")
+            else:
+                namespace[f"_D{idx}"] = codec.decode
+                dec_terms.append(f"_D{idx}(_v)")
+        self.decode = _compile(
+            "decode", ["_v"], [f"    return _T({', '.join(dec_terms)})"], namespace
+        )
+        # Tagged unions dispatch on the tag to decode only the selected member
+        self.dispatch = {}
+        if ptype._PT_TAG is not None:
+            lsb, width = ptype._PT_TAG
+            for value, fname in ptype._PT_DISPATCH.items():
+                self.dispatch[value] = (fname, self.members[self.fields.index(fname)].decode)
+            self.select = _compile(
+                "select",
+                ["_v"],
+                [
+                    f"    if (_e := _L(({_shr('_v', lsb)}) & {(1 << width) - 1:#x})) is None:",
+                    "        _unselected(_v)",
+                    "    return _e[0], _e[1](_v)",
+                ],
+                {"_L": self.dispatch.get, "_unselected": self._unselected},
+            )
+
+    def decode(self, packed: int) -> tuple:
+        # NOTE: Replaced by the generated function during construction
+        raise NotImplementedError("Codec has not been compiled")
+
+    def select(self, packed: int) -> tuple[str, Any]:
+        """
+        Decode only the member of a tagged union selected by the tag within the
+        packed value, using a precomputed table from tag value to the decoder of
+        each member.
+
+        :param packed: The packed value
+        :returns: Tuple of the name of the selected member and its decoded value
+        """
+        # NOTE: Replaced by the generated function for tagged unions
+        raise CodecError(f"{self.tuple_type.__name__} is not a tagged union")
+
+    def _unselected(self, packed: int) -> None:
+        raise CodecError(f"Packed value 0x{packed:X} does not select a member of the union")
+
+    def encode(self, *args, **kwds) -> int:
+        """
+        Encode one or more members of the union, where multiple members are
+        provided they must all encode to the same packed value.
+
+        :returns: The packed value
+        """
+        values = list(zip(self.fields, args, strict=False))
+        for fname, fval in kwds.items():
+            if fname not in self.fields:
+                raise CodecError(f"Unknown member '{fname}'")
+            values.append((fname, fval))
+        packed = None
+        for fname, fval in values:
+            encoded = self.members[self.fields.index(fname)].encode_any(fval)
+            if packed is not None and encoded != packed:
+                raise CodecError(
+                    f"Member '{fname}' encodes to 0x{encoded:X} which conflicts "
+                    f"with 0x{packed:X} from other members"
+                )
+            packed = encoded
+        return packed or 0
+
+
+def get_codec(ptype: Any, packing: Packing = Packing.FROM_LSB) -> Codec:
+    """
+    Get the codec for any packed type, reusing the cached codec of assemblies
+    and unions.
+
+    :param ptype:   The type to return a codec for
+    :param packing: Packing order to use for arrays
+    :returns:       The codec
+    """
+    if isinstance(ptype, ArraySpec):
+        return ArrayCodec(ptype, packing)
+    if issubclass(ptype, Alias):
+        ptype = ptype._PT_ALIAS
+    if hasattr(ptype, "_pt_codec"):
+        return ptype._pt_codec()
+    return LeafCodec(ptype._PT_WIDTH)
+
+
+def _encode_leaf(value: Any, mask: int, fname: str) -> int:
+    value = int(value)
+    if not 0 <= value <= mask:
+        raise CodecError(f"Value {value} for field '{fname}' is out of range (0 to {mask})")
+    return value
+
+
+def _shr(var: str, shift: int) -> str:
+    return f"{var} >> {shift}" if shift else var
+
+
+def _shl(var: str, shift: int) -> str:
+    return f"({var} << {shift})" if shift else var
+
+
+def _compile(
+    name: str, params: list[str], body: list[str], namespace: dict[str, Any]
+) -> Callable[..., Any]:
+    source = "\n".join([f"def {name}({', '.join(params)}):", *body])
+    exec(source, namespace)  # noqa: S102
+    return namespace[name]
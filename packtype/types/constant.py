@@ -7,6 +7,8 @@ from .primitive import NumericPrimitive
 
 
 class Constant(NumericPrimitive):
+    __slots__ = ()
+
     _PT_EXPRESSION: Expression | None = None
 
     def __str__(self) -> str:
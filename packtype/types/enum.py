@@ -11,6 +11,9 @@ from .bitvector import BitVector, BitVectorWindow
 from .constant import Constant
 from .numeric import Numeric
 
+# Enums of this width or narrower offer dense lookup tables indexed by value
+TABLE_WIDTH: int = 12
+
 
 class EnumMode(enum.Enum):
     INDEXED = enum.auto()
@@ -23,6 +26,8 @@ class EnumError(Exception):
 
 
 class Enum(Base, Numeric):
+    __slots__ = ()
+
     _PT_ALLOW_DEFAULTS: list[type[Base]] = [Constant]
     _PT_ATTRIBUTES: dict[str, tuple[Any, list[Any]]] = {
         "mode": (EnumMode.INDEXED, list(EnumMode)),
@@ -35,6 +40,7 @@ class Enum(Base, Numeric):
     _PT_PREFIX: str
     _PT_LKP_INST: dict
     _PT_LKP_VALUE: dict
+    _PT_LKP_NAME: dict
 
     def __init__(
         self,
@@ -42,16 +48,18 @@ class Enum(Base, Numeric):
         default: int | None = None,
         _pt_bv: BitVector | BitVectorWindow | None = None,
     ) -> None:
-        super().__init__(_pt_bv=_pt_bv, default=default)
-        if value is not None:
-            self._pt_set(value)
-        elif default is not None:
-            self._pt_set(default)
-        elif _pt_bv is None:
-            self._pt_set(0)
+        initial = value if value is not None else default
+        # NOTE: New storage is created holding the initial value, while existing
+        #       storage is only written if a value is provided
+        if _pt_bv is None:
+            super().__init__(default=initial)
+        else:
+            super().__init__(_pt_bv=_pt_bv)
+            if initial is not None:
+                self._pt_set(initial)
 
     def __repr__(self) -> str:
-        name = type(self)._PT_LKP_INST.get(self, "???")
+        name = type(self)._PT_LKP_NAME.get(int(self), "???")
         return f"<Enum::{type(self).__name__} {name}={int(self)}>"
 
     def __str__(self) -> str:
@@ -69,6 +77,7 @@ class Enum(Base, Numeric):
             cls._PT_PREFIX = cls._pt_name()
         cls._PT_LKP_INST = {}
         cls._PT_LKP_VALUE = {}
+        cls._PT_LKP_NAME = {}
         # Assign values
         assignments = {}
         # Indexed
@@ -122,10 +131,11 @@ class Enum(Base, Numeric):
                 )
             used.append(fval)
             # Create the enum instance
-            finst = cls(fval, _pt_bv=BitVector(width=cls._PT_WIDTH))
+            finst = cls(fval)
             setattr(cls, fname, finst)
             cls._PT_LKP_INST[finst] = fname
             cls._PT_LKP_VALUE[fval] = finst
+            cls._PT_LKP_NAME[fval] = fname
 
     @property
     def _pt_width(self) -> int:
@@ -154,8 +164,74 @@ class Enum(Base, Numeric):
         return {n: int(v) for v, n in cls._PT_LKP_INST.items()}
 
     @classmethod
-    def _pt_cast(cls, value: int) -> None:
-        if value in cls._PT_LKP_VALUE:
+    def _pt_cast(cls, value: int) -> "Enum":
+        """
+        Return the enumerated member matching a value where one exists, or
+        otherwise a new instance holding the value. New instances are never
+        shared, as they may be modified by the caller.
+
+        :param value: The value to cast
+        :return: The instance holding the value
+        """
+        try:
             return cls._PT_LKP_VALUE[value]
-        else:
+        except KeyError:
             return cls(value)
+
+    @classmethod
+    def _pt_name_of(cls, value: int) -> str | None:
+        """
+        Look up the name of the member with a given value.
+
+        :param value: The value to look up
+        :return: The name of the member, or None if no member has the value
+        """
+        return cls._PT_LKP_NAME.get(value, None)
+
+    @classmethod
+    def _pt_name_table(cls) -> tuple[str | None, ...]:
+        """
+        Return a dense table of member names indexed by value, holding None for
+        values that are not part of the enumeration. This is only available for
+        enums of up to TABLE_WIDTH bits, and can be indexed directly by a NumPy
+        array of values (e.g. ``np.array(table, dtype=object)[codes]``).
+
+        :return: Tuple with an entry for every value of the enum's width
+        """
+        if (table := cls.__dict__.get("_PT_NAME_TABLE", None)) is None:
+            cls._pt_check_dense()
+            names = cls._PT_LKP_NAME
+            table = cls._PT_NAME_TABLE = tuple(
+                names.get(x, None) for x in range(1 << cls._PT_WIDTH)
+            )
+        return table
+
+    @classmethod
+    def _pt_member_table(cls) -> tuple["Enum | None", ...]:
+        """
+        Return a dense table of members indexed by value, holding None for
+        values that are not part of the enumeration. This is only available for
+        enums of up to TABLE_WIDTH bits.
+
+        :return: Tuple with an entry for every value of the enum's width
+        """
+        if (table := cls.__dict__.get("_PT_MEMBER_TABLE", None)) is None:
+            cls._pt_check_dense()
+            members = cls._PT_LKP_VALUE
+            table = cls._PT_MEMBER_TABLE = tuple(
+                members.get(x, None) for x in range(1 << cls._PT_WIDTH)
+            )
+        return table
+
+    @classmethod
+    def _pt_check_dense(cls) -> None:
+        if cls._PT_WIDTH > TABLE_WIDTH:
+            raise EnumError(
+                f"Dense tables are only available for enums of up to {TABLE_WIDTH} "
+                f"bits, but {cls.__name__} is {cls._PT_WIDTH} bits wide"
+            )
+
+    @classmethod
+    def _pt_from_bytes(cls, data: Any, *args, **kwds) -> "Enum":
+        # Return the enumerated member where the value matches one
+        return cls._pt_cast(int(super()._pt_from_bytes(data, *args, **kwds)))
@@ -0,0 +1,258 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import inspect
+import itertools
+import math
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .alias import Alias
+from .array import ArraySpec
+from .packing import Packing
+from .scalar import Scalar
+
+
+def resolve_type(ptype: Any) -> Any:
+    """
+    Unwrap any aliases to find the underlying type, arrays are returned as-is.
+
+    :param ptype: The type to resolve
+    :return: The underlying type
+    """
+    while inspect.isclass(ptype) and issubclass(ptype, Alias):
+        ptype = ptype._PT_ALIAS
+    return ptype
+
+
+def width_of(ptype: Any) -> int:
+    """
+    Determine the width of a type purely from its class-level metadata, without
+    constructing an instance of it.
+
+    :param ptype: The type to inspect (a class, an alias, or an array spec)
+    :return: The width in bits
+    """
+    if isinstance(ptype, ArraySpec):
+        return width_of(ptype.base) * ptype._pt_flat_dimension
+    return resolve_type(ptype)._PT_WIDTH
+
+
+@dataclass(frozen=True)
+class FieldLayout:
+    """
+    Placement of a single field within a packed assembly.
+
+    :param name:  Name of the field
+    :param ptype: Declared type of the field (may be an alias or array spec)
+    :param lsb:   Least significant bit of the field
+    :param msb:   Most significant bit of the field
+    """
+
+    name: str
+    ptype: Any
+    lsb: int
+    msb: int
+
+    @property
+    def width(self) -> int:
+        return self.msb - self.lsb + 1
+
+    @property
+    def is_array(self) -> bool:
+        return isinstance(self.ptype, ArraySpec)
+
+    @property
+    def base(self) -> Any:
+        """Underlying type of the field, or of each entry for an array"""
+        return resolve_type(self.ptype.base if self.is_array else self.ptype)
+
+    @property
+    def dimensions(self) -> tuple[int, ...]:
+        return tuple(self.ptype.dimensions) if self.is_array else ()
+
+
+class Layout:
+    """
+    Class-level description of how the fields of a packed assembly are placed,
+    computed once from type metadata so that widths, field positions, array
+    element offsets, and padding can be queried without creating instances.
+
+    :param width:    Total width of the assembly in bits
+    :param packing:  Packing order of the fields
+    :param fields:   Field placements in declaration order, including padding
+    :param overlaid: Whether fields overlap one another (as in a union)
+    """
+
+    def __init__(
+        self,
+        width: int,
+        packing: Packing,
+        fields: Iterable[FieldLayout],
+        overlaid: bool = False,
+    ) -> None:
+        self.width = width
+        self.packing = packing
+        self.fields = tuple(fields)
+        self.overlaid = overlaid
+        self.by_name = {x.name: x for x in self.fields}
+        self.lsb_asc = tuple(sorted(self.fields, key=lambda x: x.lsb))
+        self.msb_desc = tuple(sorted(self.fields, key=lambda x: x.msb, reverse=True))
+        # Record the dimensions and element stepping of every array field
+        self.strides = {}
+        for field in self.fields:
+            if field.is_array:
+                dimensions = field.dimensions
+                steps = [field.width // dimensions[0]]
+                for dimension in dimensions[1:]:
+                    steps.append(steps[-1] // dimension)
+                self.strides[field.name] = (dimensions, tuple(steps))
+
+    @classmethod
+    def place(
+        cls, definitions: Iterable[tuple[str, Any]], packing: Packing, width: int
+    ) -> "Layout":
+        """
+        Place a sequence of fields either LSB -> MSB or MSB -> LSB depending on
+        the packing order, inserting padding to fill any remaining bits.
+
+        :param definitions: Pairs of field name and declared type
+        :param packing:     Packing order of the fields
+        :param width:       Total width of the assembly in bits
+        :return: The computed layout
+        """
+        fields = []
+        if packing is Packing.FROM_LSB:
+            lsb = 0
+            for fname, ftype in definitions:
+                fwidth = width_of(ftype)
+                fields.append(FieldLayout(fname, ftype, lsb, lsb + fwidth - 1))
+                lsb += fwidth
+            if lsb < width:
+                fields.append(cls._padding(lsb, width - 1))
+        else:
+            msb = width - 1
+            for fname, ftype in definitions:
+                fwidth = width_of(ftype)
+                fields.append(FieldLayout(fname, ftype, msb - fwidth + 1, msb))
+                msb -= fwidth
+            if msb >= 0:
+                fields.append(cls._padding(0, msb))
+        return cls(width, packing, fields)
+
+    @classmethod
+    def overlay(cls, definitions: Iterable[tuple[str, Any]], width: int) -> "Layout":
+        """
+        Place a sequence of fields so that each one spans the full width, as is
+        the case for the members of a union.
+
+        :param definitions: Pairs of field name and declared type
+        :param width:       Total width of the assembly in bits
+        :return: The computed layout
+        """
+        return cls(
+            width,
+            Packing.FROM_LSB,
+            (FieldLayout(fname, ftype, 0, width - 1) for fname, ftype in definitions),
+            overlaid=True,
+        )
+
+    @staticmethod
+    def _padding(lsb: int, msb: int) -> FieldLayout:
+        return FieldLayout("_padding", Scalar[msb - lsb + 1], lsb, msb)
+
+    @property
+    def padding(self) -> FieldLayout | None:
+        return self.by_name.get("_padding", None)
+
+    def element(self, fname: str, *index: int) -> tuple[int, int]:
+        """
+        Calculate the bit range occupied by an element (or a row of elements)
+        within an array field, computed arithmetically from the dimensions.
+
+        :param fname: Name of the array field
+        :param index: Index into each dimension, omitting trailing dimensions
+                      returns the range of the enclosing row
+        :return: Tuple of the LSB and MSB of the element
+        """
+        return self._element(fname, index)
+
+    def _element(self, fname: str, index: tuple[int, ...]) -> tuple[int, int]:
+        field = self.by_name[fname]
+        if not index:
+            return field.lsb, field.msb
+        dimensions, steps = self.strides.get(fname, ((), ()))
+        if len(index) > len(dimensions):
+            raise IndexError(f"Too many indices for array field '{fname}'")
+        offset = 0
+        for idx, sub in enumerate(index):
+            if not 0 <= sub < dimensions[idx]:
+                raise IndexError(f"Index {sub} out of range for dimension {idx} of '{fname}'")
+            offset += sub * steps[idx]
+        size = steps[len(index) - 1]
+        if self.packing is Packing.FROM_LSB:
+            return field.lsb + offset, field.lsb + offset + size - 1
+        else:
+            return field.msb - offset - size + 1, field.msb - offset
+
+    def flat(self, offset: int = 0) -> Iterable[FieldLayout]:
+        """
+        Flatten nested packed assemblies into a single sequence of fields in
+        MSB-first order, with positions relative to the outermost assembly.
+        Unions are not flattened as their members overlap.
+
+        :param offset: Offset to apply to the LSB and MSB of every field
+        :return: Iterable of field placements
+        """
+        for field in self.msb_desc:
+            if (
+                not field.is_array
+                and hasattr(field.base, "_pt_layout")
+                and not (nested := field.base._pt_layout()).overlaid
+            ):
+                yield from nested.flat(offset=offset + field.lsb)
+            elif offset:
+                yield FieldLayout(field.name, field.ptype, field.lsb + offset, field.msb + offset)
+            else:
+                yield field
+
+
+class LayoutRanges(Mapping):
+    """
+    Read-only mapping view of a layout which presents the placement of every
+    field as ``name -> (lsb, msb)`` and of every element of an array field as
+    ``(name, index) -> (msb, lsb)``, matching the historic contents of
+    ``_PT_RANGES``. Entries are calculated on demand rather than stored, so
+    large arrays do not inflate the class.
+
+    :param layout: The layout to present
+    """
+
+    __slots__ = ("_layout",)
+
+    def __init__(self, layout: Layout) -> None:
+        self._layout = layout
+
+    def __getitem__(self, key: str | tuple[str, tuple[int, ...]]) -> tuple[int, int]:
+        if isinstance(key, tuple):
+            fname, index = key
+            if len(index) != len(self._layout.strides.get(fname, ((), ()))[0]):
+                raise KeyError(key)
+            try:
+                lsb, msb = self._layout._element(fname, index)
+            except IndexError as e:
+                raise KeyError(key) from e
+            return msb, lsb
+        field = self._layout.by_name[key]
+        return field.lsb, field.msb
+
+    def __iter__(self) -> Iterator[str | tuple[str, tuple[int, ...]]]:
+        for field in self._layout.fields:
+            for index in itertools.product(*map(range, field.dimensions)) if field.is_array else ():
+                yield field.name, index
+            yield field.name
+
+    def __len__(self) -> int:
+        return sum(math.prod(x.dimensions) + 1 if x.is_array else 1 for x in self._layout.fields)
@@ -4,6 +4,8 @@
 
 
 class Numeric:
+    __slots__ = ()
+
     def __int__(self) -> int:
         raise NotImplementedError("Subclass must implement __int__")
 
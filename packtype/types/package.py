@@ -4,6 +4,7 @@
 
 import inspect
 from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any
 
 from ordered_set import OrderedSet as OSet
@@ -20,14 +21,52 @@ from .union import Union
 from .wrap import get_wrapper
 
 
+@dataclass(frozen=True)
+class PackageIndex:
+    """
+    Snapshot of the contents of a package, built once and then shared by every
+    query until something new is attached to the package.
+
+    :param references:         Every type referenced by the package, with each
+                               type listed after the types that it references
+    :param foreign:            Referenced types declared by other packages
+    :param constants:          Attached constants as tuples of name and instance
+    :param instances:          Attached instances (other than constants)
+    :param scalars:            Attached scalar typedefs
+    :param arrays:             Attached array typedefs
+    :param aliases:            Attached aliases
+    :param enums:              Attached enumerations
+    :param structs:            Attached structs
+    :param unions:             Attached unions
+    :param structs_and_unions: Attached structs and unions in declaration order
+    """
+
+    references: tuple[type[Base] | ArraySpec, ...]
+    foreign: tuple[type[Base] | ArraySpec, ...]
+    constants: tuple[tuple[str, Constant], ...]
+    instances: tuple[tuple[str, Base], ...]
+    scalars: tuple[tuple[str, type[ScalarType]], ...]
+    arrays: tuple[tuple[str, ArraySpec], ...]
+    aliases: tuple[tuple[str, type[Alias]], ...]
+    enums: tuple[tuple[str, type[Enum]], ...]
+    structs: tuple[tuple[str, type[Struct]], ...]
+    unions: tuple[tuple[str, type[Union]], ...]
+    structs_and_unions: tuple[tuple[str, type[Struct | Union]], ...]
+
+
 class Package(Base):
     _PT_ALLOW_DEFAULTS: list[type[Base]] = [Constant]
+    # NOTE: Packages are always constructed as they only attach their contents
+    _PT_DEFERRABLE: bool = False
     _PT_FIELDS: dict
+    # Index of the package contents (discarded whenever a field is attached)
+    _PT_INDEX: PackageIndex | None = None
 
     @classmethod
     def _pt_construct(cls, parent: Base) -> None:
         super()._pt_construct(parent)
         cls._PT_FIELDS = {}
+        cls._PT_INDEX = None
         for fname, ftype, fval in cls._pt_definitions():
             if inspect.isclass(ftype) and issubclass(ftype, Constant):
                 cls._pt_attach_constant(fname, ftype(default=fval))
@@ -39,6 +78,7 @@ class Package(Base):
         setattr(cls, fname, finst)
         finst._PT_ATTACHED_TO = cls
         cls._PT_FIELDS[finst] = fname
+        cls._PT_INDEX = None
         return finst
 
     @classmethod
@@ -46,14 +86,33 @@ class Package(Base):
         setattr(cls, fname, finst)
         finst._PT_ATTACHED_TO = cls
         cls._PT_FIELDS[finst] = fname
+        cls._PT_INDEX = None
         return finst
 
     @classmethod
-    def _pt_attach(cls, field: type[Base], name: str | None = None) -> Base:
+    def _pt_attach(
+        cls,
+        field: type[Base],
+        name: str | None = None,
+        source: tuple[str, int] | None = None,
+    ) -> Base:
+        # Interned primitives and aliases are shared by every use, so typedefs
+        # derive their own subclass to track attachment and source distinctly
+        if field.__dict__.get("_PT_INTERNED", False):
+            field = type(
+                field.__name__,
+                (field,),
+                {
+                    **({"__slots__": ()} if issubclass(field, Base) else {}),
+                    "_PT_INTERNED": False,
+                    "_PT_SOURCE": source or cls._PT_SOURCE,
+                },
+            )
         cls._PT_ATTACH.append(field)
         field._PT_ATTACHED_TO = cls
         setattr(cls, name or field.__name__, field)
         cls._PT_FIELDS[field] = name or field.__name__
+        cls._PT_INDEX = None
         return field
 
     @classmethod
@@ -78,9 +137,15 @@ class Package(Base):
         return _inner
 
     @classmethod
-    def _pt_foreign(cls):
+    def _pt_index(cls) -> PackageIndex:
+        if cls._PT_INDEX is None:
+            cls._PT_INDEX = cls._pt_build_index()
+        return cls._PT_INDEX
+
+    @classmethod
+    def _pt_build_index(cls) -> PackageIndex:
         # Get all referenced types
-        all_refs = cls._pt_references()
+        all_refs = super()._pt_references()
         # Exclude directly attached types
         foreign = all_refs.difference(OSet(cls._PT_ATTACH).union(cls._pt_field_types()))
 
@@ -95,7 +160,54 @@ class Package(Base):
             # If not attached to a different package, accept
             return obj._PT_ATTACHED_TO is not None and type(obj._PT_ATTACHED_TO) is not cls
 
-        return OSet(filter(_is_a_type, foreign))
+        # Sort attached fields by kind in a single pass
+        kinds = {
+            x: []
+            for x in (
+                "constants",
+                "instances",
+                "scalars",
+                "arrays",
+                "aliases",
+                "enums",
+                "structs",
+                "unions",
+                "structs_and_unions",
+            )
+        }
+        for field, fname in cls._PT_FIELDS.items():
+            if isinstance(field, Constant):
+                kinds["constants"].append((fname, field))
+            elif isinstance(field, Base):
+                kinds["instances"].append((fname, field))
+            elif isinstance(field, ArraySpec):
+                kinds["arrays"].append((fname, field))
+            elif inspect.isclass(field):
+                for kind, ctype in (
+                    ("scalars", ScalarType),
+                    ("aliases", Alias),
+                    ("enums", Enum),
+                    ("structs", Struct),
+                    ("unions", Union),
+                ):
+                    if issubclass(field, ctype):
+                        kinds[kind].append((fname, field))
+                if issubclass(field, Struct | Union):
+                    kinds["structs_and_unions"].append((fname, field))
+
+        return PackageIndex(
+            references=tuple(all_refs),
+            foreign=tuple(filter(_is_a_type, foreign)),
+            **{x: tuple(y) for x, y in kinds.items()},
+        )
+
+    @classmethod
+    def _pt_references(cls) -> OSet:
+        return OSet(cls._pt_index().references)
+
+    @classmethod
+    def _pt_foreign(cls) -> OSet:
+        return OSet(cls._pt_index().foreign)
 
     @property
     def _pt_fields(self) -> dict:
@@ -103,50 +215,39 @@ class Package(Base):
 
     @property
     def _pt_constants(self) -> Iterable[tuple[str, Constant]]:
-        return ((y, x) for x, y in self._pt_fields.items() if isinstance(x, Constant))
+        return self._pt_index().constants
 
     @property
     def _pt_instances(self) -> Iterable[tuple[str, Base]]:
-        return (
-            (y, x)
-            for x, y in self._pt_fields.items()
-            if isinstance(x, Base) and not isinstance(x, Constant)
-        )
-
-    def _pt_filter_for_class(self, ctype: type[Base]) -> Iterable[tuple[str, type[Base]]]:
-        return (
-            (y, x)
-            for x, y in self._pt_fields.items()
-            if (inspect.isclass(x) and issubclass(x, ctype))
-        )
+        return self._pt_index().instances
 
     @property
     def _pt_scalars(self) -> Iterable[tuple[str, ScalarType]]:
-        return self._pt_filter_for_class(ScalarType)
+        return self._pt_index().scalars
 
     @property
     def _pt_arrays(self) -> Iterable[tuple[str, ArraySpec]]:
-        return ((y, x) for x, y in self._pt_fields.items() if isinstance(x, ArraySpec))
+        return self._pt_index().arrays
 
     @property
     def _pt_aliases(self) -> Iterable[Alias]:
-        return self._pt_filter_for_class(Alias)
+        return self._pt_index().aliases
 
     @property
     def _pt_enums(self) -> Iterable[tuple[str, Enum]]:
-        return self._pt_filter_for_class(Enum)
+        return self._pt_index().enums
 
     @property
     def _pt_structs(self) -> Iterable[tuple[str, Struct]]:
-        return self._pt_filter_for_class(Struct)
+        return self._pt_index().structs
 
     @property
     def _pt_unions(self) -> Iterable[tuple[str, Union]]:
-        return self._pt_filter_for_class(Union)
+        return self._pt_index().unions
 
     @property
     def _pt_structs_and_unions(self) -> Iterable[tuple[str, Struct | Union]]:
-        return self._pt_filter_for_class(Struct | Union)
+        return self._pt_index().structs_and_unions
 
     @classmethod
     def _pt_lookup(cls, field: type[Base] | Base) -> str:
@@ -2,8 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import inspect
-from collections import defaultdict
 from typing import Any
 
 try:
@@ -21,7 +19,7 @@ class PrimitiveValueError(Exception):
 
 
 class MetaPrimitive(MetaBase):
-    UNIQUE_ID: dict[tuple[int, bool], int] = defaultdict(lambda: 0)
+    INTERNED: dict[tuple[type, tuple[str]], type] = {}
 
     def __getitem__(self, key: int | tuple[int, bool]):
         segments, kwargs = self._pt_meta_key(key)
@@ -29,31 +27,28 @@ class MetaPrimitive(MetaBase):
 
     @staticmethod
     def get_variant(prim: Self, segments: tuple[str], kwargs: dict[str, Any]):
-        # Use the frame to determine declaration source
-        frame = inspect.currentframe()
-        for _ in range(2):
-            frame = frame.f_back
-        source = (frame.f_code.co_filename, frame.f_lineno)
         # If the primitive provides a base type, use that instead
         meta_type = prim._PT_META_USE_TYPE or prim
-        # NOTE: Don't share primitives between creations as this prevents the
-        #       parent being distinctly tracked (a problem when they are used as
-        #       typedefs on a package)
-        uid = MetaPrimitive.UNIQUE_ID[segments]
-        MetaPrimitive.UNIQUE_ID[segments] += 1
-        imposter = type(
-            meta_type.__name__ + "_" + "_".join(str(x) for x in segments) + f"_{uid}",
-            (meta_type,),
-            {
-                **kwargs,
-                "_PT_SOURCE": source,
-                "_PT_BASE": meta_type,
-            },
-        )
+        # NOTE: Variants are interned so that every use of the same width and
+        #       signedness shares one class, typedefs on a package derive their
+        #       own subclass when attached so their parent is tracked distinctly
+        if (imposter := MetaPrimitive.INTERNED.get((meta_type, segments), None)) is None:
+            imposter = MetaPrimitive.INTERNED[meta_type, segments] = type(
+                meta_type.__name__ + "_" + "_".join(str(x) for x in segments),
+                (meta_type,),
+                {
+                    **kwargs,
+                    "__slots__": (),
+                    "_PT_BASE": meta_type,
+                    "_PT_INTERNED": True,
+                },
+            )
         return imposter
 
 
 class NumericType(Base, Numeric):
+    __slots__ = ()
+
     _PT_WIDTH: int = -1
     _PT_SIGNED: bool = False
 
@@ -100,18 +95,22 @@ class NumericType(Base, Numeric):
 
 
 class NumericPrimitive(NumericType, metaclass=MetaPrimitive):
+    __slots__ = ()
+
     @classmethod
     def _pt_meta_key(cls, key: int | tuple[int, bool]) -> tuple[tuple[str], dict[str, Any]]:
         if isinstance(key, int) or hasattr(key, "__int__"):
-            key = int(key)
-            return ((str(key),), {"_PT_WIDTH": key})
+            width, signed = int(key), False
         elif (
             isinstance(key, tuple)
             and (isinstance(key[0], int) or hasattr(key[0], "__int__"))
             and (isinstance(key[1], bool) or hasattr(key[1], "__bool__"))
         ):
             width, signed = int(key[0]), bool(key[1])
-            key = f"{width}{'S' if signed else 'U'}"
-            return ((key,), {"_PT_WIDTH": width, "_PT_SIGNED": signed})
         else:
             raise Exception(f"Unsupported NumericPrimitive key: {key}")
+        # NOTE: Keys are normalised so equivalent variants intern to one class
+        return (
+            (f"{width}S" if signed else str(width),),
+            {"_PT_WIDTH": width, "_PT_SIGNED": signed},
+        )
@@ -8,6 +8,8 @@ from .primitive import NumericPrimitive, NumericType
 
 
 class ScalarType(NumericType):
+    __slots__ = ()
+
     _PT_WIDTH: int = 1
 
     @classmethod
@@ -25,4 +27,6 @@ class ScalarType(NumericType):
 
 
 class Scalar(NumericPrimitive):
+    __slots__ = ()
+
     _PT_META_USE_TYPE: type[Base] = ScalarType
@@ -0,0 +1,107 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from typing import Any, Literal
+
+from .bitvector import BitVector, BitVectorWindow
+
+# Translation table which reverses the order of the bits within every byte
+_REVERSE = bytes(int(format(x, "08b")[::-1], 2) for x in range(256))
+
+
+# Every supported combination of byte order, bit order, and padding
+_OPTIONS = frozenset(
+    (x, y, z) for x in ("little", "big") for y in ("msb", "lsb") for z in ("msb", "lsb")
+)
+
+
+class SerialError(Exception):
+    pass
+
+
+def byte_size(width: int) -> int:
+    """
+    Number of bytes needed to hold a value of a given width.
+
+    :param width: Width of the value in bits
+    :return: Number of bytes
+    """
+    return (width + 7) // 8
+
+
+def _check(width: int | None, byteorder: str, bitorder: str, padding: str) -> None:
+    if width is None or width < 0:
+        raise SerialError("Values without a fixed width cannot be serialised")
+    if (byteorder, bitorder, padding) in _OPTIONS:
+        return
+    if byteorder not in ("little", "big"):
+        raise SerialError(f"Unsupported byte order '{byteorder}', must be 'little' or 'big'")
+    if bitorder not in ("msb", "lsb"):
+        raise SerialError(f"Unsupported bit order '{bitorder}', must be 'msb' or 'lsb'")
+    raise SerialError(f"Unsupported padding '{padding}', must be 'msb' or 'lsb'")
+
+
+def to_bytes(
+    bitvector: BitVector | BitVectorWindow,
+    byteorder: Literal["little", "big"] = "little",
+    bitorder: Literal["msb", "lsb"] = "msb",
+    padding: Literal["msb", "lsb"] = "msb",
+) -> bytes:
+    """
+    Serialise the value held by a bit vector (or window) into bytes.
+
+    :param bitvector: The storage to serialise
+    :param byteorder: Order of the bytes, either "little" or "big"
+    :param bitorder:  Order of the bits within each byte, either "msb" where
+                      bit 7 is the most significant (the usual convention) or
+                      "lsb" where bit 0 is the most significant
+    :param padding:   Where padding bits are placed to fill the final byte when
+                      the width is not a multiple of 8, either "msb" where the
+                      value is zero-extended or "lsb" where it is left-aligned
+    :return: The serialised value
+    """
+    width = bitvector.width
+    _check(width, byteorder, bitorder, padding)
+    size = (width + 7) // 8
+    # Zero-extended values can be taken directly from storage
+    if padding == "msb" or width % 8 == 0:
+        data = bitvector.to_bytes(size, byteorder)
+    else:
+        data = (int(bitvector) << (8 * size - width)).to_bytes(size, byteorder)
+    return data if bitorder == "msb" else data.translate(_REVERSE)
+
+
+def from_bytes(
+    bitvector: BitVector | BitVectorWindow,
+    data: Any,
+    byteorder: Literal["little", "big"] = "little",
+    bitorder: Literal["msb", "lsb"] = "msb",
+    padding: Literal["msb", "lsb"] = "msb",
+) -> None:
+    """
+    Deserialise bytes into a bit vector (or window), the inverse of `to_bytes`.
+    The content of any padding bits is ignored.
+
+    :param bitvector: The storage to update
+    :param data:      Any object supporting the buffer protocol (e.g. ``bytes``,
+                      ``bytearray``, ``memoryview``, or ``mmap``), which must
+                      contain exactly the number of bytes needed for the width
+    :param byteorder: Order of the bytes, either "little" or "big"
+    :param bitorder:  Order of the bits within each byte, either "msb" or "lsb"
+    :param padding:   Where padding bits are placed, either "msb" or "lsb"
+    """
+    width = bitvector.width
+    _check(width, byteorder, bitorder, padding)
+    size = (width + 7) // 8
+    if (length := len(data) if type(data) is bytes else memoryview(data).nbytes) != size:
+        raise SerialError(
+            f"Expected {size} bytes to hold {width} bits but {length} bytes were provided"
+        )
+    if bitorder == "lsb":
+        data = bytes(data).translate(_REVERSE)
+    # Zero-extended values can be copied directly into storage
+    if padding == "msb" or width % 8 == 0:
+        bitvector.set_bytes(data, byteorder)
+    else:
+        bitvector.set(int.from_bytes(data, byteorder) >> (8 * size - width))
@@ -2,8 +2,36 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from typing import Any, Literal
+
 from .assembly import PackedAssembly
+from .view import BufferView
 
 
 class Struct(PackedAssembly):
-    pass
+    __slots__ = ()
+
+    @classmethod
+    def _pt_view(
+        cls,
+        buffer: Any,
+        count: int | None = None,
+        stride: int | None = None,
+        offset: int = 0,
+        byteorder: Literal["little", "big"] = "little",
+    ) -> BufferView:
+        """
+        Overlay a sequence of records of this type onto a buffer without copying
+        it, where each record occupies ceil(width / 8) bytes. Indexing the view
+        returns an instance whose fields read and write the buffer directly.
+
+        :param buffer:    Any object supporting the buffer protocol (e.g. a
+                          ``bytearray``, ``mmap``, or NumPy array)
+        :param count:     Number of records, defaults to as many as fit
+        :param stride:    Distance between the start of each record in bytes,
+                          defaults to the size of a record
+        :param offset:    Offset of the first record in bytes
+        :param byteorder: Order of the bytes within each record
+        :return: The view
+        """
+        return BufferView(cls, buffer, count, stride, offset, byteorder)
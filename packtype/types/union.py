@@ -2,13 +2,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-import functools
 import textwrap
+from typing import Any
 
 from .array import ArraySpec
 from .assembly import Assembly
 from .base import Base
 from .bitvector import BitVector, BitVectorWindow
+from .codec import UnionCodec
+from .layout import Layout, resolve_type, width_of
 from .primitive import NumericPrimitive
 
 
@@ -16,8 +18,44 @@ class UnionError(Exception):
     pass
 
 
+def locate_tag(ptype: Any, tag: str) -> tuple[int, int, Any]:
+    """
+    Locate a tag field within the type of a union member, following a dotted
+    path through any nested structs or unions.
+
+    :param ptype: Type of the union member
+    :param tag:   Dotted path to the tag field (e.g. ``header.command``)
+    :return: Tuple of the LSB, width, and type of the tag field
+    """
+    lsb, field = 0, None
+    for part in tag.split("."):
+        ptype = resolve_type(ptype)
+        if (
+            isinstance(ptype, ArraySpec)
+            or not hasattr(ptype, "_pt_layout")
+            or (field := ptype._pt_layout().by_name.get(part, None)) is None
+        ):
+            name = getattr(ptype, "__name__", str(ptype))
+            raise UnionError(f"{name} has no field '{part}' for the tag '{tag}'")
+        lsb += field.lsb
+        ptype = field.ptype
+    if field.is_array:
+        raise UnionError(f"Tag '{tag}' cannot be an array field")
+    return lsb, field.width, field.base
+
+
 class Union(Assembly):
+    __slots__ = ()
+
+    _PT_ATTRIBUTES: dict[str, tuple[Any, list[Any]]] = {
+        "tag": (None, lambda x: x is None or isinstance(x, str)),
+    }
     _PT_WIDTH: int
+    _PT_MASK: int
+    _PT_LAYOUT: Layout
+    _PT_TAG: tuple[int, int] | None
+    _PT_TAGS: dict[str, tuple[int, ...]]
+    _PT_DISPATCH: dict[int, str]
 
     def __init__(
         self,
@@ -44,40 +82,41 @@ class Union(Assembly):
     def __repr__(self) -> str:
         return self.__str__()
 
-    def __getattribute__(self, fname: str):
-        # Attempt to resolve the attribute from existing properties
-        try:
-            return super().__getattribute__(fname)
-        # If that fails...
-        except AttributeError as e:
-            # Is this a known field that hasn't yet been instanced?
-            if fpair := type(self)._PT_DEF.get(fname, None):
-                ftype, fval = fpair
-                # Generate an instance of the field
-                if isinstance(ftype, ArraySpec):
-                    if isinstance(ftype.base, NumericPrimitive):
-                        finst = ftype.as_packed(default=fval, _pt_bv=self._pt_bv)
-                    else:
-                        finst = ftype.as_packed(_pt_bv=self._pt_bv)
-                elif issubclass(ftype, NumericPrimitive):
-                    finst = ftype(default=fval, _pt_bv=self._pt_bv)
-                else:
-                    finst = ftype(_pt_bv=self._pt_bv)
-                # Attach the instance to the parent
-                finst._PT_PARENT = self
-                self._pt_force_set(fname, finst)
-                # Return it
-                return finst
-            # If not resolved, forward the attribute error
+    def _pt_create_field(self, fname: str) -> Base:
+        ftype, fval = self._PT_DEF[fname]
+        # Generate an instance of the field
+        if isinstance(ftype, ArraySpec):
+            if isinstance(ftype.base, NumericPrimitive):
+                finst = ftype.as_packed(default=fval, _pt_bv=self._pt_bv)
             else:
-                raise e
+                finst = ftype.as_packed(_pt_bv=self._pt_bv)
+        elif issubclass(ftype, NumericPrimitive):
+            finst = ftype(default=fval, _pt_bv=self._pt_bv)
+        else:
+            finst = ftype(_pt_bv=self._pt_bv)
+        # Attach the instance to the parent
+        finst._pt_parent = self
+        return finst
+
+    def _pt_get(self, fname: str) -> int:
+        """
+        Read the value of a member as an integer without constructing the member,
+        as every member spans the full width of the union this is the same as
+        the packed value of the union.
+
+        :param fname: Name of the member
+        :return: The member's value
+        """
+        if fname not in self._PT_DEF:
+            raise AttributeError(f"{type(self).__name__} has no member '{fname}'")
+        return int(self._pt_bv)
 
     @classmethod
-    def _pt_construct(cls, parent: Base | None):
+    def _pt_construct(cls, parent: Base | None, tag: str | None = None):
         super()._pt_construct(parent)
         cls._PT_WIDTH = None
         for fname, ftype, _ in cls._pt_definitions():
-            fwidth = ftype()._pt_width
+            fwidth = width_of(ftype)
             if cls._PT_WIDTH is None:
                 cls._PT_WIDTH = fwidth
             elif fwidth != cls._PT_WIDTH:
@@ -85,15 +124,95 @@ class Union(Assembly):
                     f"Union member {fname} has a width of {fwidth} that "
                     f"differs from the expected width of {cls._PT_WIDTH}"
                 )
+        cls._PT_MASK = (1 << cls._PT_WIDTH) - 1
+        cls._PT_LAYOUT = Layout.overlay(
+            ((fname, ftype) for fname, ftype, _ in cls._pt_definitions()), cls._PT_WIDTH
+        )
+        # Build the dispatch table for tagged unions
+        cls._PT_TAG = None
+        cls._PT_TAGS = {}
+        cls._PT_DISPATCH = {}
+        if tag is not None:
+            cls._pt_construct_tags(tag)
+        # Attach descriptors for every member
+        cls._pt_attach_fields(cls._PT_DEF.keys())
+
+    @classmethod
+    def _pt_construct_tags(cls, tag: str) -> None:
+        for fname, ftype, fval in cls._pt_definitions():
+            # Members without tag values can't be selected by the tag
+            if fval is None:
+                continue
+            # NOTE: Tag values are not a default for the member, so are removed
+            cls._PT_DEF[fname] = (ftype, None)
+            lsb, width, _ = locate_tag(ftype, tag)
+            if cls._PT_TAG is None:
+                cls._PT_TAG = (lsb, width)
+            elif cls._PT_TAG != (lsb, width):
+                raise UnionError(
+                    f"Tag '{tag}' of union member {fname} occupies bits {lsb + width - 1}:{lsb} "
+                    f"which differs from bits {sum(cls._PT_TAG) - 1}:{cls._PT_TAG[0]} of "
+                    f"other members"
+                )
+            values = tuple(map(int, fval if isinstance(fval, tuple | list) else (fval,)))
+            for value in values:
+                if not 0 <= value < (1 << width):
+                    raise UnionError(
+                        f"Tag value {value} of union member {fname} cannot be represented "
+                        f"in {width} bits"
+                    )
+                if (other := cls._PT_DISPATCH.get(value, None)) is not None:
+                    raise UnionError(
+                        f"Tag value {value} of union member {fname} is already used by {other}"
+                    )
+                cls._PT_DISPATCH[value] = fname
+            cls._PT_TAGS[fname] = values
+        if cls._PT_TAG is None:
+            raise UnionError(f"Tag '{tag}' of {cls.__name__} does not select any members")
+
+    @classmethod
+    def _pt_layout(cls) -> Layout:
+        """
+        Return the class-level layout of this type, where every member spans
+        the full width of the union.
+
+        :return: The layout of this type
+        """
+        return cls._PT_LAYOUT
+
+    @property
+    def _pt_tag(self) -> int:
+        """Value of the tag field of a tagged union"""
+        if self._PT_TAG is None:
+            raise UnionError(f"{type(self).__name__} is not a tagged union")
+        lsb, width = self._PT_TAG
+        return self._pt_bv.extract(lsb + width - 1, lsb)
+
+    @property
+    def _pt_selected(self) -> str | None:
+        """Name of the member selected by the tag, or None if no member matches"""
+        return self._PT_DISPATCH.get(self._pt_tag, None)
+
+    def _pt_select(self) -> Base:
+        """
+        Return the member of a tagged union selected by the current value of its
+        tag, with a single lookup into the dispatch table.
+
+        :return: The selected member
+        """
+        if (fname := self._pt_selected) is None:
+            raise UnionError(
+                f"Tag value {self._pt_tag} of {type(self).__name__} does not select a member"
+            )
+        return getattr(self, fname)
 
     @property
     def _pt_width(self) -> int:
         return self._PT_WIDTH
 
     @property
-    @functools.cache  # noqa: B019
     def _pt_mask(self) -> int:
-        return (1 << self._pt_width) - 1
+        return self._PT_MASK
 
     def __int__(self) -> int:
         return self._pt_pack()
@@ -101,6 +220,19 @@ class Union(Assembly):
     def _pt_pack(self) -> int:
         return int(self._pt_bv)
 
+    @classmethod
+    def _pt_codec(cls) -> UnionCodec:
+        """
+        Return the codec for this type, which decodes packed integers into named
+        tuples holding the value projected through every member. The codec is
+        built on first use and then reused.
+
+        :return: The codec for this type
+        """
+        if (codec := cls.__dict__.get("_PT_CODEC", None)) is None:
+            codec = cls._PT_CODEC = UnionCodec(cls)
+        return codec
+
     @classmethod
     def _pt_unpack(cls, packed: int) -> "Union":
         inst = cls()
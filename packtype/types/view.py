@@ -0,0 +1,101 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+from collections.abc import Iterator, Sequence
+from typing import Any, Literal
+
+from .bitvector import BufferBitVector
+
+
+class ViewError(Exception):
+    pass
+
+
+class BufferView(Sequence):
+    """
+    Sequence of packed records overlaid on a buffer, where each entry is an
+    instance of the record type whose storage is the buffer itself. Reads and
+    writes of fields go directly to the bytes of the record, so the buffer can
+    be shared with other code (e.g. a C model, DMA ring, or memory mapped file)
+    without copying values in and out. Instances are created on each access and
+    hold a reference to the buffer, which prevents resizing or closing it until
+    they are released.
+
+    :param ptype:     The packed type of each record
+    :param buffer:    Any object supporting the buffer protocol
+    :param count:     Number of records, defaults to as many as fit
+    :param stride:    Distance between the start of each record in bytes,
+                      defaults to the size of a record
+    :param offset:    Offset of the first record in bytes
+    :param byteorder: Order of the bytes within each record
+    """
+
+    __slots__ = ("_pt_count", "_pt_memory", "_pt_order", "_pt_size", "_pt_stride", "_pt_type")
+
+    def __init__(
+        self,
+        ptype: Any,
+        buffer: Any,
+        count: int | None = None,
+        stride: int | None = None,
+        offset: int = 0,
+        byteorder: Literal["little", "big"] = "little",
+    ) -> None:
+        if byteorder not in ("little", "big"):
+            raise ViewError(f"Unsupported byte order '{byteorder}', must be 'little' or 'big'")
+        memory = memoryview(buffer)
+        if not memory.contiguous:
+            raise ViewError("Buffer must be contiguous")
+        memory = memory.cast("B") if memory.format != "B" or memory.ndim != 1 else memory
+        size = (ptype._PT_WIDTH + 7) // 8
+        stride = size if stride is None else stride
+        if stride < size:
+            raise ViewError(
+                f"Stride of {stride} bytes is smaller than the {size} bytes of {ptype.__name__}"
+            )
+        if offset < 0:
+            raise ViewError(f"Offset of {offset} bytes is not supported")
+        available = len(memory) - offset
+        fits = 0 if available < size else (available - size) // stride + 1
+        if count is None:
+            count = fits
+        elif count > fits:
+            raise ViewError(
+                f"Buffer of {len(memory)} bytes cannot hold {count} records of {size} bytes "
+                f"with a stride of {stride} bytes from offset {offset}"
+            )
+        self._pt_type = ptype
+        self._pt_memory = memory[offset:]
+        self._pt_count = count
+        self._pt_size = size
+        self._pt_stride = stride
+        self._pt_order = byteorder
+
+    def __len__(self) -> int:
+        return self._pt_count
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._pt_count)
+            if step < 0:
+                raise ViewError("Views onto a buffer cannot be reversed")
+            # Slices are a view onto the same buffer
+            view = copy.copy(self)
+            view._pt_memory = self._pt_memory[start * self._pt_stride :]
+            view._pt_count = len(range(start, stop, step))
+            view._pt_stride *= step
+            return view
+        start = range(self._pt_count)[key] * self._pt_stride
+        memory = self._pt_memory[start : start + self._pt_size]
+        return self._pt_type(
+            _pt_bv=BufferBitVector(memory, self._pt_type._PT_WIDTH, self._pt_order)
+        )
+
+    def __setitem__(self, key: int, value: Any) -> None:
+        self[key]._pt_set(int(value))
+
+    def __iter__(self) -> Iterator[Any]:
+        for idx in range(self._pt_count):
+            yield self[idx]
@@ -2,19 +2,24 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+import contextlib
 import dataclasses
 import functools
 import inspect
 from collections import defaultdict
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator
+from typing import Any, ClassVar, get_origin
 
 from ordered_set import OrderedSet as OSet
 
 from .alias import Alias
 from .array import ArraySpec
 from .assembly import Base
+from .base import complete_construction, defer_construction
+from .constant import Constant
+from .enum import Enum
 from .primitive import NumericPrimitive
+from .union import Union
 
 
 class MissingAnnotationError(Exception):
@@ -49,6 +54,72 @@ class Registry:
         cls.ENTRIES.clear()
 
 
+class Deferral:
+    """
+    Options controlling how types are constructed as they are declared. When
+    enabled, the construction of each type (working out its layout, padding,
+    enumerated values, register offsets, etc.) is deferred until it is first
+    instantiated or introspected, so that loading a large specification only
+    pays for the types that are actually used. Capturing the source location
+    of each declaration may also be disabled, avoiding a walk of the stack.
+    """
+
+    ENABLED: bool = False
+    CAPTURE_SOURCE: bool = True
+
+    @classmethod
+    def configure(cls, enabled: bool = True, capture_source: bool = True) -> None:
+        """
+        Configure the construction of any types declared from this point on.
+
+        :param enabled:        Whether to defer construction of each type
+        :param capture_source: Whether to capture the source location of each
+                               type declared in Python
+        """
+        cls.ENABLED = enabled
+        cls.CAPTURE_SOURCE = capture_source
+
+    @classmethod
+    def resolve(cls) -> None:
+        """
+        Complete the construction of every registered type that is still
+        deferred, for example to check a specification for errors.
+        """
+        for entries in list(Registry.ENTRIES.values()):
+            for entry in list(entries):
+                complete_construction(entry)
+
+
+@contextlib.contextmanager
+def deferred(capture_source: bool = True) -> Iterator[None]:
+    """
+    Defer the construction of every type declared within the context, see
+    ``Deferral`` for details.
+
+    :param capture_source: Whether to capture the source location of each type
+                           declared in Python
+    """
+    previous = (Deferral.ENABLED, Deferral.CAPTURE_SOURCE)
+    Deferral.configure(True, capture_source)
+    try:
+        yield
+    finally:
+        Deferral.configure(*previous)
+
+
+def _is_tag_value(value: Any) -> bool:
+    """
+    Check if a value is acceptable as the tag value(s) of a tagged union member,
+    which must be a single integer, enumerated, or constant value or a non-empty
+    sequence of them.
+
+    :param value: The value assigned to the member
+    :return: True if the value is acceptable, False otherwise
+    """
+    values = value if isinstance(value, tuple | list) else (value,)
+    return len(values) > 0 and all(isinstance(x, int | Enum | Constant) for x in values)
+
+
 def build_from_fields(
     base: Any,
     cname: str,
@@ -76,6 +147,11 @@ def build_from_fields(
         # Map a missing value to None
         if isinstance(default, dataclasses._MISSING_TYPE):
             fields[fname] = (ftype, None)
+        # Members of a tagged union are assigned the tag values that select them
+        elif (
+            issubclass(base, Union) and kwds.get("tag", None) is not None and _is_tag_value(default)
+        ):
+            continue
         # Check if assignment allowed
         # NOTE: The subclass check is necessary for scalar/constant specialisations
         elif (
@@ -111,35 +187,46 @@ def build_from_fields(
         if key not in attrs:
             attrs[key] = default
     # If source not given, use the frame to determine it
-    if source is None:
+    if source is None and Deferral.CAPTURE_SOURCE:
         frame = inspect.currentframe()
         for _ in range(frame_depth):
             frame = frame.f_back
         source = (frame.f_code.co_filename, frame.f_lineno)
+    namespace = {
+        "__doc__": doc_str,
+        "__slots__": (),
+        "_PT_DEF": fields,
+        "_PT_ATTACH": [],
+        "_PT_ATTRIBUTES": attrs,
+        "_PT_BASE": base,
+    }
+    if source is not None:
+        namespace["_PT_SOURCE"] = source
+    # Defer construction if requested (and supported by the base type)
+    if defer := Deferral.ENABLED and base._PT_DEFERRABLE:
+        defer_construction(base, namespace, parent, attrs)
     # Create imposter class
-    imposter = type(
-        cname,
-        (base,),
-        {
-            "__doc__": doc_str,
-            "_PT_DEF": fields,
-            "_PT_ATTACH": [],
-            "_PT_ATTRIBUTES": attrs,
-            "_PT_SOURCE": source,
-            "_PT_BASE": base,
-        },
-    )
+    imposter = type(cname, (base,), namespace)
     # Reattach functions
     for fname, func in (cls_funcs or {}).items():
         setattr(imposter, fname, func)
     # Imposter construction
-    imposter._pt_construct(parent, **attrs)
+    if not defer:
+        imposter._pt_construct(parent, **attrs)
     # Register the imposter
     Registry.register(base, imposter)
     # Return the imposter as a substitute
     return imposter
 
 
+def _signature_doc(cls: type) -> str:
+    # Matches the docstring a dataclass would give an undocumented class, only
+    # inspecting the signature where a constructor has actually been declared
+    if cls.__init__ is object.__init__:
+        return f"{cls.__name__}()"
+    return cls.__name__ + str(inspect.signature(cls)).replace(" -> None", "")
+
+
 @functools.cache
 def get_wrapper(base: Any, frame_depth: int = 1) -> Callable:
     def _wrapper(parent: Base | None = None, **kwds) -> Callable:
@@ -151,9 +238,13 @@ def get_wrapper(base: Any, frame_depth: int = 1) -> Callable:
             # Filter out any functions
             cls_funcs = {x for x in cls_fields if callable(getattr(cls, x))}
             cls_fields = cls_fields.difference(cls_funcs)
-            # Process class with dataclass
-            dc = dataclasses.dataclass(init=False)(cls)
-            dc_fields = {x.name: x for x in dataclasses.fields(dc)}
+            # Collect annotated fields in the same way as a dataclass would,
+            # without generating any of the methods that a dataclass adds
+            dc_fields = {
+                x: (y, cls.__dict__.get(x, dataclasses.MISSING))
+                for x, y in inspect.get_annotations(cls).items()
+                if y is not ClassVar and get_origin(y) is not ClassVar
+            }
             # Check for missing fields
             for field in cls_fields.difference(dc_fields.keys()):
                 raise MissingAnnotationError(f"{cls.__name__}.{field} is not annotated")
@@ -161,10 +252,10 @@ def get_wrapper(base: Any, frame_depth: int = 1) -> Callable:
             return build_from_fields(
                 base=base,
                 cname=cls.__name__,
-                fields={x: (y.type, y.default) for x, y in dc_fields.items()},
+                fields=dc_fields,
                 kwds=kwds,
                 frame_depth=frame_depth,
-                doc_str=cls.__doc__,
+                doc_str=cls.__doc__ or _signature_doc(cls),
                 cls_funcs={x: getattr(cls, x) for x in cls_funcs},
                 parent=parent,
             )
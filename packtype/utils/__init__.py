@@ -2,9 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
-from . import array, constant, enum, package, struct, union
+from . import array, batch, constant, enum, package, struct, trace, union
 from .basic import (
     clog2,
+    from_bytes,
     get_doc,
     get_name,
     get_source,
@@ -12,23 +13,42 @@ from .basic import (
     is_scalar,
     is_signed,
     pack,
+    to_bytes,
     unpack,
 )
+from .batch import (
+    limbs_from_bytes,
+    limbs_to_bytes,
+    pack_many,
+    pack_many_limbs,
+    unpack_many,
+    unpack_tagged,
+)
 
 __all__ = [
     "array",
+    "batch",
     "clog2",
     "constant",
     "enum",
+    "from_bytes",
     "get_doc",
     "get_name",
     "get_source",
     "get_width",
     "is_scalar",
     "is_signed",
+    "limbs_from_bytes",
+    "limbs_to_bytes",
     "pack",
+    "pack_many",
+    "pack_many_limbs",
     "package",
     "struct",
+    "to_bytes",
+    "trace",
     "union",
     "unpack",
+    "unpack_many",
+    "unpack_tagged",
 ]
@@ -4,6 +4,7 @@
 
 import inspect
 import math
+from typing import Any, Literal
 
 from ..types.alias import Alias
 from ..types.array import ArraySpec
@@ -146,6 +147,55 @@ def pack(pinst: Base) -> int:
     return int(pinst)
 
 
+def to_bytes(
+    pinst: Base,
+    byteorder: Literal["little", "big"] = "little",
+    bitorder: Literal["msb", "lsb"] = "msb",
+    padding: Literal["msb", "lsb"] = "msb",
+) -> bytes:
+    """
+    Serialise an instance of a Packtype definition into bytes
+    :param pinst:     The instance of the Packtype definition to serialise
+    :param byteorder: Order of the bytes, either "little" or "big"
+    :param bitorder:  Order of the bits within each byte, either "msb" or "lsb"
+    :param padding:   Where padding bits are placed to fill the final byte,
+                      either "msb" (zero-extended) or "lsb" (left-aligned)
+    :return: The serialised value
+    """
+    if inspect.isclass(pinst) or isinstance(pinst, ArraySpec):
+        raise TypeError(f"{pinst} is not an instance of a Packtype definition")
+    if not hasattr(pinst, "_pt_to_bytes"):
+        raise TypeError(f"{pinst} cannot be serialised as it is not packed")
+    return pinst._pt_to_bytes(byteorder, bitorder, padding)
+
+
+def from_bytes(
+    ptype: type[Base],
+    data: Any,
+    byteorder: Literal["little", "big"] = "little",
+    bitorder: Literal["msb", "lsb"] = "msb",
+    padding: Literal["msb", "lsb"] = "msb",
+) -> Base:
+    """
+    Deserialise bytes into a Packtype definition
+    :param ptype:     The Packtype definition to deserialise into
+    :param data:      Any object supporting the buffer protocol
+    :param byteorder: Order of the bytes, either "little" or "big"
+    :param bitorder:  Order of the bits within each byte, either "msb" or "lsb"
+    :param padding:   Where padding bits are placed, either "msb" or "lsb"
+    :return: An instance of the Packtype definition with the deserialised value
+    """
+    if isinstance(ptype, ArraySpec):
+        return ptype._pt_from_bytes(data, byteorder, bitorder, padding)
+    if not inspect.isclass(ptype):
+        raise TypeError(f"{ptype} is an instance of a Packtype definition")
+    if issubclass(ptype, Alias):
+        return from_bytes(ptype._PT_ALIAS, data, byteorder, bitorder, padding)
+    if not issubclass(ptype, Base):
+        raise TypeError(f"{ptype} is not a Packtype definition")
+    return ptype._pt_from_bytes(data, byteorder, bitorder, padding)
+
+
 def is_scalar(ptype: type[Base] | Base) -> bool:
     """
     Check if a Packtype definition is a scalar type
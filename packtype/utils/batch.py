@@ -0,0 +1,478 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import inspect
+import itertools
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from ..common.optional import import_numpy, is_numpy_array
+from ..types.assembly import PackedAssembly
+from ..types.layout import resolve_type
+from ..types.union import Union
+
+
+class BatchError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class _Leaf:
+    """
+    Placement of a leaf field (or of every element of a leaf array field) within
+    a packed assembly, flattened through any nested assemblies.
+
+    :param path:   Dotted path to the field from the outermost assembly
+    :param lsbs:   Array of the LSB of every element, shaped by the dimensions of
+                   any enclosing arrays (zero dimensional if not an array)
+    :param width:  Width of each element in bits
+    :param signed:  Whether each element is a signed value
+    :param default: Default value of each element (sign-extended if signed)
+    """
+
+    path: str
+    lsbs: Any
+    width: int
+    signed: bool
+    default: int
+
+
+def _leaves(ptype: type[PackedAssembly], prefix: str = "", offsets: Any = None) -> Iterable[_Leaf]:
+    np = import_numpy()
+    offsets = np.zeros((), dtype=np.int64) if offsets is None else offsets
+    layout = ptype._pt_layout()
+    for field in layout.fields:
+        if field.name == "_padding":
+            continue
+        if field.is_array:
+            # Locate every element of the array relative to the assembly, then
+            # broadcast against the offsets of any enclosing arrays
+            dims = field.dimensions
+            rel = np.array(
+                [layout.element(field.name, *x)[0] for x in itertools.product(*map(range, dims))],
+                dtype=np.int64,
+            ).reshape(dims)
+            lsbs = offsets.reshape(offsets.shape + (1,) * len(dims)) + rel
+        else:
+            lsbs = offsets + field.lsb
+        base = field.base
+        if (
+            inspect.isclass(base)
+            and issubclass(base, PackedAssembly)
+            and not base._pt_layout().overlaid
+        ):
+            yield from _leaves(base, f"{prefix}{field.name}.", lsbs)
+        else:
+            signed = getattr(base, "_PT_SIGNED", False)
+            default = ptype._PT_DEF[field.name][1]
+            default = 0 if default is None or field.is_array else int(default)
+            if signed and default >= (1 << (base._PT_WIDTH - 1)):
+                default -= 1 << base._PT_WIDTH
+            yield _Leaf(f"{prefix}{field.name}", lsbs, base._PT_WIDTH, signed, default)
+
+
+def _check_type(ptype: type[PackedAssembly]) -> None:
+    if not inspect.isclass(ptype) or not issubclass(ptype, PackedAssembly):
+        raise TypeError(f"{ptype} is not a Packtype struct or register definition")
+
+
+def _dtype(width: int, signed: bool) -> Any:
+    np = import_numpy()
+    for size, unsigned_type, signed_type in (
+        (8, np.uint8, np.int8),
+        (16, np.uint16, np.int16),
+        (32, np.uint32, np.int32),
+    ):
+        if width <= size:
+            return signed_type if signed else unsigned_type
+    return np.int64 if signed else np.uint64
+
+
+def _limb_count(width: int) -> int:
+    return max(1, (width + 63) // 64)
+
+
+def _chunks(width: int) -> list[tuple[int, int]]:
+    return [(x, min(64, width - x)) for x in range(0, width, 64)]
+
+
+def _range_error(ptype: type[PackedAssembly]) -> BatchError:
+    return BatchError(
+        f"Values cannot be represented by the {ptype._PT_WIDTH} bits of {ptype.__name__}"
+    )
+
+
+def _as_limbs(ptype: type[PackedAssembly], values: Sequence[int] | Any) -> Any:
+    np = import_numpy()
+    count = _limb_count(ptype._PT_WIDTH)
+    # Limb matrices are used as-is
+    if is_numpy_array(values) and values.ndim == 2:
+        if values.dtype.kind != "u" or values.dtype.itemsize != 8:
+            raise BatchError(f"Limb matrix must contain uint64 values, not {values.dtype}")
+        if values.shape[1] != count:
+            raise BatchError(
+                f"{ptype.__name__} requires {count} limbs per value but "
+                f"{values.shape[1]} were provided"
+            )
+        return values
+    width = ptype._PT_WIDTH
+    # Sequences of values of up to 64 bits are converted through signed integers
+    # so that negative values can be detected, but any value beyond that range
+    # falls back to the checks below
+    if count == 1 and not is_numpy_array(values):
+        try:
+            values = np.asarray(values, dtype=np.int64)
+        except OverflowError:
+            pass
+    # Arrays of values of up to 64 bits are used as a single limb
+    if count == 1 and is_numpy_array(values) and values.dtype.kind in "iu":
+        # NOTE: Signed arrays are checked first as conversion wraps negative values
+        if values.dtype.kind == "i" and (values < 0).any():
+            raise _range_error(ptype)
+        limbs = values.astype(np.uint64, copy=False).reshape(-1, 1)
+        if width < 64 and (limbs >> np.uint64(width)).any():
+            raise _range_error(ptype)
+        return limbs
+    # Any other values are checked to be neither negative nor to have bits set
+    # beyond the width of the type (a negative value shifted right remains
+    # negative, so is caught by the same test)
+    values = [int(x) for x in values]
+    if any(x >> width for x in values):
+        raise _range_error(ptype)
+    if count == 1:
+        return np.array(values, dtype=np.uint64).reshape(-1, 1)
+    # Wider values are split into limbs by serialising them
+    data = b"".join(x.to_bytes(8 * count, "little") for x in values)
+    return np.frombuffer(data, dtype="<u8").reshape(-1, count)
+
+
+def _extract(limbs: Any, lsbs: Any, width: int) -> Any:
+    np = import_numpy()
+    first = lsbs // 64
+    offset = lsbs % 64
+    value = limbs[:, first] >> offset.astype(np.uint64)
+    # Fields that straddle a limb boundary combine the bits of the next limb
+    if (straddle := offset + width > 64).any():
+        upper = limbs[:, np.minimum(first + 1, limbs.shape[1] - 1)]
+        upper <<= ((64 - offset) % 64).astype(np.uint64)
+        value |= np.where(straddle, upper, np.uint64(0))
+    if width < 64:
+        value &= np.uint64((1 << width) - 1)
+    return value
+
+
+def _insert(limbs: Any, lsbs: Any, width: int, values: Any) -> None:
+    np = import_numpy()
+    first = lsbs // 64
+    offset = lsbs % 64
+    for limb in np.unique(first):
+        select = first == limb
+        shifted = values[:, select] << offset[select].astype(np.uint64)
+        limbs[:, limb] |= np.bitwise_or.reduce(shifted, axis=1)
+    # Fields that straddle a limb boundary spill their upper bits into the next
+    straddle = offset + width > 64
+    for limb in np.unique(first[straddle]):
+        select = straddle & (first == limb)
+        shifted = values[:, select] >> (64 - offset[select]).astype(np.uint64)
+        limbs[:, limb + 1] |= np.bitwise_or.reduce(shifted, axis=1)
+
+
+def limbs_from_bytes(
+    ptype: type[PackedAssembly],
+    buffer: Any,
+    byteorder: Literal["little", "big"] = "little",
+    stride: int | None = None,
+) -> Any:
+    """
+    View a buffer of packed records as a limb matrix, which can be passed
+    directly to ``unpack_many``. By default each record must occupy a whole
+    number of 64-bit limbs (i.e. ``ceil(W / 64) * 8`` bytes) and the buffer is
+    viewed without copying it. Alternatively a stride may be given, in which
+    case each record occupies ``ceil(W / 8)`` bytes at the start of every
+    ``stride`` bytes, and the records are copied into a new limb matrix unless
+    the layout allows them to be viewed in place.
+
+    :param ptype:     The struct or register definition held in the buffer
+    :param buffer:    Any object supporting the buffer protocol (e.g. ``bytes``,
+                      ``bytearray``, ``memoryview``, or ``mmap``)
+    :param byteorder: Byte order of each record, either "little" or "big"
+    :param stride:    Distance between the start of each record in bytes, a
+                      partial record at the end of the buffer is ignored
+    :return: A ``(N, ceil(W / 64))`` limb matrix, least significant limb first
+    """
+    _check_type(ptype)
+    np = import_numpy()
+    if byteorder not in ("little", "big"):
+        raise BatchError(f"Unsupported byte order '{byteorder}'")
+    count = _limb_count(ptype._PT_WIDTH)
+    record = (ptype._PT_WIDTH + 7) // 8
+    nbytes = memoryview(buffer).nbytes
+    # Records that exactly fill whole limbs can be viewed in place
+    if stride is None or stride == record == 8 * count:
+        if stride is None and nbytes % (8 * count):
+            raise BatchError(
+                f"Buffer of {nbytes} bytes is not a whole number of {8 * count} byte "
+                f"records of {ptype.__name__}"
+            )
+        limbs = np.frombuffer(
+            buffer,
+            dtype="<u8" if byteorder == "little" else ">u8",
+            count=(nbytes // (8 * count)) * count,
+        ).reshape(-1, count)
+        # NOTE: Reversing the limbs of a big endian record is a strided view
+        return limbs if byteorder == "little" else limbs[:, ::-1]
+    # Otherwise copy every record into the low bytes of a row of limbs
+    if stride < record:
+        raise BatchError(
+            f"Stride of {stride} bytes is smaller than the {record} bytes of {ptype.__name__}"
+        )
+    rows = 0 if nbytes < record else (nbytes - record) // stride + 1
+    raw = np.lib.stride_tricks.as_strided(
+        np.frombuffer(buffer, dtype=np.uint8), (rows, record), (stride, 1), writeable=False
+    )
+    padded = np.zeros((rows, 8 * count), dtype=np.uint8)
+    padded[:, :record] = raw if byteorder == "little" else raw[:, ::-1]
+    return padded.view("<u8")
+
+
+def limbs_to_bytes(limbs: Any, byteorder: Literal["little", "big"] = "little") -> bytes:
+    """
+    Serialise a limb matrix (as returned by ``pack_many_limbs``) into a buffer
+    of packed records, the inverse of ``limbs_from_bytes``.
+
+    :param limbs:     The ``(N, L)`` limb matrix, least significant limb first
+    :param byteorder: Byte order of each record, either "little" or "big"
+    :return: The serialised records
+    """
+    np = import_numpy()
+    if byteorder not in ("little", "big"):
+        raise BatchError(f"Unsupported byte order '{byteorder}'")
+    if byteorder == "little":
+        return np.ascontiguousarray(limbs, dtype="<u8").tobytes()
+    return np.ascontiguousarray(limbs[:, ::-1], dtype=">u8").tobytes()
+
+
+def unpack_many(ptype: type[PackedAssembly], values: Sequence[int] | Any) -> dict[str, Any]:
+    """
+    Unpack many packed values of a struct (or register) at once into a column
+    per leaf field, using vectorised shifts and masks derived from the layout of
+    the type rather than constructing an instance per value. Nested structs are
+    flattened, with each leaf named by its dotted path (e.g. ``header.length``),
+    while arrays add trailing dimensions to the column (so a ``Scalar[8][4]``
+    field produces a column of shape ``(N, 4)``). Enum fields are returned as
+    their integer codes, signed scalars are sign-extended, and each column uses
+    the narrowest integer type that can hold the field. Unions are treated as a
+    single leaf holding the raw value.
+
+    Values of any width are supported by treating each one as a row of 64-bit
+    limbs, least significant limb first. Fields wider than 64 bits are returned
+    as limb sub-matrices, adding a trailing dimension of ``ceil(width / 64)``
+    limbs (signed fields of this width are not sign-extended).
+
+    :param ptype:  The struct or register definition to unpack into
+    :param values: A NumPy array of packed values (for types of up to 64 bits),
+                   a ``(N, ceil(W / 64))`` uint64 limb matrix (see
+                   ``limbs_from_bytes``), or a sequence of integers
+    :return: Dictionary of NumPy arrays keyed by leaf field path
+    """
+    _check_type(ptype)
+    np = import_numpy()
+    limbs = _as_limbs(ptype, values)
+    count = limbs.shape[0]
+    columns = {}
+    for leaf in _leaves(ptype):
+        shape = leaf.lsbs.shape
+        lsbs = leaf.lsbs.reshape(-1)
+        # Wide fields are extracted as a limb sub-matrix
+        if leaf.width > 64:
+            raw = np.stack([_extract(limbs, lsbs + x, y) for x, y in _chunks(leaf.width)], axis=-1)
+            columns[leaf.path] = raw.reshape((count, *shape, raw.shape[-1]))
+            continue
+        raw = _extract(limbs, lsbs, leaf.width)
+        if leaf.signed:
+            raw = raw.view(np.int64)
+            if leaf.width < 64:
+                sign = 1 << (leaf.width - 1)
+                raw = (raw ^ sign) - sign
+        columns[leaf.path] = raw.astype(_dtype(leaf.width, leaf.signed)).reshape((count, *shape))
+    return columns
+
+
+def unpack_tagged(
+    ptype: type[Union], values: Sequence[int] | Any
+) -> dict[str, tuple[Any, dict[str, Any]]]:
+    """
+    Unpack many packed values of a tagged union at once, where the tag of every
+    value is extracted in a single vectorised step and the rows are then grouped
+    by the member that each tag selects. Each group is unpacked into columns as
+    for ``unpack_many``, so every member selected by a tag must be a struct or
+    register. Rows with a tag that does not select any member are omitted.
+
+    :param ptype:  The tagged union definition to unpack
+    :param values: A NumPy array of packed values (for types of up to 64 bits),
+                   a ``(N, ceil(W / 64))`` uint64 limb matrix, or a sequence of
+                   integers
+    :return: Dictionary keyed by member name of the indices of the rows selecting
+             that member and the dictionary of columns unpacked from those rows
+    """
+    if not inspect.isclass(ptype) or not issubclass(ptype, Union) or ptype._PT_TAG is None:
+        raise TypeError(f"{ptype} is not a Packtype tagged union definition")
+    np = import_numpy()
+    limbs = _as_limbs(ptype, values)
+    lsb, width = ptype._PT_TAG
+    tags = _extract(limbs, np.array(lsb), width)
+    unpacked = {}
+    for fname, tag_values in ptype._PT_TAGS.items():
+        rows = np.flatnonzero(np.isin(tags, tag_values))
+        unpacked[fname] = (rows, unpack_many(resolve_type(ptype._PT_DEF[fname][0]), limbs[rows]))
+    return unpacked
+
+
+def _flatten_columns(columns: Mapping[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat = {}
+    for name, column in columns.items():
+        if isinstance(column, Mapping):
+            flat.update(_flatten_columns(column, f"{prefix}{name}."))
+        else:
+            flat[f"{prefix}{name}"] = column
+    return flat
+
+
+def _first_bad_row(column: Any, low: int, high: int) -> int | None:
+    np = import_numpy()
+    rows = len(column)
+    if column.dtype.kind in "iu":
+        # NOTE: Only compare against bounds the column type can exceed, which
+        #       avoids comparisons against out-of-range Python integers
+        info = np.iinfo(column.dtype)
+        bad = np.zeros(column.shape, dtype=bool)
+        if info.min < low:
+            bad |= column < low
+        if info.max > high:
+            bad |= column > high
+    else:
+        bad = (column < low) | (column > high)
+    if not (bad := bad.reshape(rows, -1).any(axis=1)).any():
+        return None
+    return int(np.argmax(bad))
+
+
+def _is_limb_column(leaf: _Leaf, column: Any) -> bool:
+    return (
+        leaf.width > 64
+        and column.dtype.kind == "u"
+        and column.dtype.itemsize == 8
+        and column.ndim == leaf.lsbs.ndim + 2
+    )
+
+
+def pack_many_limbs(ptype: type[PackedAssembly], **columns: Any) -> Any:
+    """
+    Pack many values of a struct (or register) at once from a column per leaf
+    field into a limb matrix, see ``pack_many`` for details of the columns.
+
+    :param ptype:   The struct or register definition to pack
+    :param columns: Values for each leaf field keyed by path
+    :return: A ``(N, ceil(W / 64))`` uint64 limb matrix, least significant limb
+             first
+    """
+    _check_type(ptype)
+    np = import_numpy()
+    leaves = {x.path: x for x in _leaves(ptype)}
+    columns = _flatten_columns(columns)
+    if unknown := [x for x in columns if x not in leaves]:
+        raise BatchError(f"{ptype.__name__} does not contain a leaf field called '{unknown[0]}'")
+    columns = {x: np.asarray(y) for x, y in columns.items()}
+    # Determine the number of rows from the columns that are not broadcast
+    rows = {
+        len(y)
+        for x, y in columns.items()
+        if y.ndim > leaves[x].lsbs.ndim + _is_limb_column(leaves[x], y)
+    }
+    if len(rows) > 1:
+        raise BatchError(f"Columns have mismatched lengths: {sorted(rows)}")
+    count = rows.pop() if rows else 1
+    # Broadcast every column to the full shape and check values in range
+    error = None
+    prepared = []
+    for leaf in leaves.values():
+        column = columns.get(leaf.path, np.asarray(leaf.default))
+        if column.dtype.kind not in "biuO":
+            raise BatchError(f"Column '{leaf.path}' has non-integer type {column.dtype}")
+        limbs = _limb_count(leaf.width) if _is_limb_column(leaf, column) else 0
+        shape = (count, *leaf.lsbs.shape, *((limbs,) if limbs else ()))
+        try:
+            column = np.broadcast_to(column, shape)
+        except ValueError as e:
+            raise BatchError(
+                f"Column '{leaf.path}' of shape {column.shape} cannot be broadcast to {shape}"
+            ) from e
+        if leaf.signed:
+            low, high = -(1 << (leaf.width - 1)), (1 << (leaf.width - 1)) - 1
+        else:
+            low, high = 0, (1 << leaf.width) - 1
+        # Limb sub-matrices hold raw values, so only the most significant limb
+        # needs checking
+        if limbs:
+            top = leaf.width - 64 * (limbs - 1)
+            row = _first_bad_row(column[..., -1], 0, (1 << top) - 1)
+        else:
+            row = _first_bad_row(column, low, high)
+        if row is not None and (error is None or row < error[0]):
+            error = (row, leaf, column, low, high)
+        prepared.append((leaf, column, bool(limbs)))
+    if error is not None:
+        row, leaf, column, low, high = error
+        raise BatchError(
+            f"Row {row} of column '{leaf.path}' contains "
+            f"{np.asarray(column[row]).tolist()} which is outside the range {low} to {high}"
+        )
+    # Shift each column into place and combine them
+    packed = np.zeros((count, _limb_count(ptype._PT_WIDTH)), dtype=np.uint64)
+    for leaf, column, is_limbs in prepared:
+        lsbs = leaf.lsbs.reshape(-1)
+        mask = (1 << leaf.width) - 1
+        if leaf.width <= 64:
+            # NOTE: Signed values pass through int64 to wrap into two's complement
+            values = column.reshape(count, -1).astype(np.int64 if leaf.signed else np.uint64)
+            values = values.astype(np.uint64) & np.uint64(mask)
+            _insert(packed, lsbs, leaf.width, values)
+            continue
+        # Wide fields are split into limbs and inserted a limb at a time
+        if is_limbs:
+            values = column.astype(np.uint64).reshape(count, lsbs.size, -1)
+        else:
+            size = 8 * _limb_count(leaf.width)
+            data = b"".join((int(x) & mask).to_bytes(size, "little") for x in column.flat)
+            values = np.frombuffer(data, dtype="<u8").reshape(count, lsbs.size, -1)
+        for idx, (offset, width) in enumerate(_chunks(leaf.width)):
+            _insert(packed, lsbs + offset, width, values[..., idx].astype(np.uint64))
+    return packed
+
+
+def pack_many(ptype: type[PackedAssembly], **columns: Any) -> Any:
+    """
+    Pack many values of a struct (or register) at once from a column per leaf
+    field, the inverse of ``unpack_many``. Columns are named by the dotted path
+    to each leaf (which can be passed as ``**{"header.length": ...}``) or given
+    as nested dictionaries (``header={"length": ...}``), and may be NumPy arrays,
+    sequences, or single values that are broadcast to every row. Array fields
+    expect trailing dimensions to match (e.g. ``(N, 4)`` for ``Scalar[8][4]``),
+    while fields wider than 64 bits accept either integers or a uint64 limb
+    sub-matrix with a trailing dimension of ``ceil(width / 64)`` limbs. Any leaf
+    without a column takes its default value. Every column is range checked
+    before packing, with signed fields accepting sign-extended values.
+
+    :param ptype:   The struct or register definition to pack
+    :param columns: Values for each leaf field keyed by path
+    :return: A NumPy ``uint64`` array for types of up to 64 bits, otherwise a
+             list of integers (see ``pack_many_limbs`` to retain limbs)
+    """
+    limbs = pack_many_limbs(ptype, **columns)
+    if limbs.shape[1] == 1:
+        return limbs[:, 0].copy()
+    data = limbs.astype("<u8", copy=False).tobytes()
+    size = 8 * limbs.shape[1]
+    return [int.from_bytes(data[x : x + size], "little") for x in range(0, len(data), size)]
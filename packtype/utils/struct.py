@@ -3,6 +3,7 @@
 #
 
 from ..types.base import Base
+from ..types.layout import Layout
 from ..types.scalar import ScalarType
 from ..types.struct import Struct
 from .basic import get_name
@@ -44,6 +45,17 @@ def get_fields_lsb_asc(struct: Struct | type[Struct]) -> list[tuple[int, int, tu
     return struct._pt_fields_lsb_asc
 
 
+def get_layout(struct: Struct | type[Struct]) -> Layout:
+    """
+    Get the layout of a Packtype struct, which describes the placement of every
+    field (including padding) without constructing any instances.
+    :param struct: The Packtype struct to inspect
+    :return: The layout of the struct
+    """
+    assert isinstance(struct, Struct) or issubclass(struct, Struct)
+    return struct._pt_layout()
+
+
 def is_simple_field(field: Base) -> bool:
     """
     Check if a field in a Packtype struct is a simple scalar field and does not
@@ -0,0 +1,160 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import copy
+import mmap
+import os
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO, Literal
+
+from ..types.array import ArraySpec
+from ..types.assembly import PackedAssembly
+from ..types.union import Union
+from .batch import limbs_from_bytes, unpack_many
+
+
+class TraceError(Exception):
+    pass
+
+
+class TraceReader(Sequence):
+    """
+    Reader for a file of fixed-width packed records (for example a trace dumped
+    by a simulation), which memory maps the file so that only the pages holding
+    the records that are actually read are loaded. Records are decoded on
+    demand, either one at a time by indexing or iterating over the reader, or
+    in bulk as columns through ``unpack_many``. Slicing a reader (or iterating
+    through it in chunks) returns another reader over the same mapping, so no
+    records are copied until they are decoded.
+
+    Each record occupies ``ceil(W / 8)`` bytes at the start of every ``stride``
+    bytes, following an optional header at the start of the file.
+
+    :param ptype:     The type of every record, either a struct, register,
+                      union, or array specification
+    :param file:      Path to the file, or an open binary file
+    :param offset:    Size of any header preceding the first record in bytes
+    :param stride:    Distance between the start of each record in bytes,
+                      defaults to the size of a record
+    :param byteorder: Order of the bytes within each record
+    """
+
+    def __init__(
+        self,
+        ptype: type[PackedAssembly | Union] | ArraySpec,
+        file: str | os.PathLike | BinaryIO,
+        offset: int = 0,
+        stride: int | None = None,
+        byteorder: Literal["little", "big"] = "little",
+    ) -> None:
+        if not isinstance(ptype, ArraySpec) and not (
+            isinstance(ptype, type) and issubclass(ptype, PackedAssembly | Union)
+        ):
+            raise TypeError(f"{ptype} is not a Packtype struct, register, union, or array")
+        if byteorder not in ("little", "big"):
+            raise TraceError(f"Unsupported byte order '{byteorder}', must be 'little' or 'big'")
+        self.ptype = ptype
+        self.byteorder = byteorder
+        self.size = (ptype._PT_WIDTH + 7) // 8
+        self.stride = self.size if stride is None else stride
+        if self.stride < self.size:
+            raise TraceError(
+                f"Stride of {self.stride} bytes is smaller than the {self.size} bytes of "
+                f"each record"
+            )
+        # Map the entire file, pages are only read when they are first touched
+        if isinstance(file, str | os.PathLike):
+            with Path(file).open("rb") as fh:
+                self._mmap = self._map(fh)
+        else:
+            self._mmap = self._map(file)
+        available = (len(self._mmap) if self._mmap else 0) - offset
+        self._start = offset
+        self._count = 0 if available < self.size else (available - self.size) // self.stride + 1
+
+    @staticmethod
+    def _map(file: BinaryIO) -> mmap.mmap | None:
+        # NOTE: Empty files cannot be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the mapping of the file, which is shared by every reader sliced
+        from this one. Any column or limb matrix that views the mapping directly
+        must be released first.
+        """
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def raw(self, index: int) -> bytes:
+        """
+        Return the bytes of a single record without decoding them.
+
+        :param index: Index of the record
+        :return: The bytes of the record
+        """
+        start = self._start + range(self._count)[index] * self.stride
+        return self._mmap[start : start + self.size]
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._count)
+            if step < 0:
+                raise TraceError("Traces cannot be reversed")
+            # Slices are another reader over the same mapping
+            reader = copy.copy(self)
+            reader._start = self._start + start * self.stride
+            reader._count = len(range(start, stop, step))
+            reader.stride = self.stride * step
+            return reader
+        return self.ptype._pt_from_bytes(self.raw(key), self.byteorder)
+
+    def __iter__(self) -> Iterator[Any]:
+        for idx in range(self._count):
+            yield self[idx]
+
+    def chunks(self, size: int) -> Iterator["TraceReader"]:
+        """
+        Iterate through the records in chunks, where each chunk is a reader over
+        at most ``size`` consecutive records. Decoding each chunk in turn (for
+        example with ``unpack_many``) keeps memory usage bounded by the chunk
+        size regardless of the size of the file.
+
+        :param size: Maximum number of records in each chunk
+        :return: Iterator of readers
+        """
+        if size <= 0:
+            raise TraceError(f"Chunk size must be positive, not {size}")
+        for start in range(0, self._count, size):
+            yield self[start : start + size]
+
+    def unpack_many(self) -> dict[str, Any]:
+        """
+        Decode every record of the reader into a column per leaf field, see
+        ``packtype.utils.batch.unpack_many`` for details of the columns (this
+        is only supported for struct and register records, and requires NumPy).
+
+        :return: Dictionary of NumPy arrays keyed by leaf field path
+        """
+        if not isinstance(self.ptype, type) or not issubclass(self.ptype, PackedAssembly):
+            raise TypeError(f"{self.ptype} is not a Packtype struct or register definition")
+        if self._count == 0:
+            return unpack_many(self.ptype, [])
+        end = self._start + (self._count - 1) * self.stride + self.size
+        memory = memoryview(self._mmap)[self._start : end]
+        return unpack_many(
+            self.ptype, limbs_from_bytes(self.ptype, memory, self.byteorder, self.stride)
+        )
@@ -5,6 +5,7 @@
 from collections.abc import Iterable
 
 from ..types.base import Base
+from ..types.layout import Layout
 from ..types.scalar import ScalarType
 from ..types.union import Union
 from .basic import get_name
@@ -37,6 +38,39 @@ def get_members(union: Union | type[Union]) -> Iterable[tuple[str, Base]]:
         yield fname, finst
 
 
+def get_layout(union: Union | type[Union]) -> Layout:
+    """
+    Get the layout of a Packtype union, where every member spans the full width
+    of the union, without constructing any instances.
+    :param union: The Packtype union to inspect
+    :return: The layout of the union
+    """
+    assert isinstance(union, Union) or issubclass(union, Union)
+    return union._pt_layout()
+
+
+def is_tagged(union: Union | type[Union]) -> bool:
+    """
+    Check if a Packtype union is tagged, where a field shared by its members
+    selects which member is active.
+    :param union: The Packtype union to inspect
+    :return: True if the union is tagged, False otherwise
+    """
+    assert isinstance(union, Union) or issubclass(union, Union)
+    return union._PT_TAG is not None
+
+
+def get_dispatch(union: Union | type[Union]) -> dict[int, str]:
+    """
+    Get the dispatch table of a tagged Packtype union, mapping each tag value
+    to the name of the member that it selects.
+    :param union: The Packtype union to inspect
+    :return: Dictionary of tag value to member name (empty if not tagged)
+    """
+    assert isinstance(union, Union) or issubclass(union, Union)
+    return dict(union._PT_DISPATCH)
+
+
 def is_simple_member(member: Base) -> bool:
     """
     Check if a member in a Packtype union is a simple scalar member and does not
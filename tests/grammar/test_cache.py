@@ -0,0 +1,122 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import os
+import stat
+
+import pytest
+
+from packtype.grammar import ParseCache, parse_string
+from packtype.grammar import grammar as grammar_mod
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+DEFINITION = """
+package the_package {
+    WIDTH: constant = 4 * 3
+        "Width of a field"
+    DEPTH: constant = clog2(WIDTH) + (WIDTH - 10)
+    field_t: scalar[WIDTH]
+    enum [2] mode_t {
+        IDLE
+        BUSY
+    }
+    struct packet_t {
+        data: field_t
+        mode: mode_t
+    }
+    union either_t {
+        @tag=mode
+        pkt: packet_t = BUSY
+        raw: scalar[14]
+    }
+}
+"""
+
+
+@pytest.fixture
+def parse_cache(tmp_path):
+    previous = ParseCache.DIRECTORY
+    ParseCache.configure(tmp_path)
+    yield tmp_path
+    ParseCache.configure(previous)
+
+
+def _check(pkg) -> None:
+    assert pkg.WIDTH.value == 12
+    assert pkg.DEPTH.value == 4 + 2
+    assert pkg.WIDTH.__doc__ == "Width of a field"
+    assert pkg.packet_t._PT_WIDTH == 14
+    assert pkg.either_t._PT_DISPATCH == {1: "pkt"}
+
+
+def test_parse_cache(parse_cache, monkeypatch):
+    """Test that a cached definition is reused without parsing it again"""
+    _check(next(parse_string(DEFINITION)))
+    assert len(list(parse_cache.glob("*.pkl"))) == 1
+
+    # A cache hit never invokes the parser
+    def _fail():
+        raise AssertionError("Parser should not be used")
+
+    monkeypatch.setattr(grammar_mod, "create_parser", _fail)
+    pkg = next(parse_string(DEFINITION, keep_expression=True))
+    _check(pkg)
+    assert pkg.DEPTH._PT_EXPRESSION.evaluate({"WIDTH": 32}.get) == 5 + 22
+
+    # ...but bypassing the cache or changing the definition does
+    with pytest.raises(AssertionError, match="Parser should not be used"):
+        next(parse_string(DEFINITION, use_cache=False))
+    with pytest.raises(AssertionError, match="Parser should not be used"):
+        next(parse_string(DEFINITION.replace("4 * 3", "4 * 4")))
+
+
+def test_parse_cache_corrupt(parse_cache):
+    """Test that an unreadable cache entry is treated as a miss and replaced"""
+    next(parse_string(DEFINITION))
+    (entry,) = parse_cache.glob("*.pkl")
+    entry.write_bytes(b"garbage")
+    _check(next(parse_string(DEFINITION)))
+    assert entry.read_bytes() != b"garbage"
+    # Clearing the cache removes every entry
+    ParseCache.clear()
+    assert list(parse_cache.glob("*.pkl")) == []
+
+
+def test_parse_cache_disabled(tmp_path):
+    """Test that nothing is cached unless a directory is configured"""
+    previous = ParseCache.DIRECTORY
+    ParseCache.configure(None)
+    try:
+        _check(next(parse_string(DEFINITION)))
+        assert ParseCache.load(DEFINITION) is None
+    finally:
+        ParseCache.configure(previous)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="Requires user IDs")
+def test_parse_cache_untrusted(tmp_path, monkeypatch):
+    """Test that entries which may have been written by another user are ignored"""
+    previous = ParseCache.DIRECTORY
+    ParseCache.configure(tmp_path / "cache")
+    try:
+        next(parse_string(DEFINITION))
+        # The directory is only accessible by the current user
+        assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == 0o700
+        (entry,) = (tmp_path / "cache").glob("*.pkl")
+        assert ParseCache.load(DEFINITION) is not None
+        # Entries writable by others are ignored...
+        for mode in (0o664, 0o646):
+            entry.chmod(mode)
+            assert ParseCache.load(DEFINITION) is None
+        entry.chmod(0o600)
+        assert ParseCache.load(DEFINITION) is not None
+        # ...as are entries owned by another user
+        monkeypatch.setattr(os, "getuid", lambda: entry.stat().st_uid + 1)
+        assert ParseCache.load(DEFINITION) is None
+    finally:
+        ParseCache.configure(previous)
@@ -0,0 +1,83 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import pytest
+
+from packtype.grammar import CircularImportError, ParseCache, parse_many
+from packtype.grammar import grammar as grammar_mod
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+
+@pytest.fixture
+def spec_files(tmp_path):
+    (base := tmp_path / "base.pt").write_text(
+        "package base {\n    WIDTH: constant = 8\n    data_t: scalar[WIDTH]\n}\n"
+    )
+    (middle := tmp_path / "middle.pt").write_text(
+        "package middle {\n"
+        "    import base::data_t\n"
+        "    struct pair_t {\n        a: data_t\n        b: data_t\n    }\n"
+        "}\n"
+    )
+    (top := tmp_path / "top.pt").write_text(
+        "package top {\n"
+        "    import middle::pair_t\n"
+        "    import base::WIDTH\n"
+        "    DEPTH: constant = WIDTH * 2\n"
+        "    struct wrap_t {\n        pair: pair_t\n        flag: scalar[1]\n    }\n"
+        "}\n"
+    )
+    # Deliberately given in the reverse of their dependency order
+    return [top, middle, base]
+
+
+def _check(pkgs) -> None:
+    assert [x.__name__ for x in pkgs] == ["base", "middle", "top"]
+    _, middle, top = pkgs
+    assert middle.pair_t._PT_WIDTH == 16
+    assert top.wrap_t._PT_WIDTH == 17
+    assert top.DEPTH.value == 16
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_parse_many(spec_files, processes):
+    """Test that files given in any order are elaborated in dependency order"""
+    namespaces = {}
+    _check(list(parse_many(spec_files, namespaces=namespaces, processes=processes)))
+    assert set(namespaces) == {"base", "middle", "top"}
+
+
+def test_parse_many_cached(spec_files, tmp_path, monkeypatch):
+    """Test that cached files are elaborated without parsing them again"""
+    previous = ParseCache.DIRECTORY
+    ParseCache.configure(tmp_path / "cache")
+    try:
+        list(parse_many(spec_files, processes=2))
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 3
+
+        def _fail(*_args, **_kwds):
+            raise AssertionError("Parser should not be used")
+
+        monkeypatch.setattr(grammar_mod, "create_parser", _fail)
+        _check(list(parse_many(spec_files, processes=2)))
+    finally:
+        ParseCache.configure(previous)
+
+
+def test_parse_many_cycle(tmp_path):
+    """Test that packages importing from each other in a cycle are rejected"""
+    (file_a := tmp_path / "a.pt").write_text(
+        "package a {\n    import b::b_t\n    a_t: scalar[2]\n}\n"
+    )
+    (file_b := tmp_path / "b.pt").write_text(
+        "package b {\n    import a::a_t\n    b_t: scalar[2]\n}\n"
+    )
+    with pytest.raises(
+        CircularImportError,
+        match=r"Packages import from each other in a cycle: a.pt -> b.pt -> a.pt",
+    ):
+        list(parse_many([file_a, file_b], processes=1))
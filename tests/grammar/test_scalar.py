@@ -2,8 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from pathlib import Path
+
 import pytest
 
+from packtype import Scalar
 from packtype.grammar import ParseError, parse_string
 from packtype.types.scalar import ScalarType
 from packtype.utils import get_width
@@ -56,3 +59,33 @@ def test_parse_scalar_bad_assign():
             """
             )
         )
+
+
+def test_parse_scalar_interned():
+    """Typedefs of the same width keep their own description and source"""
+    pkg = next(
+        parse_string(
+            """
+        package the_package {
+            type_a: scalar[8]
+                "First typedef"
+            type_b: scalar[8]
+                "Second typedef"
+            struct the_struct {
+                field_a: scalar[8]
+                field_b: type_b
+            }
+        }
+        """,
+            source=Path("the_package.pt"),
+        )
+    )
+    assert pkg.type_a is not pkg.type_b
+    assert issubclass(pkg.type_a, Scalar[8])
+    assert pkg.type_a.__doc__ == "First typedef"
+    assert pkg.type_b.__doc__ == "Second typedef"
+    assert pkg.type_a._PT_SOURCE == ("the_package.pt", 3)
+    assert pkg.type_b._PT_SOURCE == ("the_package.pt", 5)
+    assert Scalar[8].__doc__ is None
+    assert pkg.the_struct._PT_DEF["field_a"][0] is Scalar[8]
+    assert pkg.the_struct._PT_DEF["field_b"][0] is pkg.type_b
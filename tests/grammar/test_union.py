@@ -121,3 +121,74 @@ def test_parse_union_bad_field_ref():
             """
             )
         )
+
+
+def test_parse_union_tagged():
+    """Parse a tagged union with enumerated and constant tag values."""
+    pkg = next(
+        parse_string(
+            """
+            package the_package {
+                KIND_STOP : constant = 2
+                enum [2] kind_t {
+                    DATA  : constant
+                    START : constant
+                }
+                struct data_t {
+                    kind    : kind_t
+                    payload : scalar[6]
+                }
+                struct ctrl_t {
+                    kind  : kind_t
+                    flags : scalar[6]
+                }
+                union packet_t {
+                    "A tagged packet"
+                    @tag=kind
+                    raw  : scalar[8]
+                    data : data_t = DATA "Data packet"
+                    ctrl : ctrl_t = START, KIND_STOP
+                }
+            }
+            """
+        )
+    )
+    assert pkg.packet_t._PT_DISPATCH == {0: "data", 1: "ctrl", 2: "ctrl"}
+    assert pkg.packet_t.__doc__ == "A tagged packet"
+    assert pkg.packet_t._pt_codec().select(0x15) == ("ctrl", (1, 5))
+
+
+def test_parse_union_tagged_errors():
+    """Check that tag values can only be listed for members of tagged unions."""
+    with pytest.raises(UnionError, match="lists tag values but the union does not declare a tag"):
+        next(
+            parse_string(
+                """
+            package the_package {
+                struct data_t {
+                    kind    : scalar[2]
+                    payload : scalar[6]
+                }
+                union packet_t {
+                    data : data_t = 1
+                }
+            }
+            """
+            )
+        )
+    with pytest.raises(UnionError, match="data_t has no field 'kind'"):
+        next(
+            parse_string(
+                """
+            package the_package {
+                struct data_t {
+                    payload : scalar[8]
+                }
+                union packet_t {
+                    @tag="kind"
+                    data : data_t = 1
+                }
+            }
+            """
+            )
+        )
@@ -5,8 +5,11 @@
 import itertools
 from random import choice, getrandbits
 
+import pytest
+
 import packtype
 from packtype import Constant, Packing, Scalar
+from packtype.types.array import ArrayError, PackedArray
 
 from ..fixtures import reset_registry
 
@@ -289,3 +292,187 @@ def test_array_multidimensional_union_member():
     assert int(inst) == data_a
     for x, y in itertools.product(range(4), range(3)):
         assert inst.member_a[x][y] == (data_a >> ((x * 3 * 2) + (y * 2))) & 0b11
+
+
+def test_array_lazy_entries():
+    """Test that array entries are only created when they are accessed"""
+
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(packing=Packing.FROM_MSB)
+    class TestStruct:
+        ab: Scalar[4]
+        cd: Scalar[16][4096]
+        ef: Scalar[2][3][4]
+
+    def _created(array) -> int:
+        return sum(x is not None for x in array._pt_entries)
+
+    inst = TestStruct()
+    assert len(inst.cd) == 4096
+    assert _created(inst.cd) == 0
+    # Packing and unpacking the whole array does not create entries
+    inst.cd._pt_set(data := getrandbits(16 * 4096))
+    assert int(inst.cd) == data
+    assert _created(inst.cd) == 0
+    # Accessing an entry only creates that entry
+    assert int(inst.cd[5]) == (data >> ((4095 - 5) * 16)) & 0xFFFF
+    assert int(inst.cd[-1]) == data & 0xFFFF
+    assert _created(inst.cd) == 2
+    assert inst.cd[5] is inst.cd[5]
+    # Assigning an entry updates the backing value
+    inst.cd[7] = 0x1234
+    assert (int(inst.cd) >> ((4095 - 7) * 16)) & 0xFFFF == 0x1234
+    assert _created(inst.cd) == 3
+    # Nested dimensions are also created lazily
+    inst.ef = (data_ef := getrandbits(2 * 3 * 4))
+    assert int(inst.ef[1][2]) == (data_ef >> (((3 - 1) * 3 + (2 - 2)) * 2)) & 0b11
+    assert _created(inst.ef) == 1
+    assert _created(inst.ef[1]) == 1
+    # Iteration still yields every entry in order
+    assert [int(x) for x in inst.ef[0]] == [(data_ef >> ((11 - x) * 2)) & 0b11 for x in range(3)]
+
+
+@pytest.mark.parametrize("packing", [Packing.FROM_LSB, Packing.FROM_MSB])
+def test_array_slice_view(packing):
+    """Test that contiguous slices are views onto the same bits"""
+
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(packing=packing)
+    class TestStruct:
+        ab: Scalar[4]
+        cd: Scalar[12][10]
+
+    inst = TestStruct()
+    inst.cd._pt_load(values := [getrandbits(12) for _ in range(10)])
+    existing = inst.cd[4]
+    view = inst.cd[3:7]
+    assert isinstance(view, PackedArray)
+    assert len(view) == 4
+    assert view._pt_width == 4 * 12
+    assert [int(x) for x in view] == values[3:7]
+    assert view[1] is existing
+    # Updates through the view are reflected in the array and vice versa
+    view[0] = 0x123
+    assert int(inst.cd[3]) == 0x123
+    inst.cd[6] = 0x456
+    assert int(view[3]) == 0x456
+    # Slices can be assigned in bulk
+    inst.cd[1:3] = [0xAAA, 0xBBB]
+    assert inst.cd._pt_to_list()[:4] == [values[0], 0xAAA, 0xBBB, 0x123]
+    assert int(inst.ab) == 0
+    # Empty and strided slices
+    assert len(inst.cd[5:5]) == 0
+    assert [int(x) for x in inst.cd[::3]] == inst.cd._pt_to_list()[::3]
+    with pytest.raises(ArrayError, match="contiguous"):
+        inst.cd[::2] = [0] * 5
+
+
+def test_array_slice_view_indices():
+    """Test that entries created through a view keep their original indices"""
+
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[4][3][10]
+
+    inst = TestStruct()
+    view = inst.ab[4:8]
+    assert tuple(view[1]._pt_dim_path) == (5,)
+    assert tuple(view[2:4][1]._pt_dim_path) == (7,)
+
+    # Per-instance arguments are resolved from the indices of the original array
+    paths = []
+
+    def _per_inst(path, *args, **kwds):
+        paths.append(tuple(path))
+        return args, kwds
+
+    view = inst.ab[6:9]
+    view._pt_per_inst = _per_inst
+    view[1]
+    assert paths == [(7,), (7, 0), (7, 1), (7, 2)]
+
+
+@pytest.mark.parametrize("packing", [Packing.FROM_LSB, Packing.FROM_MSB])
+@pytest.mark.parametrize("width", [5, 8, 16, 70])
+def test_array_bulk(packing, width):
+    """Test loading and dumping arrays from lists, bytes, and NumPy arrays"""
+
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(packing=packing)
+    class TestStruct:
+        ab: Scalar[3]
+        cd: Scalar[width][3][4]
+
+    inst = TestStruct()
+    values = [[getrandbits(width) for _ in range(3)] for _ in range(4)]
+    # Nested lists
+    inst.cd._pt_load(values)
+    assert inst.cd._pt_to_list() == values
+    for x, y in itertools.product(range(4), range(3)):
+        assert int(inst.cd[x][y]) == values[x][y]
+    assert int(inst.ab) == 0
+    # Flat lists
+    inst.cd._pt_set(0)
+    inst.cd._pt_load(list(itertools.chain.from_iterable(values)))
+    assert inst.cd._pt_to_list() == values
+    # Bytes
+    for byteorder in ("little", "big"):
+        data = inst.cd._pt_element_bytes(byteorder=byteorder)
+        assert len(data) == 12 * ((width + 7) // 8)
+        assert data[: (width + 7) // 8] == values[0][0].to_bytes((width + 7) // 8, byteorder)
+        inst.cd._pt_set(0)
+        inst.cd._pt_load(data, byteorder=byteorder)
+        assert inst.cd._pt_to_list() == values
+    # Rows can be loaded independently
+    inst.cd[2]._pt_load([1, 2, 3])
+    assert inst.cd._pt_to_list()[2] == [1, 2, 3]
+    assert inst.cd._pt_to_list()[1] == values[1]
+    # Errors
+    with pytest.raises(ArrayError, match="Expected 12 entries"):
+        inst.cd._pt_load([1, 2, 3])
+    with pytest.raises(ArrayError, match="at index 5"):
+        inst.cd._pt_load([0] * 5 + [1 << width] + [0] * 6)
+    with pytest.raises(ArrayError, match="bytes"):
+        inst.cd._pt_load(b"\x00")
+
+
+@pytest.mark.parametrize("packing", [Packing.FROM_LSB, Packing.FROM_MSB])
+@pytest.mark.parametrize("width", [5, 16, 64])
+def test_array_bulk_numpy(packing, width):
+    """Test loading and dumping arrays from NumPy arrays"""
+    np = pytest.importorskip("numpy")
+
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(packing=packing)
+    class TestStruct:
+        ab: Scalar[3]
+        cd: Scalar[width][3][4]
+
+    inst = TestStruct()
+    values = np.array([[getrandbits(width) for _ in range(3)] for _ in range(4)], dtype=np.uint64)
+    inst.cd._pt_load(values)
+    assert inst.cd._pt_to_list() == values.tolist()
+    dumped = inst.cd._pt_to_numpy()
+    assert dumped.shape == (4, 3)
+    assert (dumped == values).all()
+    # Signed input arrays are range checked
+    bad = np.zeros((4, 3), dtype=np.int64)
+    bad[2, 1] = -1
+    with pytest.raises(ArrayError, match="at index 7"):
+        inst.cd._pt_load(bad)
@@ -0,0 +1,178 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from random import getrandbits
+
+import pytest
+
+import packtype.registers
+from packtype import Constant, Packing, Scalar
+from packtype.registers import Behaviour
+from packtype.types.codec import CodecError
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+
+def test_codec_struct():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[12]
+        cd: Scalar[3]
+        ef: Scalar[9]
+
+    codec = TestStruct._pt_codec()
+    assert codec is TestStruct._pt_codec()
+    assert codec.width == 24
+
+    value = (39 << 15) | (5 << 12) | 123
+    decoded = codec.decode(value)
+    assert decoded == (123, 5, 39)
+    assert (decoded.ab, decoded.cd, decoded.ef) == (123, 5, 39)
+
+    assert codec.encode(123, 5, 39) == value
+    assert codec.encode(ab=123, cd=5, ef=39) == value
+    assert codec.encode(123, ef=39, cd=5) == value
+    assert codec.encode(cd=5) == 5 << 12
+
+
+def test_codec_struct_matches_instance():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.enum()
+    class TestEnum:
+        A: Constant
+        B: Constant
+        C: Constant
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[4]
+        cd: TestEnum
+        ef: Scalar[3][2]
+
+    @TestPkg.struct(packing=Packing.FROM_MSB, width=48)
+    class Outer:
+        gh: Inner
+        ij: Scalar[8]
+        kl: Inner[2]
+
+    codec = Outer._pt_codec()
+    for _ in range(100):
+        # NOTE: Bottom 4 bits are padding
+        value = getrandbits(44) << 4
+        inst = Outer._pt_unpack(value)
+        decoded = codec.decode(value)
+        assert decoded.gh.ab == int(inst.gh.ab)
+        assert decoded.gh.cd == int(inst.gh.cd)
+        assert decoded.gh.ef == tuple(int(x) for x in inst.gh.ef)
+        assert decoded.ij == int(inst.ij)
+        for idx in range(2):
+            assert decoded.kl[idx].ab == int(inst.kl[idx].ab)
+            assert decoded.kl[idx].cd == int(inst.kl[idx].cd)
+            assert decoded.kl[idx].ef == tuple(int(x) for x in inst.kl[idx].ef)
+        assert codec.encode(*decoded) == value
+        assert codec.encode(**decoded._asdict()) == value
+
+
+def test_codec_struct_nested_values():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.enum()
+    class TestEnum:
+        A: Constant
+        B: Constant
+        C: Constant
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[4]
+        cd: TestEnum
+
+    @TestPkg.struct()
+    class Outer:
+        ef: Inner
+        gh: Scalar[2][3]
+
+    expected = Outer(ef=Inner(ab=3, cd=TestEnum.C), gh=[1, 2, 3])._pt_pack()
+    codec = Outer._pt_codec()
+    assert codec.encode(ef={"ab": 3, "cd": TestEnum.C}, gh=[1, 2, 3]) == expected
+    assert codec.encode(ef=(3, 2), gh=(1, 2, 3)) == expected
+    assert codec.encode(ef=Inner(ab=3, cd=TestEnum.C), gh=[1, 2, 3]) == expected
+    assert codec.encode(ef=3 | (2 << 4), gh=(3 << 4) | (2 << 2) | 1) == expected
+
+
+def test_codec_struct_errors():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[4]
+        cd: Scalar[2][2]
+
+    codec = TestStruct._pt_codec()
+    with pytest.raises(CodecError, match="out of range"):
+        codec.encode(ab=16)
+    with pytest.raises(CodecError, match="out of range"):
+        codec.encode(ab=-1)
+    with pytest.raises(CodecError, match="unexpected keyword argument 'xy'"):
+        codec.encode(xy=1)
+    with pytest.raises(CodecError, match="Expected 2 entries"):
+        codec.encode(cd=[1, 2, 3])
+    with pytest.raises(CodecError, match="cannot be represented"):
+        codec.encode(cd=[1, 4])
+
+
+def test_codec_union():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[12]
+        cd: Scalar[4]
+
+    @TestPkg.union()
+    class TestUnion:
+        raw: Scalar[16]
+        split: TestStruct
+        parts: Scalar[8][2]
+
+    codec = TestUnion._pt_codec()
+    decoded = codec.decode(0x1234)
+    assert decoded.raw == 0x1234
+    assert decoded.split == (0x234, 0x1)
+    assert decoded.parts == (0x34, 0x12)
+
+    assert codec.encode(raw=0x1234) == 0x1234
+    assert codec.encode(split={"ab": 0x234, "cd": 1}) == 0x1234
+    assert codec.encode(parts=[0x34, 0x12]) == 0x1234
+    assert codec.encode(**decoded._asdict()) == 0x1234
+    with pytest.raises(CodecError, match="conflicts"):
+        codec.encode(raw=0x1234, parts=[0, 0])
+
+
+def test_codec_register_defaults():
+    @packtype.registers.register(behaviour=Behaviour.DATA_X2I)
+    class TestReg:
+        ab: Scalar[4] = 3
+        cd: Scalar[4]
+
+    codec = TestReg._pt_codec()
+    assert codec.encode() == 3
+    assert codec.encode(cd=2) == (2 << 4) | 3
+    assert codec.encode(ab=0, cd=2) == 2 << 4
+    assert codec.decode(0x21) == (1, 2)
@@ -0,0 +1,141 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import pytest
+
+import packtype
+from packtype import Constant, Deferral, Scalar, utils
+from packtype.grammar import parse_string
+from packtype.types.assembly import AssemblyField
+from packtype.types.base import DeferredAttribute
+from packtype.types.union import UnionError
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+
+def test_deferred():
+    with packtype.deferred():
+
+        @packtype.package()
+        class TestPkg:
+            Byte: Scalar[8]
+
+        @TestPkg.enum()
+        class Kind:
+            A: Constant
+            B: Constant
+            C: Constant
+
+        @TestPkg.struct()
+        class Inner:
+            kind: Kind
+            data: TestPkg.Byte
+
+        @TestPkg.struct()
+        class Outer:
+            first: Inner
+            second: Inner
+            extra: Scalar[6]
+
+        @TestPkg.struct()
+        class Unused:
+            ab: Scalar[3]
+            cd: Scalar[4]
+
+        @TestPkg.struct()
+        class Other:
+            ef: Scalar[2]
+
+    # Nothing is constructed until used
+    for ptype in (Kind, Inner, Outer, Unused):
+        assert "_PT_DEFERRED" in ptype.__dict__
+        assert isinstance(ptype.__dict__["_PT_WIDTH"], DeferredAttribute)
+    # Packages are always constructed
+    assert TestPkg.Outer is Outer
+    assert issubclass(TestPkg.Byte, Scalar[8])
+
+    # Instantiating constructs the type and any types it refers to
+    inst = Outer()
+    assert "_PT_DEFERRED" not in Outer.__dict__
+    assert "_PT_DEFERRED" not in Inner.__dict__
+    assert Outer._PT_WIDTH == 26
+    inst.first.data = 0x12
+    inst.second.kind = Kind.C
+    assert int(inst) == (0x12 << 2) | (2 << 10)
+
+    assert int(Kind.B) == 1
+    assert "_PT_DEFERRED" in Unused.__dict__
+
+    # Introspecting a type also constructs it
+    assert utils.get_width(Unused) == 7
+    assert "_PT_DEFERRED" not in Unused.__dict__
+    # ...as does accessing anything that construction adds (e.g. fields)
+    assert isinstance(Other.ef, AssemblyField)
+    assert "_PT_DEFERRED" not in Other.__dict__
+    with pytest.raises(AttributeError, match="has no attribute 'gh'"):
+        _ = Other.gh
+
+    # Types declared outside of the context are constructed immediately
+    @TestPkg.struct()
+    class Eager:
+        ab: Scalar[4]
+
+    assert "_PT_DEFERRED" not in Eager.__dict__
+    assert Eager._PT_WIDTH == 4
+
+
+def test_deferred_errors_and_source():
+    with packtype.deferred(capture_source=False):
+
+        @packtype.package()
+        class TestPkg:
+            pass
+
+        @TestPkg.union()
+        class BadUnion:
+            a: Scalar[4]
+            b: Scalar[5]
+
+        @TestPkg.struct()
+        class NoSource:
+            ab: Scalar[4]
+
+    # Errors are raised on first use
+    with pytest.raises(UnionError, match="Union member b has a width of 5"):
+        BadUnion()
+    # Source capture can be disabled
+    assert NoSource._PT_SOURCE == ("?", 0)
+    assert TestPkg._PT_SOURCE == ("?", 0)
+    assert not Deferral.ENABLED
+    assert Deferral.CAPTURE_SOURCE
+
+
+def test_deferred_grammar():
+    with packtype.deferred():
+        pkg = next(
+            parse_string(
+                """
+                package the_package {
+                    enum [2] kind_t {
+                        A : constant
+                        B : constant
+                    }
+                    struct header_t {
+                        kind : kind_t
+                        data : scalar[6]
+                    }
+                    struct [4] bad_t {
+                        data : scalar[6]
+                    }
+                }
+                """
+            )
+        )
+    assert "_PT_DEFERRED" in pkg.header_t.__dict__
+    assert pkg.header_t._pt_unpack(0x15).data._pt_width == 6
+    # Resolving everything raises errors for any deferred types
+    with pytest.raises(Exception, match="bad_t"):
+        Deferral.resolve()
@@ -216,6 +216,62 @@ def test_enum_casting():
     assert TestEnum._pt_cast(2) is TestEnum.C
     assert int(TestEnum._pt_cast(3)) == 3
 
+    # Values outside of the enumeration are not shared between casts, so that
+    # modifying the result of one cast does not affect the next
+    first = TestEnum._pt_cast(3)
+    assert first is not TestEnum._pt_cast(3)
+    assert first not in (TestEnum.A, TestEnum.B, TestEnum.C)
+    first._pt_set(1)
+    assert int(TestEnum._pt_cast(3)) == 3
+    assert int(TestEnum.B) == 1
+
+
+def test_enum_lookup():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.enum(width=3)
+    class TestEnum:
+        A: Constant = 1
+        B: Constant = 4
+        C: Constant = 6
+
+    @TestPkg.enum(width=16)
+    class WideEnum:
+        X: Constant
+        Y: Constant
+
+    # Any instance holding a member's value is named
+    assert repr(TestEnum(4)) == "<Enum::TestEnum B=4>"
+    assert repr(TestEnum(5)) == "<Enum::TestEnum ???=5>"
+    assert TestEnum._pt_name_of(6) == "C"
+    assert TestEnum._pt_name_of(7) is None
+
+    # Dense tables are indexed by value
+    assert TestEnum._pt_name_table() == (None, "A", None, None, "B", None, "C", None)
+    assert TestEnum._pt_name_table() is TestEnum._pt_name_table()
+    members = TestEnum._pt_member_table()
+    assert members[1] is TestEnum.A
+    assert members[6] is TestEnum.C
+    assert members[0] is None
+    with pytest.raises(EnumError, match="only available for enums of up to 12 bits"):
+        WideEnum._pt_name_table()
+
+    # Wide enums still cast to their members
+    assert WideEnum._pt_cast(1) is WideEnum.Y
+    assert int(WideEnum._pt_cast(100)) == 100
+
+    # Tables can be indexed by NumPy arrays of values
+    np = pytest.importorskip("numpy")
+    codes = np.array([1, 4, 6, 4], dtype=np.uint8)
+    assert np.array(TestEnum._pt_name_table(), dtype=object)[codes].tolist() == [
+        "A",
+        "B",
+        "C",
+        "B",
+    ]
+
 
 def test_enum_arithmetic():
     @packtype.package()
@@ -0,0 +1,61 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import gc
+import resource
+from pathlib import Path
+
+import pytest
+
+import packtype
+from packtype import Scalar
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+STATM = Path("/proc/self/statm")
+
+
+def _rss() -> int:
+    """Return the current resident set size of the process in bytes"""
+    gc.collect()
+    return int(STATM.read_text().split()[1]) * resource.getpagesize()
+
+
+@pytest.mark.skipif(not STATM.exists(), reason="Requires /proc/self/statm")
+def test_leaks_instances():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(width=32)
+    class TestStruct:
+        ab: Scalar[12]
+        cd: Scalar[3][3]
+
+    @TestPkg.union()
+    class TestUnion:
+        raw: Scalar[32]
+        split: TestStruct
+
+    def _churn(count: int) -> None:
+        for idx in range(count):
+            inst = TestUnion()
+            inst.split.ab = idx & 0xFFF
+            assert inst._pt_mask
+            assert inst.split._pt_mask
+            assert inst.split._pt_fields_lsb_asc
+            assert inst.split._pt_fields_msb_desc
+            assert inst.split._pt_lsb("ab") == 0
+            assert inst.split._pt_msb("ab") == 11
+            assert len(inst.split.cd) == 3
+
+    # Warm up to reach a steady state
+    _churn(10_000)
+    baseline = _rss()
+    # Create and drop a large number of instances
+    _churn(100_000)
+    # Check that the memory footprint has not grown
+    assert (_rss() - baseline) < (16 * 1024 * 1024)
@@ -87,3 +87,49 @@ def test_package_foreign():
     assert OuterStruct
     assert InnerPkg._pt_foreign() == set()
     assert OuterPkg._pt_foreign() == {InnerPkg.InnerStruct, InnerPkg.InnerType}
+
+
+def test_package_index():
+    @packtype.package()
+    class InnerPkg:
+        InnerType: Scalar[13]
+
+    @packtype.package()
+    class OuterPkg:
+        DEPTH: Constant = 4
+
+    @OuterPkg.struct()
+    class Leaf:
+        ref_td: InnerPkg.InnerType
+
+    @OuterPkg.struct()
+    class Middle:
+        left: Leaf
+        right: Leaf
+
+    # References are listed after everything that they reference
+    assert list(OuterPkg._pt_references()) == [
+        Constant,
+        InnerPkg.InnerType,
+        Leaf,
+        Middle,
+    ]
+    assert list(OuterPkg._pt_foreign()) == [InnerPkg.InnerType]
+    assert [x for x, _ in OuterPkg()._pt_constants] == ["DEPTH"]
+    assert [x for x, _ in OuterPkg()._pt_structs] == ["Leaf", "Middle"]
+
+    # The index is shared between queries...
+    index = OuterPkg._pt_index()
+    assert OuterPkg._pt_index() is index
+    assert OuterPkg()._pt_unions == ()
+
+    # ...until something else is attached to the package
+    @OuterPkg.union()
+    class Either:
+        leaf: Leaf
+        raw: Scalar[13]
+
+    assert OuterPkg._pt_index() is not index
+    assert [x for x, _ in OuterPkg()._pt_unions] == ["Either"]
+    assert [x for x, _ in OuterPkg()._pt_structs_and_unions] == ["Leaf", "Middle", "Either"]
+    assert list(OuterPkg._pt_references())[-1] is Either
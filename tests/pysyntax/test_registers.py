@@ -0,0 +1,45 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+import packtype.registers
+from packtype import Scalar
+from packtype.registers import Behaviour
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+
+def test_registers_tracking():
+    @packtype.registers.register(behaviour=Behaviour.DATA_X2I)
+    class Control:
+        enable: Scalar[1]
+        mode: Scalar[3]
+
+    @packtype.registers.register(behaviour=Behaviour.DATA_I2X)
+    class Status:
+        busy: Scalar[1]
+        error: Scalar[1]
+
+    @packtype.registers.group()
+    class Block:
+        control: Control
+        status: Status[2]
+
+    inst = Block()
+    inst._pt_track()
+    assert inst._pt_dirty() == []
+
+    # Only the registers that have been written are reported
+    inst.control.mode = 5
+    inst.status[1].error = 1
+    assert inst._pt_dirty() == [inst.control, inst.status[1]]
+    assert inst.control._pt_dirty() == ["mode"]
+    assert inst.status[1]._pt_dirty() == ["error"]
+
+    # Checkpointing clears the record for every register
+    inst._pt_checkpoint()
+    assert inst._pt_dirty() == []
+    inst.status[0].busy = 1
+    assert inst._pt_dirty() == [inst.status[0]]
@@ -2,12 +2,18 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 
+from random import getrandbits
+
 import pytest
 
 import packtype
 from packtype import Constant, Packing, Scalar
-from packtype.types.assembly import AssignmentError, WidthError
+from packtype.types import bitvector
+from packtype.types.assembly import AssemblyField, AssignmentError, TrackingError, WidthError
+from packtype.types.base import Base
+from packtype.types.bitvector import LimbBitVector
 from packtype.types.primitive import PrimitiveValueError
+from packtype.types.view import ViewError
 from packtype.types.wrap import BadAssignmentError, BadAttributeError
 
 from ..fixtures import reset_registry
@@ -384,3 +390,424 @@ def test_struct_bad_constructor():
         TestStruct(ab=123, cd=[4, 5, 6], ef=41, gh=3)
 
     assert str(e.value) == "TestStruct does not contain a field called 'gh'"
+
+
+def test_struct_field_access():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(width=32)
+    class TestStruct:
+        ab: Scalar[12]
+        cd: Scalar[3][3]
+        ef: Scalar[9]
+
+    # Fields are described by descriptors on the class
+    assert isinstance(TestStruct.ab, AssemblyField)
+    assert isinstance(TestStruct._padding, AssemblyField)
+
+    # The same field instance is returned on every access
+    inst = TestStruct(ab=123, cd=[1, 2, 3], ef=41)
+    assert inst.ab is inst.ab
+    assert inst.cd is inst.cd
+
+    # Fields can be read as integers without constructing them
+    other = TestStruct._pt_unpack(int(inst))
+    assert other._pt_get("ab") == 123
+    assert other._pt_get("cd") == (3 << 6) | (2 << 3) | 1
+    assert other._pt_get("ef") == 41
+    assert other._pt_get("_padding") == 0
+    assert int(other._padding) == 0
+    assert "ab" not in other._pt_insts
+
+    # Assignment through the descriptor updates the packed value
+    other.ef = 7
+    assert int(other) == (7 << 21) | (int(inst) & ((1 << 21) - 1))
+
+
+@pytest.mark.parametrize("packing", [Packing.FROM_LSB, Packing.FROM_MSB])
+def test_struct_layout(packing, monkeypatch):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[4]
+        cd: Scalar[3][2]
+
+    # Check that no instances are created to determine the layout
+    monkeypatch.setattr(Base, "_PT_PROFILING_ENABLED", True)
+    created = sum(Base._PT_PROFILING.values())
+
+    @TestPkg.struct(packing=packing, width=58)
+    class Outer:
+        ef: Inner
+        gh: Scalar[2][3][4]
+        ij: Inner[2]
+
+    assert sum(Base._PT_PROFILING.values()) == created
+
+    layout = Outer._pt_layout()
+    assert layout is Outer._pt_layout()
+    assert layout.width == 58
+    assert [x.name for x in layout.fields] == ["ef", "gh", "ij", "_padding"]
+    assert [x.width for x in layout.fields] == [10, 24, 20, 4]
+    assert layout.padding.width == 4
+    for field in layout.fields:
+        assert Outer._PT_RANGES[field.name] == (field.lsb, field.msb)
+    # Array element offsets must match a recursive walk of the array
+    for field in layout.fields:
+        if field.is_array:
+            for index, (msb, lsb) in field.ptype._pt_ranges(packing).items():
+                assert layout.element(field.name, *index) == (
+                    field.lsb + lsb,
+                    field.lsb + msb,
+                )
+    with pytest.raises(IndexError):
+        layout.element("gh", 4, 0)
+    # Flattening descends into nested structs but not into arrays
+    inst = Outer()
+    flat = list(layout.flat())
+    assert [x.name for x in flat] == [x[2][0] for x in inst._pt_fields_flat()]
+    assert [(x.lsb, x.msb) for x in flat] == [x[:2] for x in inst._pt_fields_flat()]
+
+
+@pytest.mark.parametrize("packing", [Packing.FROM_LSB, Packing.FROM_MSB])
+def test_struct_ranges(packing):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct(packing=packing, width=40)
+    class TestStruct:
+        ab: Scalar[4]
+        cd: Scalar[3][2][4]
+        ef: Scalar[8]
+
+    # Build the ranges the long way for comparison
+    expected = {}
+    for field in TestStruct._pt_layout().fields:
+        if field.is_array:
+            for index, (msb, lsb) in field.ptype._pt_ranges(packing).items():
+                expected[field.name, index] = (field.lsb + msb, field.lsb + lsb)
+        expected[field.name] = (field.lsb, field.msb)
+
+    ranges = TestStruct._PT_RANGES
+    assert ranges == expected
+    assert list(ranges.keys()) == list(expected.keys())
+    assert len(ranges) == len(expected) == 4 + 8
+    assert ("cd", (3, 1)) in ranges
+    assert ("cd", (4, 0)) not in ranges
+    assert ("cd", (0,)) not in ranges
+    assert ("ab", (0,)) not in ranges
+    assert "xy" not in ranges
+
+    # Elements can be addressed directly
+    inst = TestStruct()
+    for (fname, index), (msb, lsb) in ((x, y) for x, y in expected.items() if isinstance(x, tuple)):
+        assert inst._pt_lsb(fname, *index) == lsb
+        assert inst._pt_msb(fname, *index) == msb
+    # Addressing a row returns the range of all of its elements
+    assert inst._pt_lsb("cd", 1) == min(inst._pt_lsb("cd", 1, x) for x in range(2))
+    assert inst._pt_msb("cd", 1) == max(inst._pt_msb("cd", 1, x) for x in range(2))
+
+
+@pytest.mark.parametrize("packing", [Packing.FROM_LSB, Packing.FROM_MSB])
+def test_struct_wide(packing, monkeypatch):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[100]
+        cd: Scalar[3]
+
+    @TestPkg.struct(packing=packing, width=300)
+    class Outer:
+        ef: Scalar[5]
+        gh: Inner
+        ij: Scalar[64]
+        kl: Scalar[7][4]
+
+    # Wide structs are backed by limbs, which must match the integer storage
+    monkeypatch.setattr(bitvector, "LIMB_THRESHOLD", 256)
+    wide = Outer()
+    assert isinstance(wide._pt_bv, LimbBitVector)
+    monkeypatch.setattr(bitvector, "LIMB_THRESHOLD", None)
+    narrow = Outer()
+    assert not isinstance(narrow._pt_bv, LimbBitVector)
+
+    for _ in range(20):
+        for inst in (wide, narrow):
+            inst.ef = 0x15
+            inst.gh.ab = (1 << 100) - 3
+            inst.gh.cd = 5
+            inst.ij = 0xFEDCBA9876543210
+            inst.kl[2] = 0x55
+        assert int(wide) == int(narrow)
+        assert int(wide.gh.ab) == (1 << 100) - 3
+        assert int(wide.ij) == 0xFEDCBA9876543210
+        assert int(wide.kl[2]) == 0x55
+        # Whole value writes replace every limb
+        value = getrandbits(300)
+        wide._pt_set(value)
+        narrow._pt_set(value)
+        assert int(wide) == int(narrow) == value
+        assert int(wide.gh) == int(narrow.gh)
+        assert [int(x) for x in wide.kl] == [int(x) for x in narrow.kl]
+
+
+@pytest.mark.parametrize("offset", [-1, 1])
+def test_struct_out_of_range(offset):
+    width = bitvector.LIMB_THRESHOLD + offset
+
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[width]
+
+    # Every backend rejects values just beyond the width, leaving them untouched
+    inst = TestStruct()
+    assert isinstance(inst._pt_bv, LimbBitVector) == (offset > 0)
+    view = TestStruct._pt_view(bytearray((width + 7) // 8), count=1)
+    for target in (inst, view[0]):
+        target._pt_set((1 << width) - 1)
+        with pytest.raises(ValueError, match=f"out of {width} bit range"):
+            target._pt_set(1 << width)
+        assert int(target) == int(target.ab) == (1 << width) - 1
+
+
+@pytest.mark.parametrize("limbs", [False, True])
+def test_struct_tracking(limbs, monkeypatch):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[4]
+        cd: Scalar[3]
+
+    @TestPkg.struct(width=32)
+    class Outer:
+        ef: Scalar[5]
+        gh: Inner
+        ij: Scalar[2][4]
+
+    monkeypatch.setattr(bitvector, "LIMB_THRESHOLD", 1 if limbs else None)
+    inst = Outer()
+    assert isinstance(inst._pt_bv, LimbBitVector) == limbs
+
+    # Querying without tracking is an error
+    with pytest.raises(TrackingError, match="not being tracked"):
+        inst._pt_dirty()
+    bv_type = type(inst._pt_bv)
+    inst._pt_track()
+    assert inst._pt_dirty() == []
+    assert not inst._pt_is_dirty()
+
+    # Writes to fields, nested fields, and array elements are recorded
+    inst.ef = 3
+    inst.gh.cd = 2
+    assert inst._pt_dirty() == ["ef", "gh"]
+    assert inst._pt_is_dirty("gh")
+    assert not inst._pt_is_dirty("ij")
+    assert inst.gh._pt_dirty() == ["cd"]
+    inst.ij[2] = 1
+    assert inst._pt_dirty() == ["ef", "gh", "ij"]
+
+    # Checkpointing a nested struct only clears its own fields
+    inst.gh._pt_checkpoint()
+    assert inst._pt_dirty() == ["ef", "ij"]
+    inst._pt_checkpoint()
+    assert inst._pt_dirty() == []
+
+    # Writing the whole value marks every field (but not the padding)
+    inst._pt_set(0)
+    assert inst._pt_dirty() == ["ef", "gh", "ij"]
+
+    # Disabling tracking restores the original storage
+    inst._pt_track(False)
+    assert type(inst._pt_bv) is bv_type
+    with pytest.raises(TrackingError, match="not being tracked"):
+        inst._pt_is_dirty()
+
+
+@pytest.mark.parametrize("limbs", [False, True])
+def test_struct_bytes(limbs, monkeypatch):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[60]
+        cd: Scalar[9]
+
+    @TestPkg.struct()
+    class Outer:
+        ef: Scalar[5]
+        gh: Inner
+        ij: Scalar[71]
+
+    monkeypatch.setattr(bitvector, "LIMB_THRESHOLD", 1 if limbs else None)
+    for _ in range(20):
+        value = getrandbits(Outer._PT_WIDTH)
+        inst = Outer._pt_unpack(value)
+        assert isinstance(inst._pt_bv, LimbBitVector) == limbs
+        for byteorder in ("little", "big"):
+            # Whole struct
+            data = inst._pt_to_bytes(byteorder)
+            assert data == value.to_bytes(19, byteorder)
+            assert int(Outer._pt_from_bytes(data, byteorder)) == value
+            # Nested struct (held in a window of the outer bit vector)
+            data = inst.gh._pt_to_bytes(byteorder)
+            assert data == int(inst.gh).to_bytes(9, byteorder)
+            assert int(Inner._pt_from_bytes(data, byteorder)) == int(inst.gh)
+        # Bits beyond the width are discarded
+        data = bytearray(value.to_bytes(19, "little"))
+        data[-1] |= 0xE0
+        assert int(Outer._pt_from_bytes(data)) == value
+
+    # Loading bytes is recorded as a write to every bit
+    inst = Outer()
+    inst._pt_track()
+    inst._pt_bv.set_bytes(bytes(19))
+    assert inst._pt_dirty() == ["ef", "gh", "ij"]
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_struct_view(byteorder):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[13]
+        cd: Scalar[3]
+
+    @TestPkg.struct()
+    class Outer:
+        ef: Scalar[40]
+        gh: Inner
+        ij: Scalar[4][2]
+
+    # Records of 8 bytes, with a stride of 12 bytes after a 4 byte header
+    buffer = bytearray(b"\xff" * 64)
+    view = Outer._pt_view(buffer, stride=12, offset=4, byteorder=byteorder)
+    assert len(view) == 5
+    values = [getrandbits(64) for _ in range(5)]
+    for idx, value in enumerate(values):
+        view[idx] = value
+        assert int(view[idx]) == value
+        assert buffer[4 + idx * 12 : 12 + idx * 12] == value.to_bytes(8, byteorder)
+    # Bytes outside of the records are untouched
+    assert buffer[:4] == b"\xff" * 4
+    assert all(buffer[12 + x * 12 : 16 + x * 12] == b"\xff" * 4 for x in range(4))
+
+    # Field writes only change the bits of the field
+    inst = view[3]
+    inst.gh.ab = 0x1234
+    inst.ij[1] = 0x5
+    expected = (values[3] & ~(0x1FFF << 40) & ~(0xF << 60)) | (0x1234 << 40) | (0x5 << 60)
+    assert int.from_bytes(buffer[40:48], byteorder) == expected
+    assert int(inst) == expected
+
+    # ...and changes to the buffer are seen by instances
+    buffer[40:48] = (0x1122334455667788).to_bytes(8, byteorder)
+    assert int(inst.ef) == 0x4455667788
+    assert int(inst.gh) == 0x2233
+
+    # Slices and iteration share the same buffer
+    assert [int(x) for x in view[::2]] == [int(view[x]) for x in (0, 2, 4)]
+    view[1:3][1].ef = 0
+    assert int(view[2].ef) == 0
+
+    # Writes can be tracked
+    inst = view[0]
+    inst._pt_track()
+    inst.ef = 1
+    assert inst._pt_dirty() == ["ef"]
+
+
+def test_struct_view_buffers():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[12]
+        cd: Scalar[18]
+
+    # NumPy arrays can be viewed directly
+    np = pytest.importorskip("numpy")
+    array = np.zeros(4, dtype=np.uint32)
+    view = TestStruct._pt_view(array)
+    assert len(view) == 4
+    view[2].cd = 0x2ABCD
+    assert array[2] == 0x2ABCD << 12
+    # Bits beyond the width are preserved
+    array[1] = 0xC0000000
+    view[1].cd = 0x3FFFF
+    assert array[1] == 0xFFFFF000
+    assert int(view[1]) == 0x3FFFF000
+
+    # Read-only buffers can be read but not written
+    view = TestStruct._pt_view(b"\x01\x20\x00\x00", count=1)
+    assert (int(view[0].ab), int(view[0].cd)) == (1, 2)
+    with pytest.raises(TypeError):
+        view[0].ab = 3
+
+    with pytest.raises(ViewError, match="cannot hold 3 records"):
+        TestStruct._pt_view(bytearray(8), count=3)
+    with pytest.raises(ViewError, match="smaller than the 4 bytes"):
+        TestStruct._pt_view(bytearray(8), stride=2)
+
+
+def test_struct_iter():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[5]
+        cd: Scalar[3]
+
+    @TestPkg.struct()
+    class Outer:
+        ef: Scalar[12]
+        gh: Inner
+        ij: Scalar[4][2]
+
+    values = [getrandbits(Outer._PT_WIDTH) for _ in range(50)]
+    cursor, fields, kept = None, None, []
+    for idx, rec in enumerate(Outer._pt_iter(values)):
+        # The same instance, fields, and windows are reused for every value
+        if cursor is None:
+            cursor, fields = rec, (rec.ef, rec.gh, rec.gh.ab, rec.ij, rec.ij[1])
+        assert rec is cursor
+        current = (rec.ef, rec.gh, rec.gh.ab, rec.ij, rec.ij[1])
+        assert all(x is y for x, y in zip(current, fields, strict=True))
+        assert int(rec) == values[idx]
+        assert int(rec.gh.cd) == (values[idx] >> 17) & 0x7
+        if idx % 10 == 0:
+            kept.append(rec._pt_copy())
+    # Copies are independent of the cursor
+    assert [int(x) for x in kept] == values[::10]
+    assert all(x is not cursor for x in kept)
+
+    # Bytes are also accepted
+    data = [x.to_bytes(4, "big") for x in values]
+    assert [int(x) for x in Outer._pt_iter(data, byteorder="big")] == values
+
+    with pytest.raises(ValueError, match="out of 28 bit range"):
+        list(Outer._pt_iter([1 << 30]))
@@ -42,3 +42,45 @@ def test_typedef_alias():
     assert issubclass(PkgB().MyAlias, Alias)
     inst = PkgB().MyAlias()
     assert isinstance(inst, Header)
+
+
+def test_typedef_interned():
+    # Every use of the same width and signedness shares one class
+    assert Scalar[8] is Scalar[8]
+    assert Scalar[8, True] is Scalar[8, True]
+    assert Scalar[8] is not Scalar[8, True]
+    assert Scalar[8].__name__ == "ScalarType_8"
+
+    @packtype.package()
+    class PkgA:
+        TypeA: Scalar[8]
+        TypeB: Scalar[8]
+
+    @PkgA.struct()
+    class Header:
+        address: Scalar[8]
+        length: PkgA.TypeA
+
+    @packtype.package()
+    class PkgB:
+        TypeA: Scalar[8]
+        MyAlias: Alias[Header]
+
+    # Typedefs derive their own class, tracking the package they belong to
+    assert PkgA.TypeA is not PkgA.TypeB
+    assert PkgA.TypeA is not PkgB.TypeA
+    assert issubclass(PkgA.TypeA, Scalar[8])
+    assert PkgA.TypeA._PT_ATTACHED_TO is PkgA
+    assert PkgB.TypeA._PT_ATTACHED_TO is PkgB
+    assert PkgA.TypeA._pt_name() == "TypeA"
+    assert PkgA.TypeB._pt_name() == "TypeB"
+    assert PkgA.TypeA._PT_SOURCE == PkgA._PT_SOURCE
+    # ...while the interned class is left untouched
+    assert Scalar[8]._PT_ATTACHED_TO is None
+    assert Scalar[8]._pt_name() == "Unsigned Scalar[8]"
+    assert Header._PT_DEF["address"][0] is Scalar[8]
+    assert Header._PT_DEF["length"][0] is PkgA.TypeA
+    # Aliases are interned in the same way
+    assert Alias[Header] is Alias[Header]
+    assert PkgB.MyAlias is not Alias[Header]
+    assert PkgB.MyAlias._PT_ALIAS is Header
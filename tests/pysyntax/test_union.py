@@ -6,7 +6,9 @@ import pytest
 
 import packtype
 from packtype import Constant, Scalar
+from packtype.types.codec import CodecError
 from packtype.types.union import UnionError
+from packtype.types.wrap import BadAssignmentError
 
 from ..fixtures import reset_registry
 
@@ -222,3 +224,169 @@ def test_union_functions():
     assert int(inst_0.get_b()) == 0x73
     assert int(inst_1.get_a()) == 0x51
     assert int(inst_1.get_b()) == 0x9
+
+
+def test_union_member_access():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[4]
+        cd: Scalar[4]
+
+    @TestPkg.union()
+    class TestUnion:
+        raw: Scalar[8]
+        split: TestStruct
+
+    inst = TestUnion(0x5A)
+    assert inst._pt_get("raw") == 0x5A
+    assert inst._pt_get("split") == 0x5A
+    assert not inst._pt_insts
+    assert inst.split is inst.split
+    inst.split.cd = 0x3
+    assert inst._pt_get("raw") == 0x3A
+    inst.raw = 0x12
+    assert int(inst.split.ab) == 0x2
+
+
+def test_union_tagged():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.enum(width=3)
+    class Kind:
+        DATA: Constant
+        START: Constant
+        STOP: Constant
+        IDLE: Constant
+
+    @TestPkg.struct()
+    class Header:
+        parity: Scalar[1]
+        kind: Kind
+
+    @TestPkg.struct()
+    class Data:
+        header: Header
+        payload: Scalar[12]
+
+    @TestPkg.struct()
+    class Control:
+        header: Header
+        port: Scalar[4]
+        flags: Scalar[8]
+
+    @TestPkg.union(tag="header.kind")
+    class Packet:
+        raw: Scalar[16]
+        data: Data = Kind.DATA
+        ctrl: Control = (Kind.START, Kind.STOP)
+
+    assert Packet._PT_TAG == (1, 3)
+    assert Packet._PT_DISPATCH == {0: "data", 1: "ctrl", 2: "ctrl"}
+    # Tag values are not treated as defaults for the member
+    assert int(Packet()) == 0
+
+    # Select the member from an instance
+    inst = Packet(0x3C_A4)
+    assert inst._pt_tag == Kind.STOP
+    assert inst._pt_selected == "ctrl"
+    assert inst._pt_select() is inst.ctrl
+    assert int(inst._pt_select().flags) == 0x3C
+    inst.raw = 0x3C_A6
+    assert inst._pt_selected is None
+    with pytest.raises(UnionError, match="Tag value 3 of Packet does not select a member"):
+        inst._pt_select()
+
+    # Decode only the selected member through the codec
+    codec = Packet._pt_codec()
+    name, value = codec.select(0x3C_A4)
+    assert name == "ctrl"
+    assert (value.header.kind, value.port, value.flags) == (Kind.STOP, 0xA, 0x3C)
+    name, value = codec.select(0x3C_A0)
+    assert name == "data"
+    assert value.payload == 0x3CA
+    assert list(map(codec.select, [0x10, 0x12])) == [
+        ("data", Data._pt_codec().decode(0x10)),
+        ("ctrl", Control._pt_codec().decode(0x12)),
+    ]
+    with pytest.raises(CodecError, match="0x6 does not select a member"):
+        codec.select(0x6)
+
+    # Untagged unions can't be selected from
+    @TestPkg.union()
+    class Untagged:
+        data: Data
+        ctrl: Control
+
+    assert Untagged._PT_TAG is None
+    with pytest.raises(UnionError, match="Untagged is not a tagged union"):
+        Untagged()._pt_select()
+    with pytest.raises(CodecError, match="Untagged is not a tagged union"):
+        Untagged._pt_codec().select(0)
+
+
+def test_union_tagged_errors():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class StructA:
+        kind: Scalar[2]
+        data: Scalar[6]
+
+    @TestPkg.struct()
+    class StructB:
+        data: Scalar[6]
+        kind: Scalar[2]
+
+    with pytest.raises(BadAssignmentError, match="cannot be assigned an initial value"):
+
+        @TestPkg.union()
+        class Untagged:
+            a: StructA = 1
+
+    # Members of a tagged union may only be assigned tag values
+    for bad in ("1", 1.5, (), StructA()):
+        with pytest.raises(BadAssignmentError, match="cannot be assigned an initial value"):
+
+            @TestPkg.union(tag="kind")
+            class BadTag:
+                a: StructA = bad
+
+    with pytest.raises(UnionError, match="member b occupies bits 7:6 which differs from bits 1:0"):
+
+        @TestPkg.union(tag="kind")
+        class Misplaced:
+            a: StructA = 1
+            b: StructB = 2
+
+    with pytest.raises(UnionError, match="Tag value 1 of union member b is already used by a"):
+
+        @TestPkg.union(tag="kind")
+        class Duplicate:
+            a: StructA = 1
+            b: StructA = (2, 1)
+
+    with pytest.raises(UnionError, match="Tag value 4 of union member a cannot be represented"):
+
+        @TestPkg.union(tag="kind")
+        class TooWide:
+            a: StructA = 4
+
+    with pytest.raises(UnionError, match="StructA has no field 'other' for the tag 'other'"):
+
+        @TestPkg.union(tag="other")
+        class NoField:
+            a: StructA = 1
+
+    with pytest.raises(UnionError, match="does not select any members"):
+
+        @TestPkg.union(tag="kind")
+        class NoMembers:
+            a: StructA
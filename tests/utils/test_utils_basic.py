@@ -9,6 +9,7 @@ import pytest
 import packtype
 from packtype import Constant, Scalar, utils
 from packtype.types.scalar import ScalarType
+from packtype.types.serial import SerialError
 
 from ..fixtures import reset_registry
 
@@ -167,3 +168,56 @@ def test_utils_basic_bad_unpack_pack():
 
     with pytest.raises(TypeError):
         utils.pack(TestUnion)
+
+
+def test_utils_basic_to_from_bytes():
+    @packtype.package()
+    class TestPkg:
+        sc_unsigned: Scalar[12]
+
+    @TestPkg.struct()
+    class TestStruct:
+        a: Scalar[4]
+        b: Scalar[8]
+
+    @TestPkg.enum()
+    class TestEnum:
+        A: Constant = 0x1
+        B: Constant = 0x2
+
+    # Scalars are zero-extended to whole bytes
+    inst_sc = TestPkg.sc_unsigned(0x123)
+    assert utils.to_bytes(inst_sc) == b"\x23\x01"
+    assert utils.to_bytes(inst_sc, byteorder="big") == b"\x01\x23"
+    assert int(utils.from_bytes(TestPkg.sc_unsigned, b"\x23\x01")) == 0x123
+
+    # Left-aligned padding places the value in the upper bits
+    assert utils.to_bytes(inst_sc, byteorder="big", padding="lsb") == b"\x12\x30"
+    inst_sc = utils.from_bytes(TestPkg.sc_unsigned, b"\x12\x3f", byteorder="big", padding="lsb")
+    assert int(inst_sc) == 0x123
+
+    # Bit order reverses the bits within each byte
+    inst_struct = TestStruct(a=0x1, b=0x80)
+    assert utils.to_bytes(inst_struct) == b"\x01\x08"
+    assert utils.to_bytes(inst_struct, bitorder="lsb") == b"\x80\x10"
+    inst_struct = utils.from_bytes(TestStruct, bytearray(b"\x80\x10"), bitorder="lsb")
+    assert (int(inst_struct.a), int(inst_struct.b)) == (0x1, 0x80)
+
+    # Enums resolve to their members
+    assert utils.from_bytes(TestEnum, b"\x02") is TestEnum.B
+    assert utils.to_bytes(TestEnum.A) == b"\x01"
+
+    # Packed arrays serialise as a whole
+    inst_arr = utils.from_bytes(Scalar[4][3], memoryview(b"\x21\x03"))
+    assert [int(x) for x in inst_arr] == [1, 2, 3]
+    assert utils.to_bytes(inst_arr) == b"\x21\x03"
+
+    # Errors
+    with pytest.raises(TypeError):
+        utils.to_bytes(TestStruct)
+    with pytest.raises(TypeError):
+        utils.from_bytes(TestStruct(), b"\x00\x00")
+    with pytest.raises(SerialError, match="Expected 2 bytes to hold 12 bits"):
+        utils.from_bytes(TestStruct, b"\x00")
+    with pytest.raises(SerialError, match="Unsupported byte order"):
+        utils.to_bytes(TestStruct(), byteorder="middle")
@@ -0,0 +1,299 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from random import getrandbits
+
+import pytest
+
+import packtype
+from packtype import Constant, Packing, Scalar, utils
+from packtype.utils.batch import BatchError
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+np = pytest.importorskip("numpy")
+
+
+def _signed(value: int, width: int) -> int:
+    return value - (1 << width) if value >> (width - 1) else value
+
+
+@pytest.mark.parametrize("wide", [False, True])
+def test_utils_batch_unpack_many(wide):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.enum()
+    class TestEnum:
+        A: Constant
+        B: Constant
+        C: Constant
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[4]
+        cd: TestEnum
+
+    @TestPkg.struct(packing=Packing.FROM_MSB, width=100 if wide else 40)
+    class Outer:
+        ef: Scalar[5, True]
+        gh: Inner
+        ij: Scalar[3][2]
+        kl: Inner[2]
+
+    values = [getrandbits(Outer._PT_WIDTH) for _ in range(100)]
+    columns = utils.unpack_many(Outer, values if wide else np.array(values, dtype=np.uint64))
+
+    assert list(columns.keys()) == ["ef", "gh.ab", "gh.cd", "ij", "kl.ab", "kl.cd"]
+    assert columns["ef"].dtype == np.int8
+    assert columns["gh.ab"].dtype == np.uint8
+    assert columns["gh.ab"].shape == (100,)
+    assert columns["ij"].shape == (100, 2)
+    assert columns["kl.cd"].shape == (100, 2)
+
+    for idx, value in enumerate(values):
+        inst = Outer._pt_unpack(value)
+        assert columns["ef"][idx] == _signed(int(inst.ef), 5)
+        assert columns["gh.ab"][idx] == int(inst.gh.ab)
+        assert columns["gh.cd"][idx] == int(inst.gh.cd)
+        assert columns["ij"][idx].tolist() == [int(x) for x in inst.ij]
+        assert columns["kl.ab"][idx].tolist() == [int(x.ab) for x in inst.kl]
+        assert columns["kl.cd"][idx].tolist() == [int(x.cd) for x in inst.kl]
+
+
+def test_utils_batch_unpack_many_bad_type():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.union()
+    class TestUnion:
+        ab: Scalar[8]
+
+    with pytest.raises(TypeError, match="is not a Packtype struct"):
+        utils.unpack_many(TestUnion, [1, 2, 3])
+
+
+@pytest.mark.parametrize("width", [4, 64, 100])
+def test_utils_batch_unpack_many_out_of_range(width):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[width]
+
+    # The full range of the width is accepted
+    top = (1 << width) - 1
+    columns = utils.unpack_many(TestStruct, [0, top])
+    assert [int(x) for x in utils.pack_many(TestStruct, **columns)] == [0, top]
+    # ...but values with bits set beyond the width, or negative values, are not
+    match = f"cannot be represented by the {width} bits of TestStruct"
+    for values in ([1, top + 1], [-1], [1 << 130]):
+        with pytest.raises(BatchError, match=match):
+            utils.unpack_many(TestStruct, values)
+    with pytest.raises(BatchError, match=match):
+        utils.unpack_many(TestStruct, np.array([0, -1], dtype=np.int64))
+    if width < 64:
+        with pytest.raises(BatchError, match=match):
+            utils.unpack_many(TestStruct, np.array([0, top + 1], dtype=np.uint64))
+
+
+@pytest.mark.parametrize("wide", [False, True])
+def test_utils_batch_unpack_tagged(wide):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    width = 72 if wide else 16
+
+    @TestPkg.struct(width=width)
+    class Data:
+        kind: Scalar[2]
+        payload: Scalar[12]
+
+    @TestPkg.struct(width=width)
+    class Control:
+        kind: Scalar[2]
+        port: Scalar[4]
+        flags: Scalar[8]
+
+    @TestPkg.union(tag="kind")
+    class Packet:
+        raw: Scalar[width]
+        data: Data = 0
+        ctrl: Control = (1, 2)
+
+    values = [getrandbits(width) for _ in range(200)]
+    unpacked = utils.unpack_tagged(Packet, values if wide else np.array(values, dtype=np.uint64))
+    assert list(unpacked.keys()) == ["data", "ctrl"]
+    rows, columns = unpacked["data"]
+    assert rows.tolist() == [i for i, x in enumerate(values) if x & 3 == 0]
+    assert columns["payload"].tolist() == [(values[i] >> 2) & 0xFFF for i in rows]
+    rows, columns = unpacked["ctrl"]
+    assert rows.tolist() == [i for i, x in enumerate(values) if x & 3 in (1, 2)]
+    assert columns["kind"].tolist() == [values[i] & 3 for i in rows]
+    assert columns["flags"].tolist() == [(values[i] >> 6) & 0xFF for i in rows]
+
+    with pytest.raises(TypeError, match="is not a Packtype tagged union"):
+        utils.unpack_tagged(Data, values)
+
+
+@pytest.mark.parametrize("wide", [False, True])
+def test_utils_batch_pack_many(wide):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.enum()
+    class TestEnum:
+        A: Constant
+        B: Constant
+        C: Constant
+
+    @TestPkg.struct()
+    class Inner:
+        ab: Scalar[4]
+        cd: TestEnum
+
+    @TestPkg.struct(packing=Packing.FROM_MSB, width=100 if wide else 40)
+    class Outer:
+        ef: Scalar[5, True]
+        gh: Inner
+        ij: Scalar[3][2]
+        kl: Inner[2]
+
+    # Round trip through columns (padding is not a leaf so is not preserved)
+    padding = Outer._pt_layout().padding
+    values = [getrandbits(Outer._PT_WIDTH) >> padding.width << padding.width for _ in range(100)]
+    packed = utils.pack_many(Outer, **utils.unpack_many(Outer, values))
+    if wide:
+        assert packed == values
+    else:
+        assert packed.dtype == np.uint64
+        assert packed.tolist() == values
+
+    # Columns can be nested, broadcast, or omitted
+    packed = utils.pack_many(
+        Outer, ef=[-3, 7], gh={"ab": np.array([1, 2]), "cd": TestEnum.C}, ij=[[1, 2], [3, 4]]
+    )
+    for idx, (ef, ab, ij) in enumerate([(-3, 1, [1, 2]), (7, 2, [3, 4])]):
+        inst = Outer(ef=ef & 0x1F, ij=ij)
+        inst.gh.ab = ab
+        inst.gh.cd = TestEnum.C
+        assert int(packed[idx]) == int(inst)
+
+
+def test_utils_batch_pack_many_errors():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[4]
+        cd: Scalar[3, True]
+        ef: Scalar[2][2]
+
+    # The first offending row is reported, regardless of column order
+    with pytest.raises(BatchError, match="Row 2 of column 'ab' contains 16"):
+        utils.pack_many(TestStruct, ab=[0, 1, 16, 17], cd=[0, 0, 0, -5])
+    with pytest.raises(BatchError, match="Row 1 of column 'cd' contains -5"):
+        utils.pack_many(TestStruct, ab=[0, 1, 16, 17], cd=[0, -5, 0, 0])
+    with pytest.raises(BatchError, match=r"Row 0 of column 'ef' contains \[1, 4\]"):
+        utils.pack_many(TestStruct, ef=[[1, 4]])
+    with pytest.raises(BatchError, match="does not contain a leaf field called 'xy'"):
+        utils.pack_many(TestStruct, xy=[1])
+    with pytest.raises(BatchError, match="mismatched lengths"):
+        utils.pack_many(TestStruct, ab=[1, 2], cd=[1, 2, 3])
+    with pytest.raises(BatchError, match="non-integer type"):
+        utils.pack_many(TestStruct, ab=[1.5])
+
+
+def _limbs(value: int, count: int) -> list[int]:
+    return [(value >> (64 * x)) & ((1 << 64) - 1) for x in range(count)]
+
+
+def test_utils_batch_limbs():
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[60]
+        cd: Scalar[10, True]
+        ef: Scalar[100]
+        gh: Scalar[7][3]
+        ij: Scalar[9]
+
+    # Fields straddle limb boundaries and 'ef' is wider than a limb
+    assert TestStruct._PT_WIDTH == 200
+    values = [getrandbits(200) for _ in range(50)]
+    columns = utils.unpack_many(TestStruct, values)
+    assert columns["ab"].dtype == np.uint64
+    assert columns["cd"].dtype == np.int16
+    assert columns["ef"].dtype == np.uint64
+    assert columns["ef"].shape == (50, 2)
+    assert columns["gh"].shape == (50, 3)
+    for idx, value in enumerate(values):
+        inst = TestStruct._pt_unpack(value)
+        assert columns["ab"][idx] == int(inst.ab)
+        assert columns["cd"][idx] == _signed(int(inst.cd), 10)
+        assert columns["ef"][idx].tolist() == _limbs(int(inst.ef), 2)
+        assert columns["gh"][idx].tolist() == [int(x) for x in inst.gh]
+        assert columns["ij"][idx] == int(inst.ij)
+
+    # Packing round trips through both limb matrices and integers
+    limbs = utils.pack_many_limbs(TestStruct, **columns)
+    assert limbs.shape == (50, 4)
+    assert limbs.tolist() == [_limbs(x, 4) for x in values]
+    assert utils.pack_many(TestStruct, **columns) == values
+    assert utils.pack_many(TestStruct, ef=[int(TestStruct._pt_unpack(x).ef) for x in values]) == [
+        int(TestStruct._pt_unpack(x).ef) << 70 for x in values
+    ]
+    with pytest.raises(BatchError, match="Row 1 of column 'ef'"):
+        utils.pack_many(TestStruct, ef=[0, 1 << 100])
+    with pytest.raises(BatchError, match="Row 0 of column 'ef'"):
+        utils.pack_many(TestStruct, ef=np.array([[0, 1 << 36]], dtype=np.uint64))
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_utils_batch_limbs_from_bytes(byteorder):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class TestStruct:
+        ab: Scalar[40]
+        cd: Scalar[50]
+        ef: Scalar[30]
+
+    values = [getrandbits(120) for _ in range(20)]
+    buffer = bytearray(b"".join(x.to_bytes(16, byteorder) for x in values))
+    limbs = utils.limbs_from_bytes(TestStruct, buffer, byteorder)
+    assert np.shares_memory(limbs, np.frombuffer(buffer, dtype=np.uint8))
+    columns = utils.unpack_many(TestStruct, limbs)
+    for idx, value in enumerate(values):
+        assert columns["ab"][idx] == value & ((1 << 40) - 1)
+        assert columns["cd"][idx] == (value >> 40) & ((1 << 50) - 1)
+        assert columns["ef"][idx] == value >> 90
+    packed = utils.pack_many_limbs(TestStruct, **columns)
+    assert utils.limbs_to_bytes(packed, byteorder) == bytes(buffer)
+
+    # Records of 15 bytes every 20 bytes are copied into limbs
+    strided = b"".join(x.to_bytes(15, byteorder) + b"\xff" * 5 for x in values)
+    limbs = utils.limbs_from_bytes(TestStruct, strided[:-5], byteorder, stride=20)
+    assert not np.shares_memory(limbs, np.frombuffer(strided, dtype=np.uint8))
+    assert limbs.tolist() == [_limbs(x, 2) for x in values]
+
+    with pytest.raises(BatchError, match="not a whole number of 16 byte records"):
+        utils.limbs_from_bytes(TestStruct, bytes(24), byteorder)
+    with pytest.raises(BatchError, match="Unsupported byte order"):
+        utils.limbs_from_bytes(TestStruct, bytes(16), "middle")
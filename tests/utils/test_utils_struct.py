@@ -97,3 +97,24 @@ def test_utils_struct_get_field_type():
     struct = StructA()
     assert utils.struct.get_field_type(struct.field_a) is None
     assert utils.struct.get_field_type(struct.field_b) == "some_type"
+
+
+def test_utils_struct_get_layout():
+    @packtype.package()
+    class PackageA:
+        pass
+
+    @PackageA.struct(width=32)
+    class StructA:
+        field_a: Scalar[8]
+        field_b: Scalar[4][4]
+
+    layout = utils.struct.get_layout(StructA)
+    assert layout is utils.struct.get_layout(StructA())
+    assert [(x.name, x.lsb, x.msb) for x in layout.msb_desc] == [
+        ("_padding", 24, 31),
+        ("field_b", 8, 23),
+        ("field_a", 0, 7),
+    ]
+    assert layout.by_name["field_b"].dimensions == (4,)
+    assert layout.element("field_b", 2) == (16, 19)
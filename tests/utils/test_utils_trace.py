@@ -0,0 +1,107 @@
+# Copyright 2023-2025, Peter Birch, mailto:peter@intuity.io
+# SPDX-License-Identifier: Apache-2.0
+#
+
+from random import getrandbits
+
+import pytest
+
+import packtype
+from packtype import Scalar, utils
+from packtype.utils.trace import TraceError, TraceReader
+
+from ..fixtures import reset_registry
+
+assert reset_registry
+
+
+@pytest.mark.parametrize("byteorder", ["little", "big"])
+def test_utils_trace_reader(tmp_path, byteorder):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.struct()
+    class Record:
+        ab: Scalar[30]
+        cd: Scalar[7]
+        ef: Scalar[3][4]
+
+    # Records of 7 bytes every 8 bytes, following a 16 byte header
+    values = [getrandbits(Record._PT_WIDTH) for _ in range(100)]
+    path = tmp_path / "trace.bin"
+    with path.open("wb") as fh:
+        fh.write(b"HEADER".ljust(16, b"\x00"))
+        for value in values:
+            fh.write(value.to_bytes(7, byteorder) + b"\xee")
+
+    with TraceReader(Record, path, offset=16, stride=8, byteorder=byteorder) as trace:
+        assert len(trace) == 100
+        # Random access
+        assert int(trace[0]) == values[0]
+        assert int(trace[57]) == values[57]
+        assert int(trace[-1]) == values[-1]
+        assert trace.raw(3) == values[3].to_bytes(7, byteorder)
+        with pytest.raises(IndexError):
+            trace[100]
+        # Slicing and iteration
+        assert [int(x) for x in trace[10:20:3]] == values[10:20:3]
+        assert [int(x) for x in trace] == values
+        # Chunks
+        chunks = list(trace.chunks(30))
+        assert [len(x) for x in chunks] == [30, 30, 30, 10]
+        assert [int(x) for x in chunks[3]] == values[90:]
+        # Batch decode (of the whole trace, a chunk, or a strided slice)
+        pytest.importorskip("numpy")
+        for reader, expected in (
+            (trace, values),
+            (chunks[1], values[30:60]),
+            (trace[5::7], values[5::7]),
+        ):
+            columns = reader.unpack_many()
+            assert columns["ab"].tolist() == [x & ((1 << 30) - 1) for x in expected]
+            assert columns["cd"].tolist() == [(x >> 30) & 0x7F for x in expected]
+            assert columns["ef"][:, 2].tolist() == [(x >> 43) & 0x7 for x in expected]
+
+
+def test_utils_trace_reader_types(tmp_path):
+    @packtype.package()
+    class TestPkg:
+        pass
+
+    @TestPkg.union()
+    class TestUnion:
+        raw: Scalar[16]
+        parts: Scalar[8][2]
+
+    path = tmp_path / "trace.bin"
+    path.write_bytes(bytes(range(32)))
+
+    # Unions and arrays can be read, but not batch decoded
+    with path.open("rb") as fh:
+        trace = TraceReader(TestUnion, fh)
+    assert len(trace) == 16
+    assert int(trace[1].raw) == 0x0302
+    with pytest.raises(TypeError, match="is not a Packtype struct"):
+        trace.unpack_many()
+    trace.close()
+
+    with TraceReader(Scalar[8][4], path) as trace:
+        assert len(trace) == 8
+        assert [int(x) for x in trace[2]] == [8, 9, 10, 11]
+
+    # Partial records at the end of the file are ignored
+    with TraceReader(Scalar[8][5], path) as trace:
+        assert len(trace) == 6
+
+    # Empty files have no records
+    (empty := tmp_path / "empty.bin").write_bytes(b"")
+    with TraceReader(TestUnion, empty) as trace:
+        assert len(trace) == 0
+        assert list(trace.chunks(10)) == []
+
+    with pytest.raises(TypeError, match="is not a Packtype struct"):
+        TraceReader(Scalar[8], path)
+    with pytest.raises(TraceError, match="smaller than the 2 bytes"):
+        TraceReader(TestUnion, path, stride=1)
+    assert utils.trace.TraceReader is TraceReader
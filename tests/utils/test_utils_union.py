@@ -79,3 +79,54 @@ def test_utils_union_get_member_type():
     union = UnionA()
     assert utils.union.get_member_type(union.raw) is None
     assert utils.union.get_member_type(union.ref) == "some_type"
+
+
+def test_utils_union_get_layout():
+    @packtype.package()
+    class PackageA:
+        pass
+
+    @PackageA.struct()
+    class StructA:
+        field_a: Scalar[8]
+        field_b: Scalar[8]
+
+    @PackageA.union()
+    class UnionA:
+        raw: Scalar[16]
+        struct_a: StructA
+        parts: Scalar[4][4]
+
+    layout = utils.union.get_layout(UnionA)
+    assert layout.overlaid
+    assert [(x.name, x.lsb, x.msb) for x in layout.fields] == [
+        ("raw", 0, 15),
+        ("struct_a", 0, 15),
+        ("parts", 0, 15),
+    ]
+    assert layout.element("parts", 1) == (4, 7)
+
+
+def test_utils_union_get_dispatch():
+    @packtype.package()
+    class PackageA:
+        pass
+
+    @PackageA.struct()
+    class StructA:
+        kind: Scalar[2]
+        data: Scalar[6]
+
+    @PackageA.union(tag="kind")
+    class UnionA:
+        raw: Scalar[8]
+        struct_a: StructA = (3, 1)
+
+    @PackageA.union()
+    class UnionB:
+        raw: Scalar[8]
+
+    assert utils.union.is_tagged(UnionA)
+    assert utils.union.get_dispatch(UnionA) == {3: "struct_a", 1: "struct_a"}
+    assert not utils.union.is_tagged(UnionB())
+    assert utils.union.get_dispatch(UnionB) == {}